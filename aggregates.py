@@ -0,0 +1,201 @@
+import argparse
+import json
+import sqlite3
+
+# --------------------
+# Materialized Pokémon price aggregates
+# --------------------
+# table -> (key columns, key expressions over the pick/event join, extra filter)
+# Keys are the player/pokemon dimension ids (see dimensions.py). The
+# *_normalized_cost columns are the same totals over the inflation-adjusted
+# prices (see budgets.refresh_draft_inflation).
+AGGREGATE_TABLES = {
+    "agg_pokemon": ("pokemon_id", "p.pokemon_id", "p.pokemon_id IS NOT NULL"),
+    "agg_pokemon_patch": ("patch, pokemon_id", "e.patch, p.pokemon_id",
+                          "e.patch IS NOT NULL AND p.pokemon_id IS NOT NULL"),
+    "agg_pokemon_player": ("pokemon_id, player_id", "p.pokemon_id, p.drafted_by_id",
+                           "p.pokemon_id IS NOT NULL AND p.drafted_by_id IS NOT NULL"),
+}
+
+
+def aggregate_select(table: str, draft_filter: str = "TRUE") -> str:
+    """
+    The SELECT that computes `table` for the picks matching `draft_filter`.
+    Also used as a view definition by backends that have no aggregate tables.
+    """
+    keys, key_exprs, extra_filter = AGGREGATE_TABLES[table]
+    columns = ", ".join(
+        f"{expr} AS {key}" for expr, key in zip(key_exprs.split(", "), keys.split(", "))
+    )
+    return f"""
+        SELECT {columns}, COUNT(*) AS times_drafted, SUM(p.cost) AS total_cost,
+               MIN(p.cost) AS min_cost, MAX(p.cost) AS max_cost,
+               SUM(p.normalized_cost) AS total_normalized_cost,
+               MIN(p.normalized_cost) AS min_normalized_cost, MAX(p.normalized_cost) AS max_normalized_cost
+        FROM draft_pokemon_v2 p
+        JOIN draft_event_v2 e ON p.draft_id = e.id
+        WHERE {draft_filter} AND {extra_filter}
+        GROUP BY {key_exprs}
+    """
+
+
+def _aggregate_sql(table: str, draft_filter: str) -> str:
+    keys = AGGREGATE_TABLES[table][0]
+    return f"""
+        INSERT INTO {table} ({keys}, times_drafted, total_cost, min_cost, max_cost,
+                             total_normalized_cost, min_normalized_cost, max_normalized_cost)
+        {aggregate_select(table, draft_filter)}
+        ON CONFLICT ({keys}) DO UPDATE SET
+            times_drafted = times_drafted + excluded.times_drafted,
+            total_cost = total_cost + excluded.total_cost,
+            min_cost = MIN(min_cost, excluded.min_cost),
+            max_cost = MAX(max_cost, excluded.max_cost),
+            total_normalized_cost = total_normalized_cost + excluded.total_normalized_cost,
+            min_normalized_cost = MIN(min_normalized_cost, excluded.min_normalized_cost),
+            max_normalized_cost = MAX(max_normalized_cost, excluded.max_normalized_cost)
+    """
+
+
+# --------------------
+# Patch comparison cube
+# --------------------
+# One row per (patch, Pokémon) in patch_pokemon_stats, with the cost
+# distribution (avg / median / p90), average draft_order and pick rate
+# (share of the patch's drafts in which the Pokémon was bought). Medians and
+# pick rates can't be summed like the totals above, so a new draft recomputes
+# every row of its patch instead; a patch is a few hundred drafts at most.
+CUBE_QUANTILES = {"median_cost": 0.5, "p90_cost": 0.9}
+
+
+def _quantile(q: float) -> str:
+    """
+    Linear interpolation between the two closest ranks (pandas' default),
+    over `cost_rank` (0-based, by cost) and `last` (= picks - 1) of each group.
+    """
+    pos = f"({q} * last)"
+    low = f"CAST({pos} AS INTEGER)"
+    return (f"SUM(CASE cost_rank WHEN {low} THEN cost * (1 - ({pos} - {low})) "
+            f"WHEN {low} + 1 THEN cost * ({pos} - {low}) ELSE 0 END)")
+
+
+def cube_select(draft_filter: str = "TRUE") -> str:
+    """
+    The SELECT that computes patch_pokemon_stats for the drafts matching
+    `draft_filter` (over draft_event_v2 e). The filter must select whole
+    patches, or pick rates come out wrong.
+    """
+    quantiles = ",\n               ".join(f"{_quantile(q)} AS {name}" for name, q in CUBE_QUANTILES.items())
+    return f"""
+        WITH patch_drafts AS (
+            SELECT e.patch, COUNT(*) AS drafts
+            FROM draft_event_v2 e
+            WHERE e.patch IS NOT NULL AND {draft_filter}
+            GROUP BY e.patch
+        ),
+        picks AS (
+            SELECT e.patch, p.pokemon_id, p.draft_id, p.cost, p.draft_order,
+                   ROW_NUMBER() OVER w - 1 AS cost_rank,
+                   COUNT(*) OVER (PARTITION BY e.patch, p.pokemon_id) - 1 AS last
+            FROM draft_pokemon_v2 p
+            JOIN draft_event_v2 e ON p.draft_id = e.id
+            WHERE e.patch IS NOT NULL AND p.pokemon_id IS NOT NULL AND p.cost IS NOT NULL
+              AND {draft_filter}
+            WINDOW w AS (PARTITION BY e.patch, p.pokemon_id ORDER BY p.cost)
+        )
+        SELECT c.patch, c.pokemon_id,
+               COUNT(*) AS times_drafted,
+               COUNT(DISTINCT c.draft_id) AS drafts_drafted,
+               d.drafts AS patch_drafts,
+               CAST(COUNT(DISTINCT c.draft_id) AS DOUBLE) / d.drafts AS pick_rate,
+               AVG(c.cost) AS avg_cost,
+               {quantiles},
+               AVG(c.draft_order) AS avg_draft_order
+        FROM picks c
+        JOIN patch_drafts d ON d.patch = c.patch
+        GROUP BY c.patch, c.pokemon_id
+    """
+
+
+CUBE_COLUMNS = ("patch, pokemon_id, times_drafted, drafts_drafted, patch_drafts, pick_rate, "
+                "avg_cost, median_cost, p90_cost, avg_draft_order")
+
+
+def refresh_patch_cube(conn: sqlite3.Connection, patches: list[str] | None = None):
+    """
+    Recomputes the cube rows of `patches` (every patch if None), on the
+    caller's transaction.
+    """
+    if patches is None:
+        conn.execute("DELETE FROM patch_pokemon_stats")
+        conn.execute(f"INSERT INTO patch_pokemon_stats ({CUBE_COLUMNS}) {cube_select()}")
+        return
+    if not patches:
+        return
+
+    selected = json.dumps(sorted(set(patches)))
+    conn.execute("DELETE FROM patch_pokemon_stats WHERE patch IN (SELECT value FROM json_each(?))",
+                 (selected,))
+    conn.execute(
+        f"INSERT INTO patch_pokemon_stats ({CUBE_COLUMNS}) "
+        f"{cube_select('e.patch IN (SELECT value FROM json_each(:patches))')}",
+        {"patches": selected}
+    )
+
+
+# --------------------
+# Maintenance
+# --------------------
+def update_aggregates(conn: sqlite3.Connection, draft_ids: list[int]):
+    """
+    Folds the picks of newly inserted drafts into the aggregate tables and
+    refreshes the cube rows of their patches. Runs on the caller's
+    transaction, so the totals commit (or roll back) together with the
+    drafts themselves.
+    """
+    if not draft_ids:
+        return
+
+    ids = f"[{','.join(str(int(i)) for i in draft_ids)}]"
+    for table in AGGREGATE_TABLES:
+        conn.execute(
+            _aggregate_sql(table, "p.draft_id IN (SELECT value FROM json_each(?))"),
+            (ids,)
+        )
+
+    patches = conn.execute(
+        "SELECT DISTINCT patch FROM draft_event_v2 "
+        "WHERE id IN (SELECT value FROM json_each(?)) AND patch IS NOT NULL",
+        (ids,)
+    ).fetchall()
+    refresh_patch_cube(conn, [row[0] for row in patches])
+
+
+def rebuild_aggregates(conn: sqlite3.Connection):
+    """
+    Recomputes every aggregate table and the patch cube from
+    draft_pokemon_v2, on the caller's transaction. Use after editing or
+    deleting picks, or merging two dimension rows.
+    """
+    for table in AGGREGATE_TABLES:
+        conn.execute(f"DELETE FROM {table}")
+        conn.execute(_aggregate_sql(table, "1"))
+    refresh_patch_cube(conn)
+
+
+if __name__ == "__main__":
+    from ingest import DB_PATH, connect
+
+    parser = argparse.ArgumentParser(description="Maintain the Pokémon price aggregate tables.")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute all aggregates from the pick table")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    args = parser.parse_args()
+
+    if not args.rebuild:
+        parser.error("nothing to do (pass --rebuild)")
+
+    conn = connect(args.db)
+    with conn:
+        rebuild_aggregates(conn)
+    conn.close()
+
+    print("Aggregates rebuilt.")
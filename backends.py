@@ -0,0 +1,359 @@
+import argparse
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+import queries
+from aggregates import AGGREGATE_TABLES, aggregate_select
+from data_access import DB_PATH, db_token, get_connection
+from data_access import clear_cache as sqlite_clear_cache
+from data_access import read_query as sqlite_read_query
+from instrumentation import record_query
+from snapshot import read_state, snapshot_current, snapshot_dir
+
+# ---------------- CONFIG ----------------
+# Engine for the analytic queries (queries.ANALYTIC_QUERIES); everything else
+# always runs on SQLite.
+#   "sqlite"  - the dashboard's read-only SQLite connections
+#   "duckdb"  - DuckDB with the SQLite file attached (sqlite extension)
+#   "parquet" - DuckDB over the Parquet snapshot (snapshot.py); falls back to
+#               SQLite while the snapshot is behind the database
+QUERY_BACKEND = "sqlite"
+# DuckDB worker threads (None = DuckDB's default, one per core)
+DUCKDB_THREADS = None
+# Max number of analytic results kept per DuckDB backend
+CACHE_MAX_ENTRIES = 64
+# ----------------------------------------
+
+ANALYTIC_SQL = {queries.NAMED_QUERIES[name][0] for name in queries.ANALYTIC_QUERIES}
+
+
+# --------------------
+# Backends
+# --------------------
+class SQLiteBackend:
+    name = "sqlite"
+
+    def __init__(self, db_path: str = DB_PATH):
+        self.db_path = db_path
+
+    def available(self) -> bool:
+        return True
+
+    def execute(self, sql: str, params=None) -> pd.DataFrame:
+        return pd.read_sql_query(sql, get_connection(self.db_path), params=params)
+
+    def read(self, sql: str, params=None) -> pd.DataFrame:
+        return sqlite_read_query(sql, params, self.db_path)
+
+
+class DuckDBBackend:
+    """
+    Runs queries on an in-process DuckDB database. Results are cached until
+    the database (or snapshot) changes, like data_access.read_query.
+    """
+    name = "duckdb"
+
+    def __init__(self, db_path: str = DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_token = None
+        self._cache = OrderedDict()
+        self._error = None
+
+    # ---------- connection ----------
+    def token(self):
+        return db_token(self.db_path)
+
+    def available(self) -> bool:
+        """
+        False if duckdb isn't installed or the connection can't be set up
+        (e.g. the sqlite extension can't be downloaded); callers then use
+        SQLite. A failed setup isn't retried.
+        """
+        if self._error is not None:
+            return False
+        try:
+            import duckdb
+        except ImportError as e:
+            self._error = e
+            return False
+
+        try:
+            with self._lock:
+                self._connection(self.token())
+        except duckdb.Error as e:
+            self._error = e
+            return False
+        return True
+
+    def _new_connection(self):
+        import duckdb
+
+        conn = duckdb.connect()
+        if DUCKDB_THREADS:
+            conn.execute(f"SET threads = {int(DUCKDB_THREADS)}")
+        return conn
+
+    def _open(self):
+        conn = self._new_connection()
+        conn.execute("INSTALL sqlite")
+        conn.execute("LOAD sqlite")
+        path = self.db_path.replace("'", "''")
+        conn.execute(f"ATTACH '{path}' AS drafts (TYPE sqlite, READ_ONLY)")
+        conn.execute("USE drafts")
+        return conn
+
+    def _connection(self, token):
+        if self._conn is None or self._conn_token != token:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = self._open()
+            self._conn_token = token
+        return self._conn
+
+    # ---------- queries ----------
+    def execute(self, sql: str, params=None) -> pd.DataFrame:
+        """
+        Runs `sql` without the cache (benchmarks use this directly).
+        """
+        with self._lock:
+            cursor = self._connection(self.token()).cursor()
+        try:
+            return cursor.execute(sql, list(params or ())).df()
+        finally:
+            cursor.close()
+
+    def read(self, sql: str, params=None) -> pd.DataFrame:
+        started = time.perf_counter()
+        token = self.token()
+        key = (sql, tuple(params or ()))
+
+        with self._lock:
+            if self._cache and next(iter(self._cache.values()))[0] != token:
+                self._cache.clear()
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                df = cached[1].copy()
+                record_query(sql, params, time.perf_counter() - started, len(df), "hit",
+                             self.name, self.db_path)
+                return df
+
+        df = self.execute(sql, params)
+
+        with self._lock:
+            self._cache[key] = (token, df)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        record_query(sql, params, time.perf_counter() - started, len(df), "miss", self.name, self.db_path)
+        return df.copy()
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+
+class SnapshotMissing(RuntimeError):
+    """The Parquet snapshot was removed or replaced by an older format."""
+
+
+class ParquetBackend(DuckDBBackend):
+    """
+    DuckDB over the Parquet snapshot. The v2 tables are views over the
+    snapshot files, and the player/Pokémon dimensions and aggregate tables
+    are rebuilt in memory with the same names and columns, so the SQLite
+    queries run unchanged.
+    """
+    name = "parquet"
+
+    def token(self):
+        state = read_state(snapshot_dir(self.db_path)) or {}
+        return (db_token(self.db_path), state.get("coverage"), state.get("datasets"))
+
+    def available(self) -> bool:
+        """
+        Also False while the snapshot is missing or behind the database.
+        Unlike a failed DuckDB setup, that is checked again on every call.
+        """
+        if not snapshot_current(self.db_path):
+            return False
+        try:
+            return super().available()
+        except SnapshotMissing:
+            return False
+
+    def _open(self):
+        directory = snapshot_dir(self.db_path)
+        state = read_state(directory)
+        if state is None:
+            raise SnapshotMissing(directory)
+        conn = self._new_connection()
+
+        def files(dataset: str) -> str:
+            paths = [os.path.join(directory, f["path"]).replace("'", "''")
+                     for f in state["datasets"][dataset]]
+            return ", ".join(f"'{path}'" for path in paths)
+
+        conn.execute(f"""
+            CREATE VIEW draft_event_v2 AS
+            SELECT draft_id AS id, external_draft_id, date_time, total_pokemon_sold, patch
+            FROM read_parquet([{files("drafts")}])
+        """)
+        conn.execute(f"""
+            CREATE VIEW draft_pokemon_v2 AS
+            SELECT id, draft_id, draft_order, cost, normalized_cost, pokemon_id, drafted_by_id
+            FROM read_parquet([{files("picks")}])
+        """)
+        conn.execute(f"""
+            CREATE VIEW draft_players_v2 AS
+            SELECT id, draft_id, starting_money, remaining_money, player_id
+            FROM read_parquet([{files("players")}])
+        """)
+
+        # The dimensions are small; copy them over from SQLite
+        for table, sql, id_column in (("player", queries.PLAYER_NAMES, "player_id"),
+                                      ("pokemon", queries.POKEMON_NAMES, "pokemon_id")):
+            names = sqlite_read_query(sql, db_path=self.db_path)
+            conn.register(f"{table}_names", names)
+            conn.execute(f"CREATE TABLE {table} AS SELECT {id_column} AS id, name FROM {table}_names")
+            conn.unregister(f"{table}_names")
+
+        # Computed once per snapshot state, like the materialized tables in SQLite
+        for table in AGGREGATE_TABLES:
+            conn.execute(f"CREATE TABLE {table} AS {aggregate_select(table)}")
+
+        return conn
+
+
+BACKENDS = {
+    "sqlite": SQLiteBackend,
+    "duckdb": DuckDBBackend,
+    "parquet": ParquetBackend,
+}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(name: str = QUERY_BACKEND, db_path: str = DB_PATH):
+    """
+    The shared backend instance for (name, db_path).
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown query backend: {name}")
+    with _backends_lock:
+        backend = _backends.get((name, db_path))
+        if backend is None:
+            backend = _backends[(name, db_path)] = BACKENDS[name](db_path)
+    return backend
+
+
+def clear_cache():
+    """
+    Drops every cached result (SQLite and DuckDB), e.g. between benchmark runs.
+    """
+    sqlite_clear_cache()
+    with _backends_lock:
+        backends = list(_backends.values())
+    for backend in backends:
+        if hasattr(backend, "clear_cache"):
+            backend.clear_cache()
+
+
+def read_query(sql: str, params=None, db_path: str = DB_PATH) -> pd.DataFrame:
+    """
+    Drop-in for data_access.read_query: analytic queries go to the
+    configured QUERY_BACKEND (when it can serve them), everything else to
+    SQLite.
+    """
+    if QUERY_BACKEND != "sqlite" and sql in ANALYTIC_SQL:
+        backend = get_backend(QUERY_BACKEND, db_path)
+        if backend.available():
+            try:
+                return backend.read(sql, params)
+            except SnapshotMissing:
+                # Removed since available() checked it
+                pass
+    return sqlite_read_query(sql, params, db_path)
+
+
+# --------------------
+# Parity check
+# --------------------
+def _normalized(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Row order is only defined up to ties (and not at all without ORDER BY),
+    so frames are compared sorted on every column.
+    """
+    df = df.astype({c: "float64" for c in df.columns if pd.api.types.is_float_dtype(df[c])})
+    return df.sort_values(list(df.columns), kind="stable").reset_index(drop=True)
+
+
+def parity_cases(db_path: str = DB_PATH) -> list[tuple[str, tuple]]:
+    """
+    Every analytic query with its sample params, and the per-patch queries
+    once for every patch in the database.
+    """
+    patches = sqlite_read_query(queries.PATCHES, db_path=db_path)["patch"].dropna().tolist()
+    cases = []
+    for name in queries.ANALYTIC_QUERIES:
+        _, sample = queries.NAMED_QUERIES[name]
+        if sample:
+            cases += [(name, (patch,)) for patch in patches]
+        else:
+            cases.append((name, ()))
+    return cases
+
+
+def check_parity(backend_names, db_path: str = DB_PATH) -> list[str]:
+    """
+    Runs every parity case on SQLite and on each of `backend_names`, and
+    returns a description of every frame that differs (empty = identical).
+    Floats are compared to 1e-9 relative, since engines sum in different
+    orders.
+    """
+    reference = SQLiteBackend(db_path)
+    problems = []
+
+    for backend_name in backend_names:
+        backend = BACKENDS[backend_name](db_path)
+        if not backend.available():
+            reason = getattr(backend, "_error", None) or "snapshot missing or behind the database"
+            problems.append(f"{backend_name}: not available ({str(reason).splitlines()[0]})")
+            continue
+
+        for name, params in parity_cases(db_path):
+            sql = queries.NAMED_QUERIES[name][0]
+            expected = _normalized(reference.read(sql, params))
+            actual = _normalized(backend.execute(sql, params))
+            try:
+                pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9)
+            except AssertionError as e:
+                problems.append(f"{backend_name} {name}{params}: {str(e).splitlines()[0]}")
+
+    return problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that the query backends return identical frames.")
+    parser.add_argument("backends", nargs="*", metavar="backend",
+                        help="Backends to compare with SQLite (default: duckdb parquet)")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    args = parser.parse_args()
+
+    args.backends = args.backends or ["duckdb", "parquet"]
+    for name in args.backends:
+        if name not in BACKENDS or name == "sqlite":
+            parser.error(f"unknown backend: {name}")
+
+    problems = check_parity(args.backends, args.db)
+    for problem in problems:
+        print(problem)
+    cases = len(parity_cases(args.db))
+    print(f"{len(args.backends)} backend(s) x {cases} queries: {len(problems)} difference(s)")
+    raise SystemExit(1 if problems else 0)
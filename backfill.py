@@ -0,0 +1,142 @@
+import argparse
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from itertools import islice
+
+from ingest import (
+    BATCH_FILES,
+    DB_PATH,
+    changed_files,
+    csv_files,
+    load_source,
+    read_group2_header,
+    read_group3_header,
+    read_raw_csv_date,
+    seed_manifest,
+    write_in_batches,
+)
+
+# ---------------- CONFIG ----------------
+# Parsed files allowed in flight per worker before the writer catches up
+IN_FLIGHT_PER_WORKER = 4
+# ----------------------------------------
+
+
+# ---------- HEADER DATES ----------
+def group3_date(path: str) -> datetime | None:
+    return read_group3_header(path)[2]
+
+
+def group2_date(path: str) -> datetime | None:
+    return read_group2_header(path)[0]
+
+
+def raw_date(path: str) -> datetime | None:
+    return read_raw_csv_date(path)
+
+
+# format -> header date reader
+DATE_READERS = {
+    "group3": group3_date,
+    "group2": group2_date,
+    "raw": raw_date,
+}
+
+
+def _dated(read_date, path: str):
+    try:
+        return read_date(path), path
+    except (ValueError, IndexError, StopIteration):
+        # Undated files sort last; the full parser reports the real problem
+        return None, path
+
+
+def _date_order(item) -> tuple:
+    date_time, path = item
+    return (date_time is None, date_time or datetime.min, path)
+
+
+# ---------- ORDERED PARALLEL MAP ----------
+def ordered_map(pool: ProcessPoolExecutor, fn, items: list, max_in_flight: int):
+    """
+    Like pool.map(), but only keeps `max_in_flight` tasks queued so parsed
+    files stream to the writer instead of piling up in memory.
+    """
+    items = iter(items)
+    pending = deque(pool.submit(fn, item) for item in islice(items, max_in_flight))
+
+    while pending:
+        result = pending.popleft().result()
+        for item in islice(items, 1):
+            pending.append(pool.submit(fn, item))
+        yield result
+
+
+# ---------- BACKFILL ----------
+def backfill(csv_dir: str, fmt: str = "group3", workers: int | None = None,
+             db_path: str = DB_PATH, batch_files: int = BATCH_FILES, verbose: bool = True,
+             force: bool = False):
+    """
+    Parses every new or changed CSV in `csv_dir` across a process pool and
+    streams the parsed files, oldest draft first, to a single writer that
+    commits every `batch_files` files.
+    """
+    read_date = DATE_READERS[fmt]
+    workers = workers or os.cpu_count() or 1
+    all_paths = csv_files(csv_dir)
+    paths = all_paths if force else changed_files(all_paths, fmt, db_path)
+
+    if workers <= 1:
+        ordered = sorted((_dated(read_date, p) for p in paths), key=_date_order)
+        sources = (load_source(fmt, path) for _, path in ordered)
+        stats = write_in_batches(sources, fmt, db_path, batch_files, verbose)
+        stats.unchanged = len(all_paths) - len(paths)
+        return stats
+
+    chunksize = max(1, len(paths) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # ---- pass 1: header scan only, to order drafts by date ----
+        dated = pool.map(_dated, [read_date] * len(paths), paths, chunksize=chunksize)
+        ordered = [path for _, path in sorted(dated, key=_date_order)]
+
+        # ---- pass 2: full parse, results consumed in date order ----
+        sources = ordered_map(pool, partial(load_source, fmt), ordered, workers * IN_FLIGHT_PER_WORKER)
+        stats = write_in_batches(sources, fmt, db_path, batch_files, verbose)
+
+    stats.unchanged = len(all_paths) - len(paths)
+    return stats
+
+
+# ---------- RUN ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-load a folder of draft CSVs.")
+    parser.add_argument("csv_dir", help="Folder of CSV files")
+    parser.add_argument("--format", choices=sorted(DATE_READERS), default="group3",
+                        help="group3 = bot CSVs (v2 tables), group2 = older bot CSVs (v1 tables), "
+                             "raw = timestamped website exports")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Parser processes (default: one per CPU)")
+    parser.add_argument("--batch-files", type=int, default=BATCH_FILES,
+                        help="Files per write transaction")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    parser.add_argument("--quiet", action="store_true", help="Only print the final summary")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-read files even if the ingest manifest says they are unchanged")
+    parser.add_argument("--seed-manifest", action="store_true",
+                        help="Record every file as already ingested without loading it "
+                             "(for folders loaded before the manifest existed)")
+    args = parser.parse_args()
+
+    if args.seed_manifest:
+        count = seed_manifest(csv_files(args.csv_dir), args.format, args.db)
+        print(f"Recorded {count} files in ingest_manifest")
+        raise SystemExit(0)
+
+    stats = backfill(args.csv_dir, args.format, args.workers, args.db, args.batch_files,
+                     verbose=not args.quiet, force=args.force)
+    if args.quiet:
+        print(stats.summary())
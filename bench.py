@@ -0,0 +1,453 @@
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+
+import backends
+import queries
+import signatures
+from backends import read_query
+from data_access import close_all, read_scalar
+from ingest import csv_files, ingest_group3_files
+from migrate import migrate
+from snapshot import parquet_available, refresh_snapshot, snapshot_dir
+from streaks import draft_streaks
+from synthetic_drafts import generate_drafts, write_csv, write_db
+from table_browser import PageRequest, count_rows, fetch_page
+from table_browser import write_csv as export_csv
+
+# ---------------- CONFIG ----------------
+# Fixture databases, in drafts (~65 picks each); built once per size and seed
+# with synthetic_drafts.py and reused by later runs
+FIXTURE_DRAFTS = (500, 5_000)
+FIXTURE_SEED = 7
+WORKDIR = "bench_fixtures"
+# Timed runs per case (after one untimed warm-up run)
+REPEAT = 10
+# New bot CSVs loaded into a copy of each fixture by the ingest case
+INGEST_DRAFTS = 200
+
+# compare: a case regressed if its p50 (or peak memory) grew by more than
+# REGRESSION_THRESHOLD and by more than the noise floor
+REGRESSION_THRESHOLD = 0.20
+NOISE_FLOOR_MS = 2.0
+NOISE_FLOOR_MB = 1.0
+# ----------------------------------------
+
+RESULTS_VERSION = 1
+
+
+# --------------------
+# Cases
+# --------------------
+@dataclass
+class Case:
+    """
+    One dashboard workload. `run(fixture)` is timed; `setup(fixture)`, if
+    given, runs untimed before every run and its result is passed to `run`
+    instead.
+    """
+    name: str
+    run: object
+    setup: object = None
+
+
+@dataclass
+class Fixture:
+    drafts: int
+    seed: int
+    db_path: str
+    patch: str
+    other_patch: str
+    draft_id: int
+    ingest_csvs: list
+
+    @property
+    def name(self) -> str:
+        return f"drafts_{self.drafts}"
+
+
+def _appendix_request() -> PageRequest:
+    return PageRequest("draft_pokemon_v2", sort_column="cost", descending=True,
+                       filters={"pokemon": "a"})
+
+
+def _signature_matrix(fixture: Fixture):
+    return signatures.signature_matrix(fixture.db_path)
+
+
+def _streaks(fixture: Fixture):
+    return draft_streaks(read_query(queries.PLAYER_DRAFT_DATES, db_path=fixture.db_path))
+
+
+def _appendix_export(fixture: Fixture):
+    return export_csv(PageRequest("draft_pokemon_v2"), io.StringIO(), db_path=fixture.db_path)
+
+
+def _ingest_target(fixture: Fixture) -> tuple[str, list]:
+    """
+    A fresh copy of the fixture (and its snapshot) for the ingest case to
+    write into, so every run ingests the same files into the same state.
+    """
+    target = os.path.join(os.path.dirname(fixture.db_path), f"ingest_{fixture.name}.db")
+    close_all()
+    for path in (target, f"{target}-wal", f"{target}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+    shutil.rmtree(snapshot_dir(target), ignore_errors=True)
+
+    src = sqlite3.connect(fixture.db_path)
+    dst = sqlite3.connect(target)
+    src.backup(dst)
+    src.close()
+    dst.close()
+    if os.path.isdir(snapshot_dir(fixture.db_path)):
+        shutil.copytree(snapshot_dir(fixture.db_path), snapshot_dir(target))
+    return target, fixture.ingest_csvs
+
+
+def _ingest(target: tuple[str, list]):
+    db_path, paths = target
+    return ingest_group3_files(paths, db_path, verbose=False).drafts
+
+
+def _query(sql: str, params=lambda fixture: ()):
+    return lambda fixture: read_query(sql, params(fixture), fixture.db_path)
+
+
+CASES = [
+    Case("total_players", lambda f: read_scalar(queries.TOTAL_PLAYERS, db_path=f.db_path)),
+    Case("total_pokemon_drafted", lambda f: read_scalar(queries.TOTAL_POKEMON_DRAFTED, db_path=f.db_path)),
+    Case("drafts_per_day", _query(queries.DRAFTS_PER_DAY)),
+    Case("most_drafts_in_a_day", _query(queries.MOST_DRAFTS_IN_A_DAY)),
+    Case("streaks", _streaks),
+    Case("patches", _query(queries.PATCHES)),
+    Case("picks_by_era", _query(queries.PICKS_BY_ERA)),
+    Case("all_time_pokemon", _query(queries.ALL_TIME_POKEMON)),
+    Case("avg_cost_by_pokemon", _query(queries.AVG_COST_BY_POKEMON)),
+    Case("avg_cost_by_patch", _query(queries.AVG_COST_BY_POKEMON_FOR_PATCH, lambda f: (f.patch,))),
+    Case("price_summary", _query(queries.POKEMON_PRICE_SUMMARY)),
+    Case("price_summary_for_patch", _query(queries.POKEMON_PRICE_SUMMARY_FOR_PATCH, lambda f: (f.patch,))),
+    Case("patch_comparison", _query(queries.PATCH_COMPARISON, lambda f: (f.other_patch, f.patch))),
+    Case("draft_ids", _query(queries.DRAFT_IDS)),
+    Case("draft_picks", _query(queries.DRAFT_PICKS, lambda f: (f.draft_id,))),
+    Case("top3_recent_drafts", _query(queries.TOP3_PICKS_RECENT_DRAFTS, lambda f: (10,))),
+    Case("signature_picks", lambda f: signatures.signature_picks(_signature_matrix(f))),
+    Case("signature_owners", lambda f: signatures.signature_owners(_signature_matrix(f))),
+    Case("player_vs_global", _query(queries.PLAYER_VS_GLOBAL)),
+    Case("budget_premium", _query(queries.BUDGET_PREMIUM)),
+    Case("appendix_page", lambda f: fetch_page(_appendix_request(), db_path=f.db_path)[0]),
+    Case("appendix_count", lambda f: count_rows(_appendix_request(), db_path=f.db_path)),
+    Case("appendix_export_csv", _appendix_export),
+    Case("ingest_group3", _ingest, setup=_ingest_target),
+]
+CASE_NAMES = [case.name for case in CASES]
+
+
+# --------------------
+# Fixtures
+# --------------------
+def build_fixture(drafts: int, seed: int = FIXTURE_SEED, workdir: str = WORKDIR,
+                  ingest_drafts: int = INGEST_DRAFTS, rebuild: bool = False) -> Fixture:
+    """
+    The fixture database with `drafts` synthetic drafts, plus bot CSVs for
+    `ingest_drafts` later drafts of the same history. Existing files are
+    reused (the generator is deterministic), after bringing the database
+    up to the latest migration.
+    """
+    db_path = os.path.join(workdir, f"fixture_{drafts}_s{seed}.db")
+    csv_dir = os.path.join(workdir, f"ingest_{drafts}_s{seed}_{ingest_drafts}")
+
+    if rebuild:
+        close_all()
+        for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+        shutil.rmtree(snapshot_dir(db_path), ignore_errors=True)
+        shutil.rmtree(csv_dir, ignore_errors=True)
+
+    if not os.path.exists(db_path) or not os.path.isdir(csv_dir):
+        os.makedirs(csv_dir, exist_ok=True)
+        history = generate_drafts(drafts + ingest_drafts, seed)
+        write_db((next(history) for _ in range(drafts)), db_path)
+        for draft in history:
+            write_csv(draft, csv_dir)
+    else:
+        conn = sqlite3.connect(db_path)
+        try:
+            migrate(conn, verbose=False)
+        finally:
+            conn.close()
+        # A new schema version invalidates the snapshot; rebuild it here
+        # rather than inside the first timed ingest run
+        if parquet_available():
+            refresh_snapshot(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        # The two busiest patches
+        patch, other_patch = [row[0] for row in conn.execute(
+            "SELECT patch FROM draft_event_v2 GROUP BY patch ORDER BY COUNT(*) DESC, patch LIMIT 2"
+        )]
+        draft_id = conn.execute("SELECT MAX(id) FROM draft_event_v2").fetchone()[0]
+    finally:
+        conn.close()
+
+    return Fixture(drafts, seed, db_path, patch, other_patch, draft_id, csv_files(csv_dir))
+
+
+def fixture_stats(fixture: Fixture) -> dict:
+    conn = sqlite3.connect(fixture.db_path)
+    try:
+        return {
+            "drafts": conn.execute("SELECT COUNT(*) FROM draft_event_v2").fetchone()[0],
+            "picks": conn.execute("SELECT COUNT(*) FROM draft_pokemon_v2").fetchone()[0],
+            "seed": fixture.seed,
+            "ingest_files": len(fixture.ingest_csvs),
+        }
+    finally:
+        conn.close()
+
+
+# --------------------
+# Measuring
+# --------------------
+def _clear_caches():
+    backends.clear_cache()
+    signatures.clear_cache()
+
+
+def _once(case: Case, fixture: Fixture):
+    """
+    One cold-cache run: (seconds, result). Query caches are dropped
+    first so every run does the real work; connections and the OS page
+    cache stay warm, as in a long-running dashboard.
+    """
+    arg = case.setup(fixture) if case.setup else fixture
+    _clear_caches()
+    started = time.perf_counter()
+    result = case.run(arg)
+    return time.perf_counter() - started, result
+
+
+def _rows(result) -> int | None:
+    if hasattr(result, "__len__") and not isinstance(result, str):
+        return len(result)
+    if isinstance(result, (int, np.integer)):
+        return int(result)
+    return None
+
+
+def measure(case: Case, fixture: Fixture, repeat: int = REPEAT) -> dict:
+    """
+    p50/p95/min/max latency over `repeat` timed runs, and the peak Python
+    heap (tracemalloc, which also sees numpy/pandas buffers) of one more
+    run. Memory is traced separately because tracing slows everything down.
+    """
+    _, result = _once(case, fixture)  # warm-up
+    runs = [_once(case, fixture)[0] for _ in range(repeat)]
+
+    arg = case.setup(fixture) if case.setup else fixture
+    _clear_caches()
+    tracemalloc.start()
+    try:
+        case.run(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    ms = np.array(runs) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "min_ms": round(float(ms.min()), 3),
+        "max_ms": round(float(ms.max()), 3),
+        "runs": repeat,
+        "peak_mb": round(peak / 2**20, 3),
+        "rows": _rows(result),
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{revision}-dirty" if dirty else revision
+
+
+def run_benchmarks(fixture_drafts=FIXTURE_DRAFTS, case_names=None, repeat: int = REPEAT,
+                   seed: int = FIXTURE_SEED, workdir: str = WORKDIR,
+                   ingest_drafts: int = INGEST_DRAFTS, rebuild: bool = False,
+                   verbose: bool = True) -> dict:
+    """
+    Runs every case (or `case_names`) against each fixture size and
+    returns the results document that --out writes as JSON.
+    """
+    cases = [case for case in CASES if case_names is None or case.name in case_names]
+    os.makedirs(workdir, exist_ok=True)
+
+    results = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "query_backend": backends.QUERY_BACKEND,
+        "repeat": repeat,
+        "fixtures": {},
+        "cases": {},
+    }
+
+    for drafts in fixture_drafts:
+        started = time.perf_counter()
+        fixture = build_fixture(drafts, seed, workdir, ingest_drafts, rebuild)
+        stats = fixture_stats(fixture)
+        results["fixtures"][fixture.name] = stats
+        results["cases"][fixture.name] = {}
+        if verbose:
+            print(f"{fixture.name}: {stats['picks']:,} picks "
+                  f"(ready in {time.perf_counter() - started:.1f}s)")
+
+        for case in cases:
+            measured = measure(case, fixture, repeat)
+            results["cases"][fixture.name][case.name] = measured
+            if verbose:
+                print(f"  {case.name:28}{measured['p50_ms']:10.1f}ms p50{measured['p95_ms']:10.1f}ms p95"
+                      f"{measured['peak_mb']:10.1f}MB peak")
+
+    return results
+
+
+# --------------------
+# Comparing runs
+# --------------------
+def compare(base: dict, new: dict, threshold: float = REGRESSION_THRESHOLD,
+            noise_ms: float = NOISE_FLOOR_MS, noise_mb: float = NOISE_FLOOR_MB) -> list[dict]:
+    """
+    One row per (fixture, case) present in both runs, with the p50/p95 and
+    peak memory ratios new/base and a status: "regression" if p50 or peak
+    memory grew by more than `threshold` (and more than the noise floor),
+    "improvement" for the mirror case, "ok" otherwise.
+    """
+    rows = []
+    for fixture, cases in new["cases"].items():
+        for name, after in cases.items():
+            before = base["cases"].get(fixture, {}).get(name)
+            if before is None:
+                continue
+
+            def changed(key, floor):
+                delta = after[key] - before[key]
+                if abs(delta) <= floor or before[key] == 0:
+                    return 0
+                ratio = after[key] / before[key]
+                return 1 if ratio > 1 + threshold else -1 if ratio < 1 / (1 + threshold) else 0
+
+            time_change = changed("p50_ms", noise_ms)
+            memory_change = changed("peak_mb", noise_mb)
+            if time_change > 0 or memory_change > 0:
+                status = "regression"
+            elif time_change < 0 or memory_change < 0:
+                status = "improvement"
+            else:
+                status = "ok"
+
+            rows.append({
+                "fixture": fixture,
+                "case": name,
+                "status": status,
+                **{f"{key}_ratio": (after[key] / before[key] if before[key] else None)
+                   for key in ("p50_ms", "p95_ms", "peak_mb")},
+                "base": before,
+                "new": after,
+            })
+    return rows
+
+
+def print_comparison(rows: list[dict]):
+    def ratio(value):
+        return f"{value:7.2f}x" if value is not None else "      -"
+
+    print(f"{'fixture':14}{'case':28}{'p50 base':>11}{'p50 new':>11}{'p50':>9}{'p95':>9}{'peak':>9}")
+    for row in rows:
+        flag = {"regression": "  REGRESSION", "improvement": "  faster/smaller"}.get(row["status"], "")
+        print(f"{row['fixture']:14}{row['case']:28}"
+              f"{row['base']['p50_ms']:9.1f}ms{row['new']['p50_ms']:9.1f}ms"
+              f"{ratio(row['p50_ms_ratio'])}{ratio(row['p95_ms_ratio'])}{ratio(row['peak_mb_ratio'])}{flag}")
+
+    regressions = sum(row["status"] == "regression" for row in rows)
+    print(f"{len(rows)} case(s) compared: {regressions} regression(s)")
+
+
+def load_results(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise SystemExit(f"{path}: unsupported results version {results.get('version')}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard's queries and the CSV ingest.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run the benchmarks and write the results as JSON")
+    run_parser.add_argument("--drafts", type=int, nargs="+", default=list(FIXTURE_DRAFTS),
+                            help="Fixture sizes, in drafts (~65 picks each)")
+    run_parser.add_argument("--cases", nargs="+", default=None, metavar="CASE",
+                            help=f"Cases to run (default: all of {', '.join(CASE_NAMES)})")
+    run_parser.add_argument("--repeat", type=int, default=REPEAT, help="Timed runs per case")
+    run_parser.add_argument("--seed", type=int, default=FIXTURE_SEED)
+    run_parser.add_argument("--ingest-drafts", type=int, default=INGEST_DRAFTS,
+                            help="CSV files loaded by the ingest case")
+    run_parser.add_argument("--backend", choices=sorted(backends.BACKENDS), default=backends.QUERY_BACKEND,
+                            help="QUERY_BACKEND for the analytic queries")
+    run_parser.add_argument("--workdir", default=WORKDIR, help="Where the fixture databases are kept")
+    run_parser.add_argument("--rebuild", action="store_true", help="Regenerate the fixtures")
+    run_parser.add_argument("--out", default=None, help="Write the results to this JSON file")
+
+    compare_parser = sub.add_parser("compare", help="Flag regressions between two result files")
+    compare_parser.add_argument("base", help="Results of the reference run")
+    compare_parser.add_argument("new", help="Results of the run to check")
+    compare_parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                                help="Allowed relative growth of p50 and peak memory")
+    compare_parser.add_argument("--noise-ms", type=float, default=NOISE_FLOOR_MS)
+    compare_parser.add_argument("--noise-mb", type=float, default=NOISE_FLOOR_MB)
+    compare_parser.add_argument("--out", default=None, help="Write the comparison to this JSON file")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        unknown = set(args.cases or ()) - set(CASE_NAMES)
+        if unknown:
+            parser.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+
+        backends.QUERY_BACKEND = args.backend
+        results = run_benchmarks(args.drafts, args.cases, args.repeat, args.seed, args.workdir,
+                                 args.ingest_drafts, args.rebuild)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"Wrote {args.out}")
+    else:
+        rows = compare(load_results(args.base), load_results(args.new),
+                       args.threshold, args.noise_ms, args.noise_mb)
+        print_comparison(rows)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(rows, f, indent=2)
+        raise SystemExit(1 if any(row["status"] == "regression" for row in rows) else 0)
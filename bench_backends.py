@@ -0,0 +1,145 @@
+import argparse
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+
+import queries
+from aggregates import rebuild_aggregates
+from backends import BACKENDS, check_parity
+from data_access import DB_PATH
+from migrate import upgrade
+from snapshot import refresh_snapshot
+
+# ---------------- CONFIG ----------------
+SCALES = (10, 100)
+REPEAT = 5
+# ----------------------------------------
+
+
+# ---------- SYNTHETIC SCALE ----------
+def _columns(conn: sqlite3.Connection, table: str) -> list[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})") if row[1] != "id"]
+
+
+def scaled_copy(db_path: str, out_path: str, factor: int):
+    """
+    Copies `db_path` to `out_path` with every v2 draft repeated `factor`
+    times (new draft ids and external ids, same players, Pokémon and prices),
+    then rebuilds the aggregates and the Parquet snapshot.
+    """
+    src = sqlite3.connect(db_path)
+    dst = sqlite3.connect(out_path)
+    src.backup(dst)
+    src.close()
+    # The committed database is at its original schema
+    upgrade(dst)
+
+    span = dst.execute("SELECT COALESCE(MAX(id), 0) FROM draft_event_v2").fetchone()[0]
+    events = _columns(dst, "draft_event_v2")
+    players = _columns(dst, "draft_players_v2")
+    picks = _columns(dst, "draft_pokemon_v2")
+
+    def copied(columns, offset):
+        exprs = {"draft_id": f"draft_id + {offset}",
+                 "external_draft_id": f"external_draft_id || '-{offset}'"}
+        return ", ".join(exprs.get(c, c) for c in columns)
+
+    with dst:
+        for copy in range(1, factor):
+            offset = copy * span
+            dst.execute(f"""
+                INSERT INTO draft_event_v2 (id, {", ".join(events)})
+                SELECT id + {offset}, {copied(events, offset)}
+                FROM draft_event_v2 WHERE id <= {span}
+            """)
+            for table, columns in (("draft_players_v2", players), ("draft_pokemon_v2", picks)):
+                dst.execute(f"""
+                    INSERT INTO {table} ({", ".join(columns)})
+                    SELECT {copied(columns, offset)}
+                    FROM {table} WHERE draft_id <= {span}
+                """)
+        rebuild_aggregates(dst)
+    dst.execute("ANALYZE")
+    dst.close()
+
+    refresh_snapshot(out_path, rebuild=True)
+
+
+# ---------- TIMING ----------
+def time_backend(backend, repeat: int = REPEAT) -> dict:
+    """
+    Median wall time (seconds) of each analytic query, uncached.
+    """
+    results = {}
+    for name in queries.ANALYTIC_QUERIES:
+        sql, params = queries.NAMED_QUERIES[name]
+        backend.execute(sql, params)  # warm up (connection, page cache)
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            backend.execute(sql, params)
+            runs.append(time.perf_counter() - start)
+        results[name] = statistics.median(runs)
+    return results
+
+
+def bench_scale(db_path: str, backend_names: list[str], repeat: int = REPEAT) -> dict:
+    timings = {}
+    for name in backend_names:
+        backend = BACKENDS[name](db_path)
+        if not backend.available():
+            print(f"  {name}: not available, skipped")
+            continue
+        timings[name] = time_backend(backend, repeat)
+    return timings
+
+
+def print_table(timings: dict):
+    names = list(timings)
+    print(f"  {'query':44}" + "".join(f"{n:>12}" for n in names) + "  speedup vs sqlite")
+    for query in queries.ANALYTIC_QUERIES:
+        row = f"  {query:44}"
+        for name in names:
+            seconds = timings[name][query]
+            row += f"{seconds * 1000:10.1f}ms"
+        if "sqlite" in timings:
+            row += "".join(f"  {name} {timings['sqlite'][query] / timings[name][query]:.1f}x"
+                           for name in names if name != "sqlite")
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the query backends on scaled copies of the database.")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES),
+                        help="Copies of the draft history per benchmark database")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=sorted(BACKENDS))
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="Timed runs per query (median is reported)")
+    parser.add_argument("--workdir", default=None, help="Where to build the scaled databases (default: a temp dir)")
+    parser.add_argument("--skip-parity", action="store_true", help="Don't compare results before timing")
+    parser.add_argument("--db", default=DB_PATH, help="Source SQLite database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or tmp
+        os.makedirs(workdir, exist_ok=True)
+
+        for scale in args.scales:
+            path = os.path.join(workdir, f"bench_x{scale}.db")
+            if os.path.exists(path):
+                os.remove(path)
+
+            started = time.perf_counter()
+            scaled_copy(args.db, path, scale)
+            picks = sqlite3.connect(path).execute("SELECT COUNT(*) FROM draft_pokemon_v2").fetchone()[0]
+            print(f"x{scale}: {picks:,} picks (built in {time.perf_counter() - started:.1f}s)")
+
+            if not args.skip_parity:
+                others = [b for b in args.backends if b != "sqlite"]
+                problems = check_parity(others, path)
+                print(f"  parity: {'identical' if not problems else f'{len(problems)} difference(s)'}")
+                for problem in problems:
+                    print(f"    {problem}")
+
+            print_table(bench_scale(path, args.backends, args.repeat))
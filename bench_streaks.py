@@ -0,0 +1,87 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from streaks import draft_streaks
+
+# ---------------- CONFIG ----------------
+ROWS = 1_000_000
+PLAYERS = 2_000
+SEED = 7
+# ----------------------------------------
+
+
+def legacy_longest_streak(dates):
+    """The dashboard's original per-player loop, kept for comparison."""
+    dates = pd.to_datetime(dates).sort_values()
+    streaks = []
+    current_streak = 1
+    for i in range(1, len(dates)):
+        if (dates.iloc[i] - dates.iloc[i - 1]).days == 1:
+            current_streak += 1
+        else:
+            streaks.append(current_streak)
+            current_streak = 1
+    streaks.append(current_streak)
+    return max(streaks)
+
+
+def legacy_streaks(draft_dates: pd.DataFrame) -> pd.DataFrame:
+    return (
+        draft_dates.groupby("player_name")["draft_date"]
+        .apply(legacy_longest_streak)
+        .reset_index(name="longest_streak")
+        .sort_values("longest_streak", ascending=False)
+    )
+
+
+def synthetic_draft_dates(rows: int = ROWS, players: int = PLAYERS, seed: int = SEED) -> pd.DataFrame:
+    """
+    Distinct (player_name, draft_date) rows shaped like PLAYER_DRAFT_DATES.
+    Each player drafts on a random ~70% of the days in their window, which
+    gives a realistic mix of short and long streaks.
+    """
+    rng = np.random.default_rng(seed)
+    days_per_player = max(1, int(rows / players / 0.7))
+    active = rng.random((players, days_per_player)) < 0.7
+    player_idx, day_idx = np.nonzero(active)
+    player_idx, day_idx = player_idx[:rows], day_idx[:rows]
+
+    dates = np.datetime64("2020-01-01") + day_idx.astype("timedelta64[D]")
+    frame = pd.DataFrame({
+        "player_name": pd.Index([f"player_{i:05d}" for i in range(players)])[player_idx],
+        "draft_date": pd.DatetimeIndex(dates).strftime("%Y-%m-%d"),
+    })
+    return frame.sort_values(["player_name", "draft_date"], ignore_index=True)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized streak computation against the old loop.")
+    parser.add_argument("--rows", type=int, default=ROWS, help="Rows in the synthetic dates table")
+    parser.add_argument("--players", type=int, default=PLAYERS, help="Distinct players")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the vectorized version")
+    args = parser.parse_args()
+
+    draft_dates = synthetic_draft_dates(args.rows, args.players, args.seed)
+    print(f"{len(draft_dates):,} rows, {draft_dates['player_name'].nunique():,} players")
+
+    new, new_seconds = timed(draft_streaks, draft_dates)
+    print(f"vectorized: {new_seconds:8.3f}s")
+
+    if not args.skip_legacy:
+        old, old_seconds = timed(legacy_streaks, draft_dates)
+        print(f"legacy:     {old_seconds:8.3f}s  ({old_seconds / new_seconds:,.0f}x slower)")
+
+        merged = old.merge(new, on="player_name", suffixes=("_legacy", ""))
+        mismatches = (merged["longest_streak_legacy"] != merged["longest_streak"]).sum()
+        print("longest_streak matches" if mismatches == 0 and len(merged) == len(new)
+              else f"MISMATCH for {mismatches} players")
@@ -0,0 +1,195 @@
+import argparse
+import json
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from aggregates import rebuild_aggregates
+
+# ---------------- CONFIG ----------------
+# Money per pick sold in a standard draft (20,000 per player, 8 picks each).
+# normalized_cost is a price in that draft's money; changing this needs
+# `python budgets.py --rebuild`.
+REFERENCE_MONEY_PER_PICK = 2_500
+# ----------------------------------------
+
+
+# --------------------
+# Per-pick budgets
+# --------------------
+# pick_budget holds, for every v2 pick, the buyer's budget for the draft,
+# the money they had left just before the pick and the share of the budget
+# already spent. See migrations/0010_pick_budget.sql for how the budget is
+# read from the bot's starting_money / remaining_money.
+BUDGET_COLUMNS = ("pick_id", "draft_id", "player_id", "draft_order", "budget", "money_before", "spent_share")
+
+PICKS_SQL = """
+SELECT id AS pick_id, draft_id, drafted_by_id AS player_id, draft_order, cost
+FROM draft_pokemon_v2
+WHERE drafted_by_id IS NOT NULL AND {draft_filter}
+ORDER BY id
+"""
+
+PLAYERS_SQL = """
+SELECT draft_id, player_id, starting_money, remaining_money
+FROM draft_players_v2
+WHERE player_id IS NOT NULL AND starting_money IS NOT NULL AND {draft_filter}
+ORDER BY id
+"""
+
+
+def pick_budgets(picks: pd.DataFrame, players: pd.DataFrame) -> pd.DataFrame:
+    """
+    Running budgets for `picks` (pick_id, draft_id, player_id, draft_order,
+    cost) given the draft_players_v2 rows of the same drafts (draft_id,
+    player_id, starting_money, remaining_money). Returns BUDGET_COLUMNS,
+    one row per pick whose buyer has a player row.
+
+    Vectorised: one groupby-cumsum over the picks sorted by (draft_id,
+    draft_order) gives every player's spend before each pick.
+    """
+    picks = picks.sort_values(["draft_id", "draft_order", "pick_id"], kind="stable")
+    cost = picks["cost"].fillna(0)
+    by_player = [picks["draft_id"], picks["player_id"]]
+
+    spent_after = cost.groupby(by_player).cumsum()
+    spent_total = cost.groupby(by_player).transform("sum")
+
+    players = players.drop_duplicates(["draft_id", "player_id"])
+    out = picks[["pick_id", "draft_id", "player_id", "draft_order"]].assign(
+        spent_before=spent_after - cost,
+        spent_total=spent_total,
+    ).merge(players, on=["draft_id", "player_id"], how="inner", validate="many_to_one")
+
+    budget = np.where(out["remaining_money"].fillna(0) >= 0,
+                      out["starting_money"],
+                      out["starting_money"] + out["spent_total"])
+    out["budget"] = budget.astype("int64")
+    out["money_before"] = (out["budget"] - out["spent_before"]).astype("int64")
+    out["spent_share"] = (out["spent_before"] / out["budget"]).where(out["budget"] > 0)
+    return out[list(BUDGET_COLUMNS)].sort_values("pick_id", ignore_index=True)
+
+
+def refresh_pick_budget(conn: sqlite3.Connection, draft_ids: list[int] | None = None) -> int:
+    """
+    Recomputes the pick_budget rows of `draft_ids` (every draft if None) on
+    the caller's transaction and returns the number of rows written.
+    """
+    if draft_ids is None:
+        draft_filter, params = "1", ()
+        conn.execute("DELETE FROM pick_budget")
+    elif not draft_ids:
+        return 0
+    else:
+        draft_filter = "draft_id IN (SELECT value FROM json_each(?))"
+        params = (json.dumps([int(i) for i in draft_ids]),)
+        conn.execute(f"DELETE FROM pick_budget WHERE {draft_filter}", params)
+
+    picks = pd.read_sql_query(PICKS_SQL.format(draft_filter=draft_filter), conn, params=params)
+    players = pd.read_sql_query(PLAYERS_SQL.format(draft_filter=draft_filter), conn, params=params)
+    budgets = pick_budgets(picks, players)
+
+    # Plain Python values for sqlite3 (NaN -> NULL)
+    rows = budgets.astype(object).where(budgets.notna(), None).itertuples(index=False, name=None)
+    conn.executemany(
+        f"INSERT INTO pick_budget ({', '.join(BUDGET_COLUMNS)}) VALUES ({', '.join('?' * len(BUDGET_COLUMNS))})",
+        rows
+    )
+    return len(budgets)
+
+
+# --------------------
+# Per-draft inflation
+# --------------------
+# draft_inflation holds, per draft, the money in play (every player's
+# budget, as in pick_budget; players who bought nothing count their
+# starting_money), the picks sold and their mean price. inflation is the
+# money per pick relative to REFERENCE_MONEY_PER_PICK, and every pick's
+# normalized_cost is its cost divided by it, in whole coins. Drafts without
+# player money keep their raw cost.
+INFLATION_SQL = """
+INSERT INTO draft_inflation
+    (draft_id, players, money_in_play, picks_sold, total_spent, mean_price, inflation)
+WITH players AS (
+    -- First row per player and draft
+    SELECT draft_id, player_id, starting_money, MIN(id)
+    FROM draft_players_v2
+    WHERE player_id IS NOT NULL AND starting_money IS NOT NULL AND {draft_filter}
+    GROUP BY draft_id, player_id
+),
+money AS (
+    SELECT pl.draft_id, COUNT(*) AS players,
+           SUM(COALESCE(b.budget, pl.starting_money)) AS money_in_play
+    FROM players pl
+    LEFT JOIN (SELECT DISTINCT draft_id, player_id, budget FROM pick_budget WHERE {draft_filter}) b
+        ON b.draft_id = pl.draft_id AND b.player_id = pl.player_id
+    GROUP BY pl.draft_id
+),
+sold AS (
+    SELECT draft_id, COUNT(cost) AS picks_sold, SUM(cost) AS total_spent, AVG(cost) AS mean_price
+    FROM draft_pokemon_v2
+    WHERE {draft_filter}
+    GROUP BY draft_id
+)
+SELECT s.draft_id, COALESCE(m.players, 0), COALESCE(m.money_in_play, 0),
+       s.picks_sold, COALESCE(s.total_spent, 0), s.mean_price,
+       CASE WHEN m.money_in_play > 0 AND s.picks_sold > 0
+            THEN CAST(m.money_in_play AS REAL) / s.picks_sold / :reference
+       END
+FROM sold s
+LEFT JOIN money m
+    ON m.draft_id = s.draft_id
+"""
+
+NORMALIZE_SQL = """
+UPDATE draft_pokemon_v2
+SET normalized_cost = CAST(ROUND(cost / COALESCE(i.inflation, 1.0)) AS INTEGER)
+FROM (SELECT draft_id, inflation FROM draft_inflation WHERE {draft_filter}) i
+WHERE i.draft_id = draft_pokemon_v2.draft_id
+"""
+
+
+def refresh_draft_inflation(conn: sqlite3.Connection, draft_ids: list[int] | None = None):
+    """
+    Recomputes the draft_inflation rows and the picks' normalized_cost for
+    `draft_ids` (every draft if None) on the caller's transaction. Reads
+    pick_budget, so run it after refresh_pick_budget, and before the
+    aggregates are updated (they sum normalized_cost).
+    """
+    if draft_ids is None:
+        draft_filter, params = "1", {}
+        conn.execute("DELETE FROM draft_inflation")
+    elif not draft_ids:
+        return
+    else:
+        draft_filter = "draft_id IN (SELECT value FROM json_each(:draft_ids))"
+        params = {"draft_ids": json.dumps([int(i) for i in draft_ids])}
+        conn.execute(f"DELETE FROM draft_inflation WHERE {draft_filter}", params)
+
+    conn.execute(INFLATION_SQL.format(draft_filter=draft_filter),
+                 {**params, "reference": REFERENCE_MONEY_PER_PICK})
+    conn.execute(NORMALIZE_SQL.format(draft_filter=draft_filter), params)
+
+
+if __name__ == "__main__":
+    from ingest import DB_PATH, connect
+
+    parser = argparse.ArgumentParser(description="Maintain the per-pick budget and per-draft inflation tables.")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Recompute every pick's budget, every draft's inflation and the aggregates")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    args = parser.parse_args()
+
+    if not args.rebuild:
+        parser.error("nothing to do (pass --rebuild)")
+
+    conn = connect(args.db)
+    with conn:
+        rows = refresh_pick_budget(conn)
+        refresh_draft_inflation(conn)
+        # The aggregates sum normalized_cost
+        rebuild_aggregates(conn)
+    conn.close()
+
+    print(f"Rebuilt pick_budget ({rows} picks), draft_inflation and the aggregates.")
@@ -0,0 +1,110 @@
+import argparse
+import json
+import math
+from pathlib import Path
+
+from PIL import Image
+
+# --------------------
+# Config
+# --------------------
+ASSET_DIR = Path("assets")
+ATLAS_DIR = ASSET_DIR / "atlas"
+
+# Source folder -> sprite sizes to build (longest edge in px, None = as-is).
+# 40 is the thumbnail size the dashboard charts draw.
+ATLASES = {
+    "baseforms": (40,),
+}
+
+# Transparent gap between sprites so smoothing never bleeds across them
+PADDING = 1
+
+
+def atlas_name(source: str, size: int | None) -> str:
+    return f"{source}_{size or 'native'}"
+
+
+def load_sprites(source_dir: Path, size: int | None) -> dict:
+    sprites = {}
+    for path in sorted(source_dir.glob("*.png")):
+        with Image.open(path) as img:
+            img = img.convert("RGBA")
+            if size is not None:
+                img.thumbnail((size, size), Image.LANCZOS)
+            sprites[path.stem] = img
+    return sprites
+
+
+def pack(sprites: dict) -> tuple[int, int, dict]:
+    """
+    Shelf packing: tallest sprites first, left to right, starting a new row
+    when the current one is full. Returns (width, height, name -> box).
+    """
+    area = sum((img.width + PADDING) * (img.height + PADDING) for img in sprites.values())
+    widest = max(img.width for img in sprites.values()) + PADDING
+    width = max(widest, math.ceil(math.sqrt(area)))
+
+    boxes = {}
+    x = y = row_height = 0
+    for name, img in sorted(sprites.items(), key=lambda item: (-item[1].height, item[0])):
+        if x + img.width > width:
+            x, y = 0, y + row_height + PADDING
+            row_height = 0
+        boxes[name] = (x, y, img.width, img.height)
+        x += img.width + PADDING
+        row_height = max(row_height, img.height)
+
+    return width, y + row_height, boxes
+
+
+def build_atlas(source: str, size: int | None, asset_dir: Path = ASSET_DIR,
+                atlas_dir: Path = ATLAS_DIR) -> Path | None:
+    """
+    Packs every PNG in `asset_dir/source` into one sheet plus a JSON index of
+    sprite offsets. Returns the index path, or None if there was nothing to pack.
+    """
+    sprites = load_sprites(asset_dir / source, size)
+    if not sprites:
+        return None
+
+    width, height, boxes = pack(sprites)
+    sheet = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    for name, (x, y, _, _) in boxes.items():
+        sheet.paste(sprites[name], (x, y))
+
+    atlas_dir.mkdir(parents=True, exist_ok=True)
+    name = atlas_name(source, size)
+    sheet.save(atlas_dir / f"{name}.png", format="PNG", optimize=True)
+
+    index = {
+        "source": source,
+        "size": size,
+        "image": f"{name}.png",
+        "width": width,
+        "height": height,
+        "sprites": {sprite: list(box) for sprite, box in sorted(boxes.items())},
+    }
+    index_path = atlas_dir / f"{name}.json"
+    index_path.write_text(json.dumps(index, indent=1))
+    return index_path
+
+
+def build_all(asset_dir: Path = ASSET_DIR, atlas_dir: Path = ATLAS_DIR):
+    for source, sizes in ATLASES.items():
+        for size in sizes:
+            index_path = build_atlas(source, size, asset_dir, atlas_dir)
+            if index_path is None:
+                print(f"Skipped {source}: no PNGs found")
+                continue
+            sheet = index_path.with_suffix(".png")
+            print(f"Built {sheet} ({sheet.stat().st_size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack sprite folders into size-specific atlases.")
+    parser.add_argument("--assets", type=Path, default=ASSET_DIR, help="Assets folder")
+    parser.add_argument("--out", type=Path, default=None, help="Output folder (default: <assets>/atlas)")
+    args = parser.parse_args()
+
+    build_all(args.assets, args.out or args.assets / "atlas")
@@ -0,0 +1,218 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from instrumentation import record_query
+
+# --------------------
+# Configuration
+# --------------------
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "PokemonDraftData.db")
+
+# Max number of distinct (sql, params) results kept in memory
+CACHE_MAX_ENTRIES = 256
+
+
+# --------------------
+# Read-only connection pool (one connection per thread)
+# --------------------
+# Streamlit runs every browser session's script on its own thread, so a
+# thread-local connection gives each session a private sqlite3 handle without
+# any locking around cursor use.
+_local = threading.local()
+_pool_lock = threading.Lock()
+_pool = []
+_pool_epoch = 0
+
+
+def _open_readonly(db_path: str) -> sqlite3.Connection:
+    uri = f"file:{db_path}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def get_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    Returns this thread's read-only connection, opening it on first use.
+    """
+    conns = getattr(_local, "conns", None)
+    if conns is None or _local.epoch != _pool_epoch:
+        conns = _local.conns = {}
+        _local.data_versions = {}
+        _local.epoch = _pool_epoch
+
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = _open_readonly(db_path)
+        conns[db_path] = conn
+        with _pool_lock:
+            _pool.append(conn)
+
+    return conn
+
+
+def close_all():
+    """
+    Closes every pooled connection (all threads) and clears the query cache.
+    Threads transparently reopen their connection on next use.
+    """
+    global _pool_epoch
+
+    with _pool_lock:
+        for conn in _pool:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+        _pool.clear()
+        _pool_epoch += 1
+
+    clear_cache()
+
+
+# --------------------
+# Change detection
+# --------------------
+# The cache is valid for one "database generation". The generation moves on
+# whenever the file on disk changes (mtime/size of the db or its WAL), when
+# PRAGMA data_version reports a commit from another connection, or when the
+# ingest change counter (ingest_state) is bumped.
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def _file_signature(db_path: str) -> tuple:
+    signature = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _data_version_changed(conn: sqlite3.Connection, db_path: str) -> bool:
+    versions = getattr(_local, "data_versions", None)
+    if versions is None:
+        versions = _local.data_versions = {}
+
+    current = conn.execute("PRAGMA data_version").fetchone()[0]
+    previous = versions.get(db_path)
+    versions[db_path] = current
+
+    return previous is not None and previous != current
+
+
+def change_counter(db_path: str = DB_PATH) -> int | None:
+    """
+    The ingest change counter, or None on databases without ingest_state.
+    Never cached: this is what the dashboard polls to notice new drafts.
+    """
+    try:
+        row = get_connection(db_path).execute(
+            "SELECT change_counter FROM ingest_state WHERE id = 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def db_token(db_path: str = DB_PATH) -> tuple:
+    """
+    Identifies the current state of the database file. Two calls return the
+    same token only if nothing has been written in between.
+    """
+    global _generation
+
+    conn = get_connection(db_path)
+    if _data_version_changed(conn, db_path):
+        with _generation_lock:
+            _generation += 1
+
+    return (_generation, change_counter(db_path), _file_signature(db_path))
+
+
+# --------------------
+# Query cache
+# --------------------
+_cache = OrderedDict()
+_cache_token = {}
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+        _cache_token.clear()
+
+
+def cache_stats() -> dict:
+    with _cache_lock:
+        return {**_stats, "entries": len(_cache)}
+
+
+def _cache_key(sql: str, params, db_path: str) -> tuple:
+    if params is None:
+        params = ()
+    elif isinstance(params, dict):
+        params = tuple(sorted(params.items()))
+    else:
+        params = tuple(params)
+    return (db_path, sql, params)
+
+
+def read_query(sql: str, params=None, db_path: str = DB_PATH) -> pd.DataFrame:
+    """
+    Runs a read-only query and returns the result as a DataFrame.
+
+    Results are cached on (sql, params) and thrown away as soon as the
+    database changes, so repeated Streamlit reruns only hit SQLite for queries
+    whose inputs actually changed. Callers get their own copy of the frame and
+    are free to mutate it.
+    """
+    started = time.perf_counter()
+    token = db_token(db_path)
+    key = _cache_key(sql, params, db_path)
+
+    with _cache_lock:
+        if _cache_token.get(db_path) != token:
+            for stale in [k for k in _cache if k[0] == db_path]:
+                del _cache[stale]
+            _cache_token[db_path] = token
+
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            df = cached.copy()
+            record_query(sql, params, time.perf_counter() - started, len(df), "hit", db_path=db_path)
+            return df
+
+        _stats["misses"] += 1
+
+    df = pd.read_sql_query(sql, get_connection(db_path), params=params)
+
+    with _cache_lock:
+        if _cache_token.get(db_path) == token:
+            _cache[key] = df
+            while len(_cache) > CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+
+    record_query(sql, params, time.perf_counter() - started, len(df), "miss", db_path=db_path)
+    return df.copy()
+
+
+def read_scalar(sql: str, params=None, db_path: str = DB_PATH):
+    """
+    Convenience wrapper for single-value queries (COUNT(*) and friends).
+    """
+    df = read_query(sql, params, db_path)
+    return df.iloc[0, 0]
@@ -0,0 +1,162 @@
+import argparse
+import json
+import sqlite3
+from dataclasses import dataclass
+
+from aggregates import rebuild_aggregates
+
+
+# --------------------
+# Player / Pokémon dimensions
+# --------------------
+@dataclass(frozen=True)
+class Dimension:
+    table: str
+    alias_table: str
+    id_column: str
+    # (fact table, foreign key column) pairs pointing at this dimension
+    references: tuple
+
+
+DIMENSIONS = {
+    "player": Dimension("player", "player_alias", "player_id", (
+        ("draft_players_v2", "player_id"),
+        ("draft_pokemon_v2", "drafted_by_id"),
+        ("pick_history", "drafted_by_id"),
+        ("pick_budget", "player_id"),
+    )),
+    "pokemon": Dimension("pokemon", "pokemon_alias", "pokemon_id", (
+        ("draft_pokemon_v2", "pokemon_id"),
+        ("pick_history", "pokemon_id"),
+    )),
+}
+
+# Alias keys are computed by SQLite, so they always agree with the
+# LOWER(TRIM(...)) lookups in the insert statements.
+ALIAS_KEY = "LOWER(TRIM(?))"
+
+
+def resolve(conn: sqlite3.Connection, dimension: str, name: str) -> int | None:
+    """
+    The dimension id `name` (any known spelling) maps to, or None.
+    """
+    dim = DIMENSIONS[dimension]
+    row = conn.execute(
+        f"SELECT {dim.id_column} FROM {dim.alias_table} WHERE alias_key = {ALIAS_KEY}",
+        (name,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def register_names(conn: sqlite3.Connection, dimension: str, names) -> int:
+    """
+    Adds a dimension row and alias for every name whose key isn't known yet,
+    on the caller's transaction. The first spelling seen becomes the display
+    name. Returns how many new rows were added.
+    """
+    dim = DIMENSIONS[dimension]
+    names = [n for n in dict.fromkeys(names) if n is not None and str(n).strip()]
+    if not names:
+        return 0
+
+    unseen = conn.execute(
+        f"""
+        SELECT LOWER(TRIM(n.value)) AS alias_key, MIN(n.key), n.value
+        FROM json_each(?) n
+        WHERE LOWER(TRIM(n.value)) NOT IN (SELECT alias_key FROM {dim.alias_table})
+        GROUP BY alias_key
+        ORDER BY MIN(n.key)
+        """,
+        (json.dumps(names),)
+    ).fetchall()
+
+    for key, _, name in unseen:
+        dim_id = conn.execute(f"INSERT INTO {dim.table} (name) VALUES (?)", (name,)).lastrowid
+        conn.execute(
+            f"INSERT INTO {dim.alias_table} (alias_key, {dim.id_column}) VALUES (?, ?)",
+            (key, dim_id)
+        )
+
+    return len(unseen)
+
+
+def rename(conn: sqlite3.Connection, dimension: str, name: str, new_name: str):
+    """
+    Changes the display name of the row `name` resolves to. Fact rows and
+    aggregates reference the id, so this touches one row (plus an alias for
+    the new spelling).
+    """
+    dim = DIMENSIONS[dimension]
+    dim_id = resolve(conn, dimension, name)
+    if dim_id is None:
+        raise ValueError(f"Unknown {dimension}: {name}")
+
+    conn.execute(f"UPDATE {dim.table} SET name = ? WHERE id = ?", (new_name, dim_id))
+    add_alias(conn, dimension, new_name, new_name)
+
+
+def add_alias(conn: sqlite3.Connection, dimension: str, alias: str, canonical: str):
+    """
+    Makes `alias` resolve to the same row as `canonical`. If the alias was
+    its own row (e.g. picks stored as "Mega Falinks"), that row is merged
+    into the canonical one: facts and aliases are re-pointed, the old row is
+    deleted and the aggregates are rebuilt.
+    """
+    dim = DIMENSIONS[dimension]
+    target = resolve(conn, dimension, canonical)
+    if target is None:
+        raise ValueError(f"Unknown {dimension}: {canonical}")
+
+    current = resolve(conn, dimension, alias)
+    if current == target:
+        return
+
+    if current is None:
+        conn.execute(
+            f"INSERT INTO {dim.alias_table} (alias_key, {dim.id_column}) VALUES ({ALIAS_KEY}, ?)",
+            (alias, target)
+        )
+        return
+
+    for table, column in dim.references:
+        conn.execute(f"UPDATE {table} SET {column} = ? WHERE {column} = ?", (target, current))
+    conn.execute(
+        f"UPDATE {dim.alias_table} SET {dim.id_column} = ? WHERE {dim.id_column} = ?",
+        (target, current)
+    )
+    conn.execute(f"DELETE FROM {dim.table} WHERE id = ?", (current,))
+    rebuild_aggregates(conn)
+
+
+if __name__ == "__main__":
+    from ingest import DB_PATH, connect
+
+    parser = argparse.ArgumentParser(description="Manage player and Pokémon names.")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    alias_parser = sub.add_parser("alias", help="Map a spelling onto an existing player/Pokémon")
+    alias_parser.add_argument("dimension", choices=sorted(DIMENSIONS))
+    alias_parser.add_argument("alias")
+    alias_parser.add_argument("canonical")
+
+    rename_parser = sub.add_parser("rename", help="Change the display name of a player/Pokémon")
+    rename_parser.add_argument("dimension", choices=sorted(DIMENSIONS))
+    rename_parser.add_argument("name")
+    rename_parser.add_argument("new_name")
+
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    try:
+        with conn:
+            if args.command == "alias":
+                add_alias(conn, args.dimension, args.alias, args.canonical)
+                print(f"'{args.alias}' now resolves to '{args.canonical}'")
+            else:
+                rename(conn, args.dimension, args.name, args.new_name)
+                print(f"Renamed '{args.name}' to '{args.new_name}'")
+    except ValueError as e:
+        raise SystemExit(str(e))
+    finally:
+        conn.close()
@@ -1,39 +1,19 @@
-import sqlite3
-
-DB_PATH = "PokemonDraftData.db"
+from dimensions import add_alias, resolve
+from ingest import DB_PATH, connect
 
 OLD_NAME = "mega falinks"
 NEW_NAME = "Falinks"
 
-conn = sqlite3.connect(DB_PATH)
-cursor = conn.cursor()
-
-# Preview how many rows will be affected
-cursor.execute(
-    """
-    SELECT COUNT(*)
-    FROM draft_pokemon_v2
-    WHERE LOWER(pokemon) = ?
-    """,
-    (OLD_NAME,)
-)
-
-count = cursor.fetchone()[0]
-print(f"Found {count} rows with pokemon = '{OLD_NAME}'")
-
-if count > 0:
-    cursor.execute(
-        """
-        UPDATE draft_pokemon_v2
-        SET pokemon = ?
-        WHERE LOWER(pokemon) = ?
-        """,
-        (NEW_NAME, OLD_NAME)
-    )
+# Migrates the database first, like every writer
+conn = connect(DB_PATH)
 
-    conn.commit()
-    print("Update complete ✅")
-else:
-    print("No rows to update.")
+# Picks keep their original text; the alias makes "Mega Falinks" resolve to
+# the Falinks row (merging it if it was ingested as its own Pokémon).
+with conn:
+    if resolve(conn, "pokemon", OLD_NAME) == resolve(conn, "pokemon", NEW_NAME) is not None:
+        print(f"'{OLD_NAME}' already resolves to '{NEW_NAME}'")
+    else:
+        add_alias(conn, "pokemon", OLD_NAME, NEW_NAME)
+        print("Update complete ✅")
 
-conn.close()
\ No newline at end of file
+conn.close()
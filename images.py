@@ -0,0 +1,154 @@
+import base64
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from PIL import Image
+
+from instrumentation import record_image
+
+# --------------------
+# Configuration
+# --------------------
+SPRITE_DIR = Path("assets/baseforms")
+
+# Edge length (px) of the sprites drawn on top of the bar charts
+THUMBNAIL_SIZE = 40
+
+# Max number of encoded images kept in memory (one per name/size pair)
+CACHE_MAX_ENTRIES = 1024
+
+
+# --------------------
+# Sprite lookup
+# --------------------
+def normalize_name(pokemon_name: str) -> str:
+    return " ".join(str(pokemon_name).split()).casefold()
+
+
+_index_lock = threading.Lock()
+_indexes = {}
+
+
+def sprite_index(sprite_dir: Path = SPRITE_DIR) -> dict:
+    """
+    Maps normalized Pokémon names to their PNG in `sprite_dir`. The folder is
+    only listed again when its mtime changes (update_assets.py rewrites it).
+    """
+    sprite_dir = Path(sprite_dir)
+    try:
+        dir_mtime = sprite_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    with _index_lock:
+        cached = _indexes.get(sprite_dir)
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+
+    index = {
+        normalize_name(path.stem): path
+        for path in sorted(sprite_dir.glob("*.png"))
+    }
+
+    with _index_lock:
+        _indexes[sprite_dir] = (dir_mtime, index)
+    return index
+
+
+# --------------------
+# Data URI cache
+# --------------------
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+    with _index_lock:
+        _indexes.clear()
+
+
+def cache_stats() -> dict:
+    with _cache_lock:
+        return {**_stats, "entries": len(_cache), "bytes": sum(len(uri) for uri in _cache.values())}
+
+
+def _png_data_uri(data: bytes) -> str:
+    return f"data:image/png;base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def _image_data_uri(img: Image.Image) -> str:
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", optimize=True)
+    return _png_data_uri(buffer.getvalue())
+
+
+def _encode(path: Path, size: int | None) -> str:
+    if size is None:
+        return _png_data_uri(path.read_bytes())
+
+    with Image.open(path) as img:
+        img = img.convert("RGBA")
+        img.thumbnail((size, size), Image.LANCZOS)
+        return _image_data_uri(img)
+
+
+def _cached(key: tuple, encode) -> str:
+    """
+    LRU lookup of encoded images. key[-1] is the source mtime; entries for
+    an older mtime of the same image are dropped on refresh.
+    """
+    with _cache_lock:
+        uri = _cache.get(key)
+        if uri is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            record_image("hit")
+            return uri
+        _stats["misses"] += 1
+
+    started = time.perf_counter()
+    uri = encode()
+    record_image("miss", time.perf_counter() - started)
+
+    with _cache_lock:
+        for stale in [k for k in _cache if k[:-1] == key[:-1] and k != key]:
+            del _cache[stale]
+        _cache[key] = uri
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+    return uri
+
+
+def file_data_uri(path, size: int | None = None) -> str | None:
+    """
+    Returns `path` as a PNG data URI, downscaled to fit `size` x `size` when
+    a size is given. Encoded once per (file, size, mtime) and then served
+    from memory.
+    """
+    if not path:
+        return None
+    path = Path(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    return _cached((str(path), size, mtime), lambda: _encode(path, size))
+
+
+def pokemon_image(pokemon_name: str, size: int | None = THUMBNAIL_SIZE,
+                  sprite_dir: Path = SPRITE_DIR) -> str | None:
+    """
+    Data URI for a Pokémon's sprite, as a `size`px thumbnail by default
+    (pass size=None for the original file). None if there is no sprite.
+    """
+    path = sprite_index(sprite_dir).get(normalize_name(pokemon_name))
+    return file_data_uri(path, size) if path else None
@@ -0,0 +1,681 @@
+import csv
+import os
+import sqlite3
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import pandas as pd
+
+from aggregates import update_aggregates
+from budgets import refresh_draft_inflation, refresh_pick_budget
+from dimensions import register_names
+from manifest import SourceFile, changed_paths, fingerprint, known_hashes, record_sources
+from migrate import upgrade
+from pick_history import sync_era
+from snapshot import parquet_available, refresh_snapshot
+
+# ---------------- CONFIG ----------------
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "PokemonDraftData.db")
+
+# Files per transaction during bulk loads
+BATCH_FILES = 200
+
+# Drafts the bot exported with broken data
+BAD_DRAFT_IDS = {"860538035132", "072501118051", "596019556640"}
+
+# Target of the timestamped website CSV exports (insert_raw_csv.py)
+RAW_TABLE_NAME = "all_draft_csv_with_website"
+
+# Append new drafts to the Parquet snapshot (snapshot.py) after each ingest
+REFRESH_SNAPSHOT = True
+# ----------------------------------------
+
+
+@dataclass
+class ParsedDraft:
+    """
+    One bot CSV, parsed into typed rows ready for executemany().
+    Group 2 files have no draft ID, patch or pick order; those are None.
+    """
+    source_path: str
+    external_draft_id: str | None
+    patch: str | None
+    date_time: datetime
+    total_pokemon_sold: int
+    # (player_name, starting_money, remaining_money)
+    players: list[tuple[str, int, int]] = field(default_factory=list)
+    # (draft_order, pokemon, drafted_by, cost)
+    picks: list[tuple[int | None, str, str, int]] = field(default_factory=list)
+
+
+@dataclass
+class IngestStats:
+    files: int = 0
+    drafts: int = 0
+    players: int = 0
+    picks: int = 0
+    skipped: int = 0
+    unchanged: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return self.drafts + self.players + self.picks
+
+    def summary(self) -> str:
+        rate = self.rows / self.seconds if self.seconds else 0.0
+        return (
+            f"{self.files} files, {self.drafts} drafts, {self.players} players, "
+            f"{self.picks} picks ({self.skipped} skipped, {self.unchanged} unchanged) "
+            f"in {self.seconds:.2f}s - {rate:,.0f} rows/sec"
+        )
+
+
+# ---------- DATETIME PARSER ----------
+def parse_datetime(raw: str) -> datetime:
+    raw = raw.strip()
+
+    # Normalize AM/PM variants
+    raw = raw.replace("a.m.", "AM").replace("p.m.", "PM")
+    raw = raw.replace("A.M.", "AM").replace("P.M.", "PM")
+
+    # Remove commas
+    raw = raw.replace(",", "")
+
+    formats = [
+        "%d/%m/%Y %H:%M:%S",  # 31/12/2025 18:02:28
+        "%m/%d/%Y %I:%M:%S %p",  # 12/31/2025 6:02:28 PM
+        "%d/%m/%Y %I:%M:%S %p",  # 31/12/2025 6:02:28 PM
+        "%m/%d/%Y %H:%M:%S",  # fallback
+    ]
+
+    for fmt in formats:
+        try:
+            return datetime.strptime(raw, fmt)
+        except ValueError:
+            continue
+
+    raise ValueError(f"Unrecognized datetime format: {raw}")
+
+
+# ---------- GROUP 3 PARSER ----------
+def _scan_group3_header(rows):
+    """
+    Returns (external_draft_id, patch, date_time, total_sold); any of them
+    may be None if the header line is missing.
+    """
+    external_draft_id = None
+    date_time = None
+    total_sold = None
+    patch = None
+
+    # ---------- HEADER SCAN ----------
+    for row in rows:
+        if not row:
+            continue
+
+        if row[0].startswith("Draft ID:"):
+            external_draft_id = row[0].split(":", 1)[1].strip()
+
+        if row[0].startswith("Patch:"):
+            patch = row[0].split(":", 1)[1].strip()
+
+        elif row[0].startswith("Date:"):
+            date_part = row[0].replace("Date:", "").strip()
+            time_part = row[1].strip() if len(row) > 1 else ""
+            raw_datetime = f"{date_part} {time_part}".strip()
+            date_time = parse_datetime(raw_datetime)
+
+        elif row[0].startswith("Total Pokemon Sold:"):
+            total_sold = int(row[0].split(":", 1)[1])
+
+    return external_draft_id, patch, date_time, total_sold
+
+
+def read_group3_header(file_path: str):
+    """
+    Header scan only: stops reading at the player table.
+    """
+    def header_rows(reader):
+        for row in reader:
+            if row[:3] == ["Player", "Starting Money", "Remaining Money"]:
+                return
+            yield row
+
+    with open(file_path, newline="", encoding="utf-8") as f:
+        return _scan_group3_header(header_rows(csv.reader(f)))
+
+
+def parse_group3_csv(file_path: str) -> ParsedDraft | None:
+    """
+    Parses one bot CSV. Returns None for drafts on the bad-ID list.
+    """
+    with open(file_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    external_draft_id, patch, date_time, total_sold = _scan_group3_header(rows)
+
+    if external_draft_id in BAD_DRAFT_IDS:
+        print(f"Skipping bad draft ID: {external_draft_id}")
+        return None
+
+    if not all([external_draft_id, patch, date_time, total_sold]):
+        raise ValueError(f"Missing header data in {os.path.basename(file_path)}")
+
+    # ---------- FIND TABLES ----------
+    players_start = None
+    players_end = None
+    order_start = None
+
+    for i, row in enumerate(rows):
+        if row[:3] == ["Player", "Starting Money", "Remaining Money"]:
+            players_start = i + 1
+
+        elif row[:4] == ["Order", "Pokemon", "Drafted By", "Cost"]:
+            players_end = i - 1
+            order_start = i + 1
+            break
+
+    draft = ParsedDraft(
+        source_path=file_path,
+        external_draft_id=external_draft_id,
+        patch=patch,
+        date_time=date_time,
+        total_pokemon_sold=total_sold,
+    )
+
+    for r in rows[players_start:players_end]:
+        if not r or not r[0]:
+            continue
+        draft.players.append((r[0], int(r[1]), int(r[2])))
+
+    for r in rows[order_start:]:
+        if not r or not r[0]:
+            continue
+        draft.picks.append((int(r[0]), r[1], r[2], int(r[3])))
+
+    return draft
+
+
+# ---------- GROUP 2 PARSER ----------
+def read_group2_header(file_path: str):
+    """
+    Returns (date_time, total_sold) from the first two lines.
+    """
+    with open(file_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        date_row = next(reader)
+        total_row = next(reader)
+
+    total_sold = int(total_row[0].split(":")[1])
+
+    date_part = date_row[0].replace("Date:", "").strip()
+    time_part = date_row[1].strip()
+
+    date_time = datetime.strptime(
+        f"{date_part}, {time_part}",
+        "%m/%d/%Y, %I:%M:%S %p"
+    )
+
+    return date_time, total_sold
+
+
+def parse_group2_csv(file_path: str) -> ParsedDraft:
+    with open(file_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    date_time, total_sold = read_group2_header(file_path)
+
+    # ---- FIND TABLE SPLITS ----
+    helper_start = None
+    helper_end = None
+    draft_start = None
+
+    for i, row in enumerate(rows):
+        if row[:3] == ["Player", "Starting Money", "Remaining Money"]:
+            helper_start = i + 1
+        if row[:3] == ["Pokemon", "Drafted By", "Cost"]:
+            draft_start = i + 1
+            helper_end = i - 1
+            break
+
+    draft = ParsedDraft(
+        source_path=file_path,
+        external_draft_id=None,
+        patch=None,
+        date_time=date_time,
+        total_pokemon_sold=total_sold,
+    )
+
+    for r in rows[helper_start:helper_end]:
+        if not r or not r[0]:
+            continue
+        draft.players.append((r[0], int(r[1]), int(r[2])))
+
+    for r in rows[draft_start:]:
+        if not r or not r[0]:
+            continue
+        draft.picks.append((None, r[0], r[1], int(r[2])))
+
+    return draft
+
+
+# ---------- RAW WEBSITE CSV PARSER ----------
+def read_raw_csv_date(file_path: str) -> datetime:
+    # first 15 characters of the file name are YYYYMMDD_HHMMSS
+    return datetime.strptime(os.path.basename(file_path)[:15], "%Y%m%d_%H%M%S")
+
+
+def parse_raw_csv(file_path: str) -> pd.DataFrame | None:
+    """
+    Reads one timestamped website export. Returns None (after printing why)
+    for files that can't be dated or read.
+    """
+    filename = os.path.basename(file_path)
+
+    try:
+        date_val = read_raw_csv_date(file_path)
+    except Exception as e:
+        print(f"Failed to parse timestamp from {filename}: {e}")
+        return None
+
+    try:
+        df = pd.read_csv(file_path)
+    except Exception as e:
+        print(f"Failed to read {filename}: {e}")
+        return None
+
+    if "Player" in df.columns:
+        df = df.rename(columns={"Player": "Pokemon"})
+
+    df["date"] = date_val
+
+    # Normalize column names
+    df.columns = (
+        df.columns
+        .str.strip()
+        .str.lower()
+        .str.replace(" ", "_")
+    )
+
+    df.attrs["source_path"] = file_path
+    return df
+
+
+# ---------- CONNECTIONS ----------
+def connect(db_path: str = DB_PATH) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    upgrade(conn)
+    return conn
+
+
+@contextmanager
+def bulk_load_pragmas(conn: sqlite3.Connection):
+    """
+    Switches the connection to WAL with relaxed syncing and a large page cache
+    for the duration of a bulk load, then checkpoints and restores rollback
+    journaling so the database file is self-contained again (the dashboard
+    opens it read-only).
+    """
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+    conn.execute("PRAGMA temp_store = MEMORY")
+    try:
+        yield conn
+    finally:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {synchronous}")
+        conn.execute(f"PRAGMA cache_size = {cache_size}")
+
+
+# ---------- CHANGE COUNTER ----------
+def bump_change_counter(conn: sqlite3.Connection):
+    """
+    Tells readers (the dashboard) that new drafts landed. Runs on the
+    caller's transaction.
+    """
+    conn.execute(
+        """
+        UPDATE ingest_state
+        SET change_counter = change_counter + 1,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = 1
+        """
+    )
+
+
+# ---------- DATABASE INSERT ----------
+def existing_draft_ids(conn: sqlite3.Connection, external_draft_ids: list[str]) -> set[str]:
+    if not external_draft_ids:
+        return set()
+    placeholders = ", ".join("?" for _ in external_draft_ids)
+    rows = conn.execute(
+        f"SELECT external_draft_id FROM draft_event_v2 WHERE external_draft_id IN ({placeholders})",
+        external_draft_ids
+    )
+    return {row[0] for row in rows}
+
+
+def insert_drafts(conn: sqlite3.Connection, drafts: list[ParsedDraft]) -> list[int]:
+    """
+    Inserts a batch of parsed drafts on the caller's transaction and returns
+    the new draft_event_v2 ids. One INSERT per draft event (its id is needed
+    for the child rows), then one executemany() each for players and picks.
+    New player/Pokémon names are registered first so every row gets its
+    dimension ids. Derived tables are updated on the same transaction.
+    """
+    draft_ids = []
+    player_rows = []
+    pick_rows = []
+
+    for draft in drafts:
+        cur = conn.execute(
+            """
+            INSERT INTO draft_event_v2
+            (external_draft_id, patch, date_time, total_pokemon_sold)
+            VALUES (?, ?, ?, ?)
+            """,
+            (draft.external_draft_id, draft.patch,
+             draft.date_time.isoformat(" "), draft.total_pokemon_sold)
+        )
+        draft_id = cur.lastrowid
+        draft_ids.append(draft_id)
+
+        player_rows.extend((draft_id, *p) for p in draft.players)
+        pick_rows.extend((draft_id, *p) for p in draft.picks)
+
+    register_names(conn, "player", [r[1] for r in player_rows] + [r[3] for r in pick_rows])
+    register_names(conn, "pokemon", [r[2] for r in pick_rows])
+
+    conn.executemany(
+        """
+        INSERT INTO draft_players_v2
+        (draft_id, player_name, starting_money, remaining_money, player_id)
+        VALUES (?1, ?2, ?3, ?4,
+                (SELECT player_id FROM player_alias WHERE alias_key = LOWER(TRIM(?2))))
+        """,
+        player_rows
+    )
+
+    conn.executemany(
+        """
+        INSERT INTO draft_pokemon_v2
+        (draft_id, draft_order, pokemon, drafted_by, cost, pokemon_id, drafted_by_id)
+        VALUES (?1, ?2, ?3, ?4, ?5,
+                (SELECT pokemon_id FROM pokemon_alias WHERE alias_key = LOWER(TRIM(?3))),
+                (SELECT player_id FROM player_alias WHERE alias_key = LOWER(TRIM(?4))))
+        """,
+        pick_rows
+    )
+
+    refresh_pick_budget(conn, draft_ids)
+    # Before the aggregates, which sum the normalized costs it writes
+    refresh_draft_inflation(conn, draft_ids)
+    update_aggregates(conn, draft_ids)
+    sync_era(conn, "v2")
+
+    return draft_ids
+
+
+def insert_group3_batch(conn: sqlite3.Connection, drafts: list[ParsedDraft],
+                        stats: IngestStats, verbose: bool = True):
+    """
+    Drops drafts that are already stored (or repeated within the batch),
+    inserts the rest and updates `stats`.
+    """
+    stored = existing_draft_ids(conn, [d.external_draft_id for d in drafts])
+
+    new_drafts = []
+    for draft in drafts:
+        if draft.external_draft_id in stored:
+            if verbose:
+                print(f"Skipping already ingested draft {draft.external_draft_id}")
+            stats.skipped += 1
+            continue
+        stored.add(draft.external_draft_id)
+        new_drafts.append(draft)
+
+    insert_drafts(conn, new_drafts)
+
+    for draft in new_drafts:
+        stats.drafts += 1
+        stats.players += len(draft.players)
+        stats.picks += len(draft.picks)
+        if verbose:
+            print(f"Inserted draft {draft.external_draft_id}")
+
+
+def insert_group2_batch(conn: sqlite3.Connection, drafts: list[ParsedDraft],
+                        stats: IngestStats, verbose: bool = True):
+    """
+    Group 2 files go to the v1 tables (draft_event / draft_players / draft_pokemon).
+    """
+    player_rows = []
+    pick_rows = []
+
+    for draft in drafts:
+        cur = conn.execute(
+            """
+            INSERT INTO draft_event (date_time, total_pokemon_sold)
+            VALUES (?, ?)
+            """,
+            (draft.date_time.isoformat(" "), draft.total_pokemon_sold)
+        )
+        draft_id = cur.lastrowid
+
+        player_rows.extend((draft_id, *p) for p in draft.players)
+        pick_rows.extend((draft_id, pokemon, by, cost) for _, pokemon, by, cost in draft.picks)
+
+        stats.drafts += 1
+        stats.players += len(draft.players)
+        stats.picks += len(draft.picks)
+
+    conn.executemany(
+        """
+        INSERT INTO draft_players
+        (draft_id, player_name, starting_money, remaining_money)
+        VALUES (?, ?, ?, ?)
+        """,
+        player_rows
+    )
+
+    conn.executemany(
+        """
+        INSERT INTO draft_pokemon
+        (draft_id, pokemon, drafted_by, cost)
+        VALUES (?, ?, ?, ?)
+        """,
+        pick_rows
+    )
+    sync_era(conn, "v1")
+
+    if verbose:
+        for draft in drafts:
+            print(f"Inserted {os.path.basename(draft.source_path)}")
+
+
+def insert_raw_batch(conn: sqlite3.Connection, frames: list[pd.DataFrame],
+                     stats: IngestStats, verbose: bool = True) -> set[str]:
+    """
+    Returns the source paths that failed to insert, so they stay out of the
+    manifest and are retried next run.
+    """
+    failed = set()
+
+    for df in frames:
+        source_path = df.attrs.get("source_path", "")
+        filename = os.path.basename(source_path)
+        try:
+            df.to_sql(RAW_TABLE_NAME, conn, if_exists="append", index=False)
+        except Exception as e:
+            print(f"Failed to insert {filename}: {e}")
+            stats.skipped += 1
+            failed.add(source_path)
+            continue
+
+        stats.drafts += 1
+        stats.picks += len(df)
+        if verbose:
+            print(f"Inserted {filename} into {RAW_TABLE_NAME}")
+
+    sync_era(conn, "website")
+    return failed
+
+
+# format -> (parser, batch writer)
+PARSERS = {
+    "group3": (parse_group3_csv, insert_group3_batch),
+    "group2": (parse_group2_csv, insert_group2_batch),
+    "raw": (parse_raw_csv, insert_raw_batch),
+}
+
+
+# ---------- BULK INGEST ----------
+def load_source(source_format: str, path: str) -> SourceFile:
+    """
+    Fingerprints and parses one file. Module level so it can run in a
+    process pool.
+    """
+    parse, _ = PARSERS[source_format]
+    size, mtime_ns, sha256 = fingerprint(path)
+    return SourceFile(path, size, mtime_ns, sha256, parse(path))
+
+
+def changed_files(paths: list[str], source_format: str, db_path: str = DB_PATH) -> list[str]:
+    conn = connect(db_path)
+    try:
+        return changed_paths(conn, paths, source_format)
+    finally:
+        conn.close()
+
+
+def write_in_batches(sources, source_format: str, db_path: str = DB_PATH,
+                     batch_files: int = BATCH_FILES, verbose: bool = True,
+                     bulk: bool = True) -> IngestStats:
+    """
+    Single-writer loop shared by every ingest path. `sources` yields one
+    SourceFile at a time; every `batch_files` files are inserted and
+    recorded in ingest_manifest inside one transaction. Files whose content
+    hash was already ingested (e.g. a renamed or re-downloaded copy) are only
+    recorded, not inserted again. `bulk=False` skips the bulk-load pragmas
+    for small live inserts.
+    """
+    _, insert_batch = PARSERS[source_format]
+    stats = IngestStats()
+    started = time.perf_counter()
+
+    conn = connect(db_path)
+    try:
+        with bulk_load_pragmas(conn) if bulk else nullcontext():
+            seen_hashes = known_hashes(conn, source_format)
+            batch = []
+            done = []
+
+            def flush():
+                inserted_before = stats.drafts
+                with conn:
+                    failed = insert_batch(conn, [s.parsed for s in batch], stats, verbose) or set()
+                    record_sources(conn, [s for s in batch if s.path not in failed] + done, source_format)
+                    if stats.drafts > inserted_before:
+                        bump_change_counter(conn)
+                batch.clear()
+                done.clear()
+
+            for source in sources:
+                stats.files += 1
+
+                if source.sha256 in seen_hashes:
+                    if verbose:
+                        print(f"Skipping already ingested file {os.path.basename(source.path)}")
+                    stats.skipped += 1
+                    done.append(source)
+                    continue
+                seen_hashes.add(source.sha256)
+
+                if source.parsed is None:
+                    stats.skipped += 1
+                    done.append(source)
+                    continue
+
+                batch.append(source)
+                if len(batch) >= batch_files:
+                    flush()
+
+            if batch or done:
+                flush()
+    finally:
+        conn.close()
+
+    # Only the v2 tables are in the snapshot
+    if REFRESH_SNAPSHOT and stats.drafts and source_format == "group3" and parquet_available():
+        refresh_snapshot(db_path)
+
+    stats.seconds = time.perf_counter() - started
+    if verbose:
+        print(stats.summary())
+    return stats
+
+
+def ingest_files(paths: list[str], source_format: str = "group3", db_path: str = DB_PATH,
+                 batch_files: int = BATCH_FILES, verbose: bool = True, force: bool = False,
+                 bulk: bool = True) -> IngestStats:
+    """
+    Serial ingest of `paths`. Files the manifest says are unchanged are
+    skipped without being opened, unless `force` is set.
+    """
+    todo = paths if force else changed_files(paths, source_format, db_path)
+    stats = write_in_batches(
+        (load_source(source_format, path) for path in todo),
+        source_format,
+        db_path,
+        batch_files,
+        verbose,
+        bulk
+    )
+    stats.unchanged = len(paths) - len(todo)
+    return stats
+
+
+def ingest_group3_files(paths: list[str], db_path: str = DB_PATH,
+                        batch_files: int = BATCH_FILES, verbose: bool = True) -> IngestStats:
+    """
+    Parses and inserts bot CSVs, committing once per `batch_files` files.
+    Drafts that are already in the database (or repeated within the run)
+    are skipped.
+    """
+    return ingest_files(paths, "group3", db_path, batch_files, verbose)
+
+
+def seed_manifest(paths: list[str], source_format: str, db_path: str = DB_PATH) -> int:
+    """
+    Records files as already ingested without loading them. Used once for
+    folders that were loaded before the manifest existed, so formats without
+    their own duplicate check (group2, raw) don't append them again.
+    """
+    sources = [SourceFile(path, *fingerprint(path)) for path in paths]
+
+    conn = connect(db_path)
+    try:
+        with conn:
+            record_sources(conn, sources, source_format)
+    finally:
+        conn.close()
+
+    return len(sources)
+
+
+def csv_files(csv_dir: str) -> list[str]:
+    return sorted(
+        os.path.join(csv_dir, file)
+        for file in os.listdir(csv_dir)
+        if file.lower().endswith(".csv")
+    )
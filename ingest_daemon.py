@@ -0,0 +1,216 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+
+from ingest import DB_PATH, changed_files, csv_files, ingest_files
+from ParseAndInsertGroup3 import CSV_DIR
+
+# ---------------- CONFIG ----------------
+# A file is ingested once its size and mtime have been stable this long
+SETTLE_SECONDS = 0.5
+# How often pending files are checked (and the folder rescanned when polling).
+# Polling is the slower path: a new file is seen up to POLL_SECONDS late.
+TICK_SECONDS = 0.1
+POLL_SECONDS = 0.25
+# A file that failed on a database or file error (e.g. "database is locked"
+# during a bulk backfill) is retried after this long
+RETRY_SECONDS = 5.0
+# ----------------------------------------
+
+
+def _is_csv(path: str) -> bool:
+    return path.lower().endswith(".csv")
+
+
+def _signature(path: str):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class PendingFiles:
+    """
+    Debounces files that are still being written. A path becomes ready once
+    its (size, mtime) hasn't changed for `settle_seconds`.
+    """
+
+    def __init__(self, settle_seconds: float = SETTLE_SECONDS):
+        self.settle_seconds = settle_seconds
+        self._lock = threading.Lock()
+        # path -> (signature, monotonic time the signature was first seen)
+        self._files = {}
+
+    def touch(self, path: str):
+        with self._lock:
+            self._files.setdefault(path, (None, time.monotonic()))
+
+    def retry(self, path: str, delay: float = RETRY_SECONDS):
+        """Makes `path` ready again `delay` seconds from now, unless it changes first."""
+        with self._lock:
+            self._files[path] = (_signature(path), time.monotonic() + delay - self.settle_seconds)
+
+    def ready(self) -> list[str]:
+        now = time.monotonic()
+        done = []
+
+        with self._lock:
+            for path, (signature, since) in list(self._files.items()):
+                current = _signature(path)
+                if current is None:
+                    # Deleted or renamed away before it settled
+                    del self._files[path]
+                elif current != signature:
+                    self._files[path] = (current, now)
+                elif now - since >= self.settle_seconds and current[0] > 0:
+                    done.append(path)
+                    del self._files[path]
+
+        return sorted(done)
+
+
+# ---------- FOLDER WATCHERS ----------
+def start_inotify_watcher(folder: str, pending: PendingFiles):
+    """
+    Watches `folder` with watchdog's native observer (inotify on Linux).
+    Returns the running observer, or None if watchdog/inotify is unavailable.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class CsvHandler(FileSystemEventHandler):
+        def on_created(self, event):
+            if not event.is_directory and _is_csv(event.src_path):
+                pending.touch(event.src_path)
+
+        def on_modified(self, event):
+            self.on_created(event)
+
+        def on_moved(self, event):
+            if not event.is_directory and _is_csv(event.dest_path):
+                pending.touch(event.dest_path)
+
+    observer = Observer()
+    try:
+        observer.schedule(CsvHandler(), folder, recursive=False)
+        observer.start()
+    except OSError as e:
+        print(f"Native file watching unavailable ({e}); falling back to polling")
+        return None
+
+    return observer
+
+
+class FolderPoller:
+    """
+    Polling fallback: rescans the folder every `interval` seconds and marks
+    files whose size or mtime changed.
+    """
+
+    def __init__(self, folder: str, pending: PendingFiles, interval: float = POLL_SECONDS):
+        self.folder = folder
+        self.pending = pending
+        self.interval = interval
+        self._last_scan = 0.0
+        self._seen = {}
+
+    def poll(self):
+        now = time.monotonic()
+        if now - self._last_scan < self.interval:
+            return
+        self._last_scan = now
+
+        for entry in os.scandir(self.folder):
+            if not entry.is_file() or not _is_csv(entry.name):
+                continue
+            stat = entry.stat()
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self._seen.get(entry.path) != signature:
+                self._seen[entry.path] = signature
+                self.pending.touch(entry.path)
+
+
+# ---------- SERVICE ----------
+def ingest_one(path: str, db_path: str, pending: PendingFiles, force: bool = False):
+    """
+    Ingests one CSV. Errors are logged rather than raised, so one file can't
+    stop the service: a malformed file is retried if it gets rewritten, and
+    a database or file error keeps it pending for RETRY_SECONDS.
+    """
+    name = os.path.basename(path)
+    try:
+        # Not bulk: dashboards may have the database open
+        stats = ingest_files([path], "group3", db_path, verbose=False, force=force, bulk=False)
+    except (ValueError, IndexError) as e:
+        print(f"Failed to ingest {name}: {e}")
+        return
+    except (sqlite3.Error, OSError) as e:
+        # Locked database, vanished file, ...
+        print(f"Failed to ingest {name} ({e}); retrying in {RETRY_SECONDS:g}s")
+        pending.retry(path)
+        return
+    if stats.drafts:
+        print(f"Inserted draft from {name}")
+
+
+def run(folder: str = CSV_DIR, db_path: str = DB_PATH, force_polling: bool = False,
+        settle_seconds: float = SETTLE_SECONDS, poll_seconds: float = POLL_SECONDS):
+    """
+    Ingests everything already in `folder`, then keeps watching it and
+    ingests each new or changed bot CSV once it has finished being written.
+    """
+    pending = PendingFiles(settle_seconds)
+
+    # One file at a time, so a bad file only fails itself
+    print(f"Catching up on {folder}")
+    try:
+        todo = changed_files(csv_files(folder), "group3", db_path)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Catch-up failed ({e}); retrying the folder's files in {RETRY_SECONDS:g}s")
+        todo = []
+        for path in csv_files(folder):
+            pending.retry(path)
+    for path in todo:
+        ingest_one(path, db_path, pending, force=True)
+
+    observer = None if force_polling else start_inotify_watcher(folder, pending)
+    poller = FolderPoller(folder, pending, poll_seconds) if observer is None else None
+
+    mode = "polling" if poller else "inotify"
+    print(f"Watching {folder} ({mode}); Ctrl+C to stop")
+
+    try:
+        while True:
+            if poller:
+                poller.poll()
+
+            for path in pending.ready():
+                ingest_one(path, db_path, pending)
+
+            time.sleep(TICK_SECONDS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if observer:
+            observer.stop()
+            observer.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch the bot's download folder and ingest new drafts.")
+    parser.add_argument("folder", nargs="?", default=CSV_DIR, help="Folder the bot writes CSVs to")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    parser.add_argument("--poll", action="store_true", help="Poll the folder instead of using inotify")
+    parser.add_argument("--settle", type=float, default=SETTLE_SECONDS,
+                        help="Seconds a file must stay unchanged before it is ingested")
+    parser.add_argument("--poll-interval", type=float, default=POLL_SECONDS,
+                        help="Seconds between folder scans when polling")
+    args = parser.parse_args()
+
+    run(args.folder, args.db, args.poll, args.settle, args.poll_interval)
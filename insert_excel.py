@@ -1,35 +1,199 @@
-import pandas as pd
-from sqlalchemy import create_engine
+import argparse
+import itertools
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time
 
-# ---- CONFIG ----
+from openpyxl import load_workbook
+
+from ingest import DB_PATH, RAW_TABLE_NAME, connect
+from pick_history import WORKBOOK_ERAS, sync_pick_history, to_integer
+
+# ---------------- CONFIG ----------------
 EXCEL_FILE = "All Drafts Data Compiled.xlsx"
-DB_PATH = "sqlite:///PokemonDraftData.db"
 
-# ----------------
+# Tables the workbook must not replace: the raw website CSV table also gets
+# every timestamped export appended by insert_raw_csv.py, so the compiled
+# sheet is only a subset of it.
+SKIP_TABLES = {RAW_TABLE_NAME}
 
-engine = create_engine(DB_PATH)
+# Columns stored as INTEGER. Values that aren't a number ("2-for-1",
+# "Free", ...) are stored as NULL, with the original text in <column>_note.
+INTEGER_COLUMNS = {"cost"}
 
-# Load Excel file
-xls = pd.ExcelFile(EXCEL_FILE)
+STAGING_PREFIX = "_staging_"
+# ----------------------------------------
 
-for sheet_name in xls.sheet_names:
-    df = pd.read_excel(xls, sheet_name=sheet_name)
 
-    # Normalize column names
-    df.columns = (
-        df.columns
-        .str.strip()
-        .str.lower()
-        .str.replace(" ", "_")
-    )
+@dataclass
+class SheetStats:
+    sheet: str
+    table: str
+    rows: int = 0
+    # column -> values that weren't a number
+    coerced: dict = field(default_factory=dict)
+
+    def summary(self) -> str:
+        notes = ", ".join(f"{n} non-numeric {c}" for c, n in self.coerced.items() if n)
+        return f"'{self.sheet}' → {self.table}: {self.rows} rows" + (f" ({notes})" if notes else "")
+
+
+# --------------------
+# Sheet → table
+# --------------------
+def table_name(sheet_name: str) -> str:
+    return sheet_name.strip().lower().replace(" ", "_")
+
+
+def column_name(header) -> str:
+    return str(header).strip().lower().replace(" ", "_")
+
+
+def quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def to_sql_value(value):
+    # Same text layout the earlier pandas/SQLAlchemy loads wrote
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="microseconds")
+    if isinstance(value, date):
+        return datetime.combine(value, dt_time()).isoformat(sep=" ", timespec="microseconds")
+    if isinstance(value, dt_time):
+        return value.isoformat()
+    return value
+
+
+def declared_type(value) -> str:
+    if isinstance(value, bool) or isinstance(value, int):
+        return "BIGINT"
+    if isinstance(value, float):
+        return "FLOAT"
+    if isinstance(value, (datetime, date)):
+        return "DATETIME"
+    return "TEXT"
+
 
-    table_name = sheet_name.lower().replace(" ", "_")
+# --------------------
+# Loading
+# --------------------
+def stage_sheet(conn: sqlite3.Connection, worksheet, stats: SheetStats) -> str | None:
+    """
+    Streams one worksheet into a fresh staging table on the caller's
+    transaction and returns its name (None for an empty sheet). Only the
+    current row is held in memory.
+    """
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, None)
+    if not header or all(h is None for h in header):
+        return None
 
-    df.to_sql(
-        table_name,
-        engine,
-        if_exists="replace",   # use "append" if rerunning later
-        index=False
+    # Trailing blank header cells are formatting, not columns
+    width = max(i for i, h in enumerate(header) if h is not None) + 1
+    columns = [column_name(h) if h is not None else f"column_{i + 1}" for i, h in enumerate(header[:width])]
+
+    def data_rows():
+        for row in rows:
+            row = tuple(row[:width]) + (None,) * (width - len(row))
+            if any(v is not None for v in row):
+                yield row
+
+    body = data_rows()
+    first = next(body, None)
+
+    integer_at = [i for i, c in enumerate(columns) if c in INTEGER_COLUMNS]
+    types = [
+        "INTEGER" if i in integer_at else declared_type(first[i] if first else None)
+        for i in range(width)
+    ]
+    all_columns = columns + [f"{columns[i]}_note" for i in integer_at]
+    types += ["TEXT"] * len(integer_at)
+
+    staging = STAGING_PREFIX + stats.table
+    conn.execute(f"DROP TABLE IF EXISTS {quote(staging)}")
+    conn.execute(
+        f"CREATE TABLE {quote(staging)} ("
+        + ", ".join(f"{quote(c)} {t}" for c, t in zip(all_columns, types))
+        + ")"
     )
 
-    print(f"Inserted sheet '{sheet_name}' → table '{table_name}'")
\ No newline at end of file
+    stats.coerced = {columns[i]: 0 for i in integer_at}
+
+    def convert(row):
+        stats.rows += 1
+        out = [to_sql_value(v) for v in row]
+        notes = []
+        for i in integer_at:
+            number = to_integer(row[i])
+            if number is None and row[i] is not None:
+                stats.coerced[columns[i]] += 1
+                notes.append(str(row[i]).strip())
+            else:
+                notes.append(None)
+            out[i] = number
+        return out + notes
+
+    if first is not None:
+        conn.executemany(
+            f"INSERT INTO {quote(staging)} VALUES ({', '.join('?' * len(all_columns))})",
+            map(convert, itertools.chain([first], body))
+        )
+    return staging
+
+
+def load_workbook_tables(excel_file: str = EXCEL_FILE, db_path: str = DB_PATH,
+                         verbose: bool = True) -> list[SheetStats]:
+    """
+    Loads every sheet of `excel_file` into the table named after it.
+
+    The workbook is read in read-only mode, one row at a time. Each sheet
+    goes into a staging table, and all staging tables are renamed over the
+    live ones in the same transaction, so readers see either the old tables
+    or the new ones, never a missing or half-written table. The spreadsheet
+    eras of pick_history are reloaded in that transaction too.
+    """
+    started = time.perf_counter()
+    workbook = load_workbook(excel_file, read_only=True, data_only=True)
+    conn = connect(db_path)
+    loaded = []
+    try:
+        with conn:
+            # Explicit, so the staging DDL is part of the transaction too
+            conn.execute("BEGIN")
+            staged = []
+            for worksheet in workbook.worksheets:
+                stats = SheetStats(worksheet.title, table_name(worksheet.title))
+                if stats.table in SKIP_TABLES:
+                    if verbose:
+                        print(f"Skipped '{stats.sheet}' ({stats.table} is filled by the raw CSV ingest)")
+                    continue
+                staging = stage_sheet(conn, worksheet, stats)
+                if staging is None:
+                    continue
+                staged.append((staging, stats))
+
+            # The swap: nothing above is visible to readers until this commits
+            for staging, stats in staged:
+                conn.execute(f"DROP TABLE IF EXISTS {quote(stats.table)}")
+                conn.execute(f"ALTER TABLE {quote(staging)} RENAME TO {quote(stats.table)}")
+                loaded.append(stats)
+            sync_pick_history(conn, WORKBOOK_ERAS)
+    finally:
+        conn.close()
+        workbook.close()
+
+    if verbose:
+        for stats in loaded:
+            print(f"Inserted sheet {stats.summary()}")
+        print(f"Loaded {len(loaded)} sheets in {time.perf_counter() - started:.2f}s")
+    return loaded
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load the compiled drafts workbook into the legacy tables.")
+    parser.add_argument("excel_file", nargs="?", default=EXCEL_FILE)
+    parser.add_argument("--db", default=DB_PATH)
+    args = parser.parse_args()
+
+    load_workbook_tables(args.excel_file, args.db)
@@ -0,0 +1,277 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+# ---------------- CONFIG ----------------
+# The debug panel is shown with ?debug=1 in the URL; ?debug=trace also
+# appends every rerun's trace to TRACE_LOG. ?debug=0 turns it off again.
+# Both are off unless the server opts in through DEBUG_ENV: "panel" allows
+# ?debug=1, "trace" allows ?debug=trace as well.
+DEBUG_ENV = "DASHBOARD_DEBUG"
+DEBUG_PARAM = "debug"
+TRACE_LOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard_trace.log")
+# Once TRACE_LOG reaches this size it is moved to TRACE_LOG + ".1",
+# replacing the previous one
+TRACE_LOG_MAX_BYTES = 5 * 1024 * 1024
+# Queries at least this slow get their EXPLAIN QUERY PLAN in the trace log
+SLOW_QUERY_MS = 100.0
+# ----------------------------------------
+
+
+# --------------------
+# Traces
+# --------------------
+@dataclass
+class Event:
+    """
+    One timed step of a rerun: a query, a page section, or data sent to
+    the browser.
+    """
+    kind: str                 # "query" | "section" | "sent"
+    name: str
+    ms: float
+    section: str | None = None
+    rows: int | None = None
+    cache: str | None = None  # "hit" | "miss"
+    bytes: int | None = None
+    backend: str | None = None
+    sql: str | None = None
+    params: list | None = None
+    db_path: str | None = None
+
+
+@dataclass
+class Trace:
+    """
+    Everything recorded during one script run of one session.
+    """
+    page: str
+    log: bool = False
+    started: float = field(default_factory=time.perf_counter)
+    created: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    events: list = field(default_factory=list)
+    images: dict = field(default_factory=lambda: {"hits": 0, "misses": 0, "encode_ms": 0.0})
+    total_ms: float | None = None
+    _section: tuple | None = None
+
+    def queries(self) -> list:
+        return [e for e in self.events if e.kind == "query"]
+
+    def summary(self) -> dict:
+        queries = self.queries()
+        return {
+            "total_ms": self.total_ms,
+            "queries": len(queries),
+            "query_ms": sum(e.ms for e in queries),
+            "cache_hits": sum(e.cache == "hit" for e in queries),
+            "cache_misses": sum(e.cache == "miss" for e in queries),
+            "bytes_sent": sum(e.bytes or 0 for e in self.events if e.kind == "sent"),
+            **{f"images_{key}": value for key, value in self.images.items()},
+        }
+
+
+# Streamlit runs each session's script on its own thread, so the trace
+# being recorded lives in a thread-local. With no trace (the normal case)
+# every record_* call returns straight away.
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+def current() -> Trace | None:
+    return getattr(_local, "trace", None)
+
+
+def start_trace(page: str, log: bool = False) -> Trace:
+    """
+    Starts recording this thread's rerun. Everything up to the first
+    section() call is timed as a section named after the page.
+    """
+    trace = _local.trace = Trace(page, log)
+    trace._section = (page, trace.started)
+    return trace
+
+
+def end_trace() -> Trace | None:
+    """
+    Closes the open section, stops recording and, if the trace was started
+    with log=True, appends it to TRACE_LOG.
+    """
+    trace = current()
+    if trace is None:
+        return None
+    _close_section(trace)
+    trace.total_ms = (time.perf_counter() - trace.started) * 1000
+    _local.trace = None
+
+    if trace.log:
+        write_trace(trace)
+    return trace
+
+
+def _parse_mode(value) -> str | None:
+    value = (value or "").strip().lower()
+    if value in ("", "0", "false", "off", "no"):
+        return None
+    return "trace" if value == "trace" else "panel"
+
+
+def debug_mode(value) -> str | None:
+    """
+    Reads the ?debug= value: None (off), "panel" or "trace", capped at what
+    the DEBUG_ENV environment variable allows.
+    """
+    requested = _parse_mode(value)
+    allowed = _parse_mode(os.environ.get(DEBUG_ENV))
+    if requested is None or allowed is None:
+        return None
+    return "trace" if requested == allowed == "trace" else "panel"
+
+
+# --------------------
+# Recording
+# --------------------
+def _close_section(trace: Trace):
+    if trace._section is not None:
+        name, started = trace._section
+        trace.events.append(Event("section", name, (time.perf_counter() - started) * 1000))
+        trace._section = None
+
+
+def section(name: str):
+    """
+    Starts timing a named part of the page; it runs until the next
+    section() call or the end of the rerun. Queries and sends are tagged
+    with the section they happened in.
+    """
+    trace = current()
+    if trace is None:
+        return
+    _close_section(trace)
+    trace._section = (name, time.perf_counter())
+
+
+def _query_name(sql: str) -> str:
+    import queries
+
+    for name, (named_sql, _) in queries.NAMED_QUERIES.items():
+        if named_sql == sql:
+            return name
+    first_line = next((line.strip() for line in sql.splitlines() if line.strip()), "")
+    return first_line[:60]
+
+
+def record_query(sql: str, params, seconds: float, rows: int | None, cache: str,
+                 backend: str = "sqlite", db_path: str | None = None):
+    trace = current()
+    if trace is None:
+        return
+    trace.events.append(Event(
+        "query",
+        _query_name(sql),
+        seconds * 1000,
+        section=trace._section[0] if trace._section else None,
+        rows=rows,
+        cache=cache,
+        backend=backend,
+        sql=sql,
+        params=list(params) if params is not None and not isinstance(params, dict) else params,
+        db_path=db_path,
+    ))
+
+
+def record_image(cache: str, seconds: float = 0.0):
+    trace = current()
+    if trace is None:
+        return
+    trace.images["hits" if cache == "hit" else "misses"] += 1
+    trace.images["encode_ms"] += seconds * 1000
+
+
+def _payload_bytes(payload) -> int | None:
+    """
+    Roughly what Streamlit sends for `payload`: Arrow IPC for frames, the
+    Vega-Lite spec (inline data and sprite data URIs included) for charts.
+    """
+    import pandas as pd
+
+    if isinstance(payload, pd.DataFrame):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return int(payload.memory_usage(deep=True).sum())
+        table = pa.Table.from_pandas(payload)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().size
+    if hasattr(payload, "to_json"):
+        return len(payload.to_json().encode("utf-8"))
+    return None
+
+
+def sent(payload, name: str | None = None):
+    """
+    Records the size of a frame or chart about to be handed to Streamlit
+    and returns it unchanged: st.dataframe(sent(df), ...).
+    """
+    trace = current()
+    if trace is None:
+        return payload
+    started = time.perf_counter()
+    size = _payload_bytes(payload)
+    trace.events.append(Event(
+        "sent",
+        name or type(payload).__name__,
+        (time.perf_counter() - started) * 1000,
+        section=trace._section[0] if trace._section else None,
+        rows=len(payload) if hasattr(payload, "__len__") else None,
+        bytes=size,
+    ))
+    return payload
+
+
+# --------------------
+# Trace log
+# --------------------
+def explain(sql: str, params, db_path: str) -> list[str]:
+    from data_access import get_connection
+
+    try:
+        rows = get_connection(db_path).execute(f"EXPLAIN QUERY PLAN {sql}", params or ()).fetchall()
+    except sqlite3.Error as e:
+        return [f"(no plan: {e})"]
+    return [row[-1] for row in rows]
+
+
+def write_trace(trace: Trace, path: str = TRACE_LOG, slow_ms: float = SLOW_QUERY_MS,
+                max_bytes: int = TRACE_LOG_MAX_BYTES):
+    """
+    Appends `trace` to `path` as one JSON line. Queries that missed the
+    cache and took at least `slow_ms` get their SQLite query plan attached.
+    A log over `max_bytes` is rotated to `path` + ".1" first.
+    """
+    events = []
+    for event in trace.events:
+        record = {k: v for k, v in asdict(event).items() if v is not None and k not in ("sql", "db_path")}
+        record["ms"] = round(event.ms, 3)
+        if event.kind == "query" and event.cache == "miss" and event.ms >= slow_ms and event.db_path:
+            record["sql"] = event.sql
+            record["plan"] = explain(event.sql, event.params, event.db_path)
+        events.append(record)
+
+    line = json.dumps({
+        "created": trace.created,
+        "page": trace.page,
+        **{k: round(v, 3) if isinstance(v, float) else v for k, v in trace.summary().items()},
+        "events": events,
+    }, default=str)
+
+    with _log_lock:
+        if os.path.exists(path) and os.path.getsize(path) >= max_bytes:
+            os.replace(path, path + ".1")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import sqlite3
+from dataclasses import dataclass
+
+
+@dataclass
+class SourceFile:
+    """
+    A CSV on disk plus its fingerprint. `parsed` is the parser's output
+    (None when the parser chose to skip the file).
+    """
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    parsed: object = None
+
+
+def manifest_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def fingerprint(path: str) -> tuple[int, int, str]:
+    """
+    Returns (size, mtime_ns, sha256) for a file.
+    """
+    stat = os.stat(path)
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+    return stat.st_size, stat.st_mtime_ns, digest.hexdigest()
+
+
+# ---------- LOOKUPS ----------
+def load_manifest(conn: sqlite3.Connection, source_format: str) -> dict[str, tuple[int, int]]:
+    """
+    path -> (size, mtime_ns) for every file already processed in this format.
+    """
+    rows = conn.execute(
+        "SELECT path, size, mtime_ns FROM ingest_manifest WHERE source_format = ?",
+        (source_format,)
+    )
+    return {path: (size, mtime_ns) for path, size, mtime_ns in rows}
+
+
+def known_hashes(conn: sqlite3.Connection, source_format: str) -> set[str]:
+    rows = conn.execute(
+        "SELECT sha256 FROM ingest_manifest WHERE source_format = ?",
+        (source_format,)
+    )
+    return {row[0] for row in rows}
+
+
+def changed_paths(conn: sqlite3.Connection, paths: list[str], source_format: str) -> list[str]:
+    """
+    Drops files whose size and mtime match the manifest. Only stat() is
+    called; unchanged files are never opened.
+    """
+    manifest = load_manifest(conn, source_format)
+
+    changed = []
+    for path in paths:
+        recorded = manifest.get(manifest_path(path))
+        if recorded is not None:
+            stat = os.stat(path)
+            if recorded == (stat.st_size, stat.st_mtime_ns):
+                continue
+        changed.append(path)
+
+    return changed
+
+
+# ---------- WRITES ----------
+def record_sources(conn: sqlite3.Connection, sources: list[SourceFile], source_format: str):
+    """
+    Upserts manifest rows on the caller's transaction.
+    """
+    conn.executemany(
+        """
+        INSERT INTO ingest_manifest (path, source_format, size, mtime_ns, sha256)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (path) DO UPDATE SET
+            source_format = excluded.source_format,
+            size = excluded.size,
+            mtime_ns = excluded.mtime_ns,
+            sha256 = excluded.sha256,
+            ingested_at = CURRENT_TIMESTAMP
+        """,
+        [
+            (manifest_path(s.path), source_format, s.size, s.mtime_ns, s.sha256)
+            for s in sources
+        ]
+    )
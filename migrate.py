@@ -0,0 +1,162 @@
+import argparse
+import os
+import re
+import sqlite3
+
+from pick_history import sync_pick_history
+from queries import NAMED_QUERIES
+
+# --------------------
+# Configuration
+# --------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "PokemonDraftData.db")
+MIGRATIONS_DIR = os.path.join(BASE_DIR, "migrations")
+
+# Migration files are named NNNN_description.sql; NNNN is the schema version
+# the database is at once the file has been applied (stored in PRAGMA user_version).
+MIGRATION_FILE = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+
+# ---------- MIGRATION DISCOVERY ----------
+def discover_migrations(migrations_dir: str = MIGRATIONS_DIR) -> list[tuple[int, str, str]]:
+    """
+    Returns [(version, name, path), ...] sorted by version.
+    """
+    migrations = []
+    for file in os.listdir(migrations_dir):
+        match = MIGRATION_FILE.match(file)
+        if not match:
+            continue
+        migrations.append((int(match.group(1)), match.group(2), os.path.join(migrations_dir, file)))
+
+    migrations.sort()
+
+    versions = [m[0] for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration versions in {migrations_dir}")
+
+    return migrations
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def pending_migrations(conn: sqlite3.Connection, migrations_dir: str = MIGRATIONS_DIR):
+    version = current_version(conn)
+    return [m for m in discover_migrations(migrations_dir) if m[0] > version]
+
+
+# ---------- MIGRATION RUNNER ----------
+def apply_migration(conn: sqlite3.Connection, version: int, path: str):
+    with open(path, encoding="utf-8") as f:
+        sql = f.read()
+
+    # executescript() commits any open transaction first, so the BEGIN/COMMIT
+    # has to live inside the script for the schema change and the version
+    # bump to land atomically.
+    try:
+        conn.executescript(f"BEGIN;\n{sql}\nPRAGMA user_version = {version};\nCOMMIT;")
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+def migrate(conn: sqlite3.Connection, target: int | None = None,
+            migrations_dir: str = MIGRATIONS_DIR, verbose: bool = True) -> int:
+    """
+    Applies every pending migration up to `target` (default: latest) and
+    returns the resulting schema version.
+    """
+    for version, name, path in pending_migrations(conn, migrations_dir):
+        if target is not None and version > target:
+            break
+        apply_migration(conn, version, path)
+        if verbose:
+            print(f"Applied migration {version:04d}_{name}")
+
+    return current_version(conn)
+
+
+def upgrade(conn: sqlite3.Connection, verbose: bool = False) -> int:
+    """
+    Applies every pending migration and, if there were any, loads the
+    pick_history eras a migration can't backfill. Every writer and the
+    dashboard call this on startup, so the committed database (kept at its
+    original schema) is upgraded wherever it's used. Returns the schema
+    version.
+    """
+    if not pending_migrations(conn):
+        return current_version(conn)
+
+    version = migrate(conn, verbose=verbose)
+    with conn:
+        sync_pick_history(conn)
+    return version
+
+
+# ---------- QUERY PLAN REPORT ----------
+def query_plans(conn: sqlite3.Connection) -> dict[str, list[str]]:
+    """
+    EXPLAIN QUERY PLAN for every named dashboard/ingest query.
+    """
+    plans = {}
+    for name, (sql, params) in NAMED_QUERIES.items():
+        try:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        except sqlite3.OperationalError as e:
+            plans[name] = [f"ERROR: {e}"]
+            continue
+        plans[name] = [row[3] for row in rows]
+    return plans
+
+
+def _table_scans(plan: list[str]) -> int:
+    # "SCAN x USING [COVERING] INDEX" walks an index, not the table itself
+    return sum(1 for step in plan if step.startswith("SCAN") and "INDEX" not in step)
+
+
+def print_plan_report(before: dict, after: dict):
+    for name in before:
+        old = before[name]
+        new = after.get(name, [])
+        print(f"\n=== {name} (table scans: {_table_scans(old)} -> {_table_scans(new)}) ===")
+        print("  before:")
+        for step in old:
+            print(f"    {step}")
+        print("  after:")
+        for step in new:
+            print(f"    {step}")
+
+
+# ---------- RUN ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply schema migrations to the draft database.")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    parser.add_argument("--target", type=int, default=None, help="Stop at this schema version")
+    parser.add_argument("--report", action="store_true",
+                        help="Print EXPLAIN QUERY PLAN for the dashboard queries before and after migrating")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Migrate an in-memory copy instead of the database file")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+
+    if args.dry_run:
+        memory = sqlite3.connect(":memory:")
+        conn.backup(memory)
+        conn.close()
+        conn = memory
+
+    print(f"Schema version: {current_version(conn)}")
+
+    before = query_plans(conn) if args.report else None
+    version = migrate(conn, args.target) if args.target is not None else upgrade(conn, verbose=True)
+    print(f"Schema version now: {version}")
+
+    if args.report:
+        print_plan_report(before, query_plans(conn))
+
+    conn.close()
@@ -0,0 +1,30 @@
+-- Baseline v2 schema (previously created by CreateTables.py).
+-- Uses IF NOT EXISTS so databases that already have these tables are
+-- simply stamped as version 1.
+
+CREATE TABLE IF NOT EXISTS draft_event_v2 (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    external_draft_id TEXT,
+    date_time DATETIME,
+    total_pokemon_sold INTEGER,
+    patch TEXT
+);
+
+CREATE TABLE IF NOT EXISTS draft_players_v2 (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    draft_id INTEGER,
+    player_name TEXT,
+    starting_money INTEGER,
+    remaining_money INTEGER,
+    FOREIGN KEY (draft_id) REFERENCES draft_event_v2(id)
+);
+
+CREATE TABLE IF NOT EXISTS draft_pokemon_v2 (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    draft_id INTEGER,
+    draft_order INTEGER,
+    pokemon TEXT,
+    drafted_by TEXT,
+    cost INTEGER,
+    FOREIGN KEY (draft_id) REFERENCES draft_event_v2(id)
+);
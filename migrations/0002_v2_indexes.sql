@@ -0,0 +1,42 @@
+-- Covering indexes for the dashboard queries and the ingest duplicate check.
+
+-- ---------- draft_event_v2 ----------
+-- Duplicate check in ParseAndInsertGroup3.draft_exists
+CREATE UNIQUE INDEX IF NOT EXISTS ux_draft_event_v2_external_id
+    ON draft_event_v2 (external_draft_id);
+
+-- WHERE de.patch = ? / SELECT DISTINCT patch
+CREATE INDEX IF NOT EXISTS ix_draft_event_v2_patch
+    ON draft_event_v2 (patch);
+
+-- Drafts per day
+CREATE INDEX IF NOT EXISTS ix_draft_event_v2_date
+    ON draft_event_v2 (date(date_time));
+
+-- ---------- draft_players_v2 ----------
+-- Join on draft_id + COUNT(DISTINCT player_name)
+CREATE INDEX IF NOT EXISTS ix_draft_players_v2_draft
+    ON draft_players_v2 (draft_id, player_name);
+
+-- GROUP BY LOWER(player_name) in the signature queries
+CREATE INDEX IF NOT EXISTS ix_draft_players_v2_player_lower
+    ON draft_players_v2 (LOWER(player_name), draft_id);
+
+-- ---------- draft_pokemon_v2 ----------
+-- Per-draft pick order and joins from draft_event_v2 filtered by patch
+CREATE INDEX IF NOT EXISTS ix_draft_pokemon_v2_draft_order
+    ON draft_pokemon_v2 (draft_id, draft_order, pokemon, drafted_by, cost);
+
+-- GROUP BY pokemon with MIN/MAX/AVG(cost), joined to draft_event_v2
+CREATE INDEX IF NOT EXISTS ix_draft_pokemon_v2_pokemon_cost
+    ON draft_pokemon_v2 (pokemon, cost, draft_id);
+
+-- GROUP BY pokemon, LOWER(drafted_by) with AVG(cost)
+CREATE INDEX IF NOT EXISTS ix_draft_pokemon_v2_pokemon_drafter
+    ON draft_pokemon_v2 (pokemon, LOWER(drafted_by), cost);
+
+-- GROUP BY LOWER(drafted_by), pokemon with COUNT(DISTINCT draft_id)
+CREATE INDEX IF NOT EXISTS ix_draft_pokemon_v2_drafter_lower
+    ON draft_pokemon_v2 (LOWER(drafted_by), pokemon, draft_id);
+
+ANALYZE;
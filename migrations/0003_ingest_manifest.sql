@@ -0,0 +1,15 @@
+-- One row per source file the ingest scripts have processed.
+-- Files whose (path, size, mtime_ns) still match are skipped without being
+-- opened; files whose content hash was already ingested are skipped too.
+
+CREATE TABLE IF NOT EXISTS ingest_manifest (
+    path TEXT PRIMARY KEY,
+    source_format TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    ingested_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_ingest_manifest_hash
+    ON ingest_manifest (source_format, sha256);
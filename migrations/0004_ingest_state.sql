@@ -0,0 +1,11 @@
+-- Single-row change counter. Bumped in the same transaction as every ingest
+-- that adds drafts, so dashboards can cheaply tell when to refresh.
+
+CREATE TABLE IF NOT EXISTS ingest_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    change_counter INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME
+);
+
+INSERT OR IGNORE INTO ingest_state (id, change_counter, updated_at)
+VALUES (1, 0, CURRENT_TIMESTAMP);
@@ -0,0 +1,56 @@
+-- Running totals per Pokémon, per (patch, Pokémon) and per (Pokémon, player).
+-- Maintained by aggregates.update_aggregates() in the same transaction as
+-- every draft insert; aggregates.py --rebuild recomputes them from scratch.
+-- drafted_by is stored lower-cased, matching LOWER(drafted_by) in the
+-- dashboard queries.
+
+CREATE TABLE IF NOT EXISTS agg_pokemon (
+    pokemon TEXT PRIMARY KEY,
+    times_drafted INTEGER NOT NULL,
+    total_cost INTEGER NOT NULL,
+    min_cost INTEGER,
+    max_cost INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS agg_pokemon_patch (
+    patch TEXT NOT NULL,
+    pokemon TEXT NOT NULL,
+    times_drafted INTEGER NOT NULL,
+    total_cost INTEGER NOT NULL,
+    min_cost INTEGER,
+    max_cost INTEGER,
+    PRIMARY KEY (patch, pokemon)
+);
+
+CREATE TABLE IF NOT EXISTS agg_pokemon_player (
+    pokemon TEXT NOT NULL,
+    drafted_by TEXT NOT NULL,
+    times_drafted INTEGER NOT NULL,
+    total_cost INTEGER NOT NULL,
+    min_cost INTEGER,
+    max_cost INTEGER,
+    PRIMARY KEY (pokemon, drafted_by)
+);
+
+CREATE INDEX IF NOT EXISTS ix_agg_pokemon_player_drafted_by
+    ON agg_pokemon_player (drafted_by, times_drafted);
+
+-- ---------- backfill ----------
+INSERT INTO agg_pokemon (pokemon, times_drafted, total_cost, min_cost, max_cost)
+SELECT p.pokemon, COUNT(*), SUM(p.cost), MIN(p.cost), MAX(p.cost)
+FROM draft_pokemon_v2 p
+JOIN draft_event_v2 e ON p.draft_id = e.id
+GROUP BY p.pokemon;
+
+INSERT INTO agg_pokemon_patch (patch, pokemon, times_drafted, total_cost, min_cost, max_cost)
+SELECT e.patch, p.pokemon, COUNT(*), SUM(p.cost), MIN(p.cost), MAX(p.cost)
+FROM draft_pokemon_v2 p
+JOIN draft_event_v2 e ON p.draft_id = e.id
+WHERE e.patch IS NOT NULL
+GROUP BY e.patch, p.pokemon;
+
+INSERT INTO agg_pokemon_player (pokemon, drafted_by, times_drafted, total_cost, min_cost, max_cost)
+SELECT p.pokemon, LOWER(p.drafted_by), COUNT(*), SUM(p.cost), MIN(p.cost), MAX(p.cost)
+FROM draft_pokemon_v2 p
+JOIN draft_event_v2 e ON p.draft_id = e.id
+GROUP BY p.pokemon, LOWER(p.drafted_by);
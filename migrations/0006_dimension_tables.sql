@@ -0,0 +1,172 @@
+-- Player and Pokémon dimension tables with integer surrogate keys.
+--
+-- player / pokemon hold one row per real player or species with its display
+-- name. *_alias maps every known spelling, keyed by LOWER(TRIM(name)), to that
+-- row, so case variants and forms like "Mega Falinks" resolve to one id.
+-- The fact tables keep their original text columns and gain integer
+-- foreign keys; dimensions.py registers new names on ingest and handles
+-- renames and merges.
+
+CREATE TABLE IF NOT EXISTS player (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS player_alias (
+    alias_key TEXT PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES player(id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS pokemon (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS pokemon_alias (
+    alias_key TEXT PRIMARY KEY,
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon(id)
+) WITHOUT ROWID;
+
+ALTER TABLE draft_players_v2 ADD COLUMN player_id INTEGER REFERENCES player(id);
+ALTER TABLE draft_pokemon_v2 ADD COLUMN pokemon_id INTEGER REFERENCES pokemon(id);
+ALTER TABLE draft_pokemon_v2 ADD COLUMN drafted_by_id INTEGER REFERENCES player(id);
+
+-- ---------- backfill players ----------
+-- Display name = most common spelling of each key (earliest on ties);
+-- ids are handed out in order of first appearance.
+WITH names AS (
+    SELECT player_name AS name, id AS seen_at FROM draft_players_v2
+    UNION ALL
+    SELECT drafted_by, id + (SELECT COALESCE(MAX(id), 0) FROM draft_players_v2)
+    FROM draft_pokemon_v2
+),
+spellings AS (
+    SELECT name, LOWER(TRIM(name)) AS alias_key, COUNT(*) AS uses, MIN(seen_at) AS first_seen
+    FROM names
+    WHERE name IS NOT NULL AND TRIM(name) <> ''
+    GROUP BY name
+),
+ranked AS (
+    SELECT *,
+           ROW_NUMBER() OVER (PARTITION BY alias_key ORDER BY uses DESC, first_seen) AS rn,
+           MIN(first_seen) OVER (PARTITION BY alias_key) AS key_first_seen
+    FROM spellings
+)
+INSERT INTO player (name)
+SELECT name FROM ranked WHERE rn = 1 ORDER BY key_first_seen;
+
+INSERT OR IGNORE INTO player_alias (alias_key, player_id)
+SELECT LOWER(TRIM(name)), id FROM player;
+
+-- ---------- backfill Pokémon ----------
+WITH spellings AS (
+    SELECT pokemon AS name, LOWER(TRIM(pokemon)) AS alias_key, COUNT(*) AS uses, MIN(id) AS first_seen
+    FROM draft_pokemon_v2
+    WHERE pokemon IS NOT NULL AND TRIM(pokemon) <> ''
+    GROUP BY pokemon
+),
+ranked AS (
+    SELECT *,
+           ROW_NUMBER() OVER (PARTITION BY alias_key ORDER BY uses DESC, first_seen) AS rn,
+           MIN(first_seen) OVER (PARTITION BY alias_key) AS key_first_seen
+    FROM spellings
+)
+INSERT INTO pokemon (name)
+SELECT name FROM ranked WHERE rn = 1 ORDER BY key_first_seen;
+
+INSERT OR IGNORE INTO pokemon_alias (alias_key, pokemon_id)
+SELECT LOWER(TRIM(name)), id FROM pokemon;
+
+-- Spelling variants that used to be patched by fix_mega_falinks.py
+INSERT OR IGNORE INTO pokemon (name)
+SELECT 'Falinks'
+WHERE NOT EXISTS (SELECT 1 FROM pokemon_alias WHERE alias_key = 'falinks');
+
+INSERT OR IGNORE INTO pokemon_alias (alias_key, pokemon_id)
+SELECT 'falinks', id FROM pokemon WHERE name = 'Falinks';
+
+UPDATE pokemon_alias
+SET pokemon_id = (SELECT pokemon_id FROM pokemon_alias WHERE alias_key = 'falinks')
+WHERE alias_key = 'mega falinks';
+
+INSERT OR IGNORE INTO pokemon_alias (alias_key, pokemon_id)
+SELECT 'mega falinks', pokemon_id FROM pokemon_alias WHERE alias_key = 'falinks';
+
+DELETE FROM pokemon
+WHERE id NOT IN (SELECT pokemon_id FROM pokemon_alias);
+
+-- ---------- foreign keys on the fact tables ----------
+UPDATE draft_players_v2
+SET player_id = (SELECT player_id FROM player_alias WHERE alias_key = LOWER(TRIM(player_name)));
+
+UPDATE draft_pokemon_v2
+SET pokemon_id = (SELECT pokemon_id FROM pokemon_alias WHERE alias_key = LOWER(TRIM(pokemon))),
+    drafted_by_id = (SELECT player_id FROM player_alias WHERE alias_key = LOWER(TRIM(drafted_by)));
+
+CREATE INDEX IF NOT EXISTS ix_draft_players_v2_player_id
+    ON draft_players_v2 (player_id, draft_id);
+
+CREATE INDEX IF NOT EXISTS ix_draft_pokemon_v2_pokemon_id
+    ON draft_pokemon_v2 (pokemon_id, cost, draft_id);
+
+CREATE INDEX IF NOT EXISTS ix_draft_pokemon_v2_drafted_by_id
+    ON draft_pokemon_v2 (drafted_by_id, pokemon_id, draft_id);
+
+-- ---------- aggregates keyed by id ----------
+DROP TABLE IF EXISTS agg_pokemon;
+DROP TABLE IF EXISTS agg_pokemon_patch;
+DROP TABLE IF EXISTS agg_pokemon_player;
+
+CREATE TABLE agg_pokemon (
+    pokemon_id INTEGER PRIMARY KEY,
+    times_drafted INTEGER NOT NULL,
+    total_cost INTEGER NOT NULL,
+    min_cost INTEGER,
+    max_cost INTEGER
+);
+
+CREATE TABLE agg_pokemon_patch (
+    patch TEXT NOT NULL,
+    pokemon_id INTEGER NOT NULL,
+    times_drafted INTEGER NOT NULL,
+    total_cost INTEGER NOT NULL,
+    min_cost INTEGER,
+    max_cost INTEGER,
+    PRIMARY KEY (patch, pokemon_id)
+);
+
+CREATE TABLE agg_pokemon_player (
+    pokemon_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    times_drafted INTEGER NOT NULL,
+    total_cost INTEGER NOT NULL,
+    min_cost INTEGER,
+    max_cost INTEGER,
+    PRIMARY KEY (pokemon_id, player_id)
+);
+
+CREATE INDEX ix_agg_pokemon_player_player
+    ON agg_pokemon_player (player_id, times_drafted);
+
+INSERT INTO agg_pokemon (pokemon_id, times_drafted, total_cost, min_cost, max_cost)
+SELECT p.pokemon_id, COUNT(*), SUM(p.cost), MIN(p.cost), MAX(p.cost)
+FROM draft_pokemon_v2 p
+JOIN draft_event_v2 e ON p.draft_id = e.id
+WHERE p.pokemon_id IS NOT NULL
+GROUP BY p.pokemon_id;
+
+INSERT INTO agg_pokemon_patch (patch, pokemon_id, times_drafted, total_cost, min_cost, max_cost)
+SELECT e.patch, p.pokemon_id, COUNT(*), SUM(p.cost), MIN(p.cost), MAX(p.cost)
+FROM draft_pokemon_v2 p
+JOIN draft_event_v2 e ON p.draft_id = e.id
+WHERE e.patch IS NOT NULL AND p.pokemon_id IS NOT NULL
+GROUP BY e.patch, p.pokemon_id;
+
+INSERT INTO agg_pokemon_player (pokemon_id, player_id, times_drafted, total_cost, min_cost, max_cost)
+SELECT p.pokemon_id, p.drafted_by_id, COUNT(*), SUM(p.cost), MIN(p.cost), MAX(p.cost)
+FROM draft_pokemon_v2 p
+JOIN draft_event_v2 e ON p.draft_id = e.id
+WHERE p.pokemon_id IS NOT NULL AND p.drafted_by_id IS NOT NULL
+GROUP BY p.pokemon_id, p.drafted_by_id;
+
+ANALYZE;
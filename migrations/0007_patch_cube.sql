@@ -0,0 +1,63 @@
+-- Patch comparison cube: per (patch, Pokémon) cost distribution, pick rate
+-- and average draft position, so any two patches can be compared without
+-- re-aggregating the picks. pick_rate is the share of the patch's drafts in
+-- which the Pokémon was bought. Picks without a cost are left out.
+-- aggregates.update_aggregates() recomputes the rows of every patch a new
+-- draft belongs to; aggregates.py --rebuild recomputes all of them.
+
+CREATE TABLE IF NOT EXISTS patch_pokemon_stats (
+    patch TEXT NOT NULL,
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon(id),
+    times_drafted INTEGER NOT NULL,
+    drafts_drafted INTEGER NOT NULL,
+    patch_drafts INTEGER NOT NULL,
+    pick_rate REAL NOT NULL,
+    avg_cost REAL,
+    median_cost REAL,
+    p90_cost REAL,
+    avg_draft_order REAL,
+    PRIMARY KEY (patch, pokemon_id)
+);
+
+-- ---------- backfill ----------
+INSERT INTO patch_pokemon_stats (patch, pokemon_id, times_drafted, drafts_drafted, patch_drafts,
+                                 pick_rate, avg_cost, median_cost, p90_cost, avg_draft_order)
+WITH patch_drafts AS (
+    SELECT e.patch, COUNT(*) AS drafts
+    FROM draft_event_v2 e
+    WHERE e.patch IS NOT NULL
+    GROUP BY e.patch
+),
+picks AS (
+    SELECT e.patch, p.pokemon_id, p.draft_id, p.cost, p.draft_order,
+           ROW_NUMBER() OVER w - 1 AS cost_rank,
+           COUNT(*) OVER (PARTITION BY e.patch, p.pokemon_id) - 1 AS last
+    FROM draft_pokemon_v2 p
+    JOIN draft_event_v2 e ON p.draft_id = e.id
+    WHERE e.patch IS NOT NULL AND p.pokemon_id IS NOT NULL AND p.cost IS NOT NULL
+    WINDOW w AS (PARTITION BY e.patch, p.pokemon_id ORDER BY p.cost)
+)
+SELECT c.patch, c.pokemon_id,
+       COUNT(*) AS times_drafted,
+       COUNT(DISTINCT c.draft_id) AS drafts_drafted,
+       d.drafts AS patch_drafts,
+       CAST(COUNT(DISTINCT c.draft_id) AS DOUBLE) / d.drafts AS pick_rate,
+       AVG(c.cost) AS avg_cost,
+       -- linear interpolation between the two ranks around 0.5 * last
+       SUM(CASE cost_rank
+               WHEN CAST((0.5 * last) AS INTEGER)
+                   THEN cost * (1 - ((0.5 * last) - CAST((0.5 * last) AS INTEGER)))
+               WHEN CAST((0.5 * last) AS INTEGER) + 1
+                   THEN cost * ((0.5 * last) - CAST((0.5 * last) AS INTEGER))
+               ELSE 0 END) AS median_cost,
+       -- linear interpolation between the two ranks around 0.9 * last
+       SUM(CASE cost_rank
+               WHEN CAST((0.9 * last) AS INTEGER)
+                   THEN cost * (1 - ((0.9 * last) - CAST((0.9 * last) AS INTEGER)))
+               WHEN CAST((0.9 * last) AS INTEGER) + 1
+                   THEN cost * ((0.9 * last) - CAST((0.9 * last) AS INTEGER))
+               ELSE 0 END) AS p90_cost,
+       AVG(c.draft_order) AS avg_draft_order
+FROM picks c
+JOIN patch_drafts d ON d.patch = c.patch
+GROUP BY c.patch, c.pokemon_id;
@@ -0,0 +1,52 @@
+-- Every pick of every era in one typed table, so all-time statistics read
+-- one indexed table instead of a UNION over six differently typed sources.
+--
+-- era says where a row came from (see pick_history.ERAS) and source_id is
+-- its id in that source table. draft_key identifies the draft within its
+-- era: the external draft id for v2, the draft_event id for v1, and the
+-- date for the spreadsheet and website eras (one draft per date).
+-- date_time is 'YYYY-MM-DD HH:MM:SS' in every era. cost is NULL for
+-- pre-website picks whose sheet held a label ("2-for-1", "Free") instead of
+-- a price; the label is kept in cost_note.
+--
+-- The v2 era is backfilled here. The other source tables only exist in
+-- databases that loaded them, so migrate.upgrade() loads them after the
+-- migrations, and each ingest path then appends its own era.
+
+CREATE TABLE IF NOT EXISTS pick_history (
+    id INTEGER PRIMARY KEY,
+    era TEXT NOT NULL,
+    source_id INTEGER NOT NULL,
+    draft_key TEXT NOT NULL,
+    date_time TEXT NOT NULL,
+    patch TEXT,
+    draft_order INTEGER,
+    pokemon TEXT NOT NULL,
+    drafted_by TEXT,
+    cost INTEGER,
+    cost_note TEXT,
+    pokemon_id INTEGER REFERENCES pokemon(id),
+    drafted_by_id INTEGER REFERENCES player(id),
+    UNIQUE (era, source_id)
+);
+
+-- Covers the per-Pokémon all-time statistics (count, cost, first/last date)
+CREATE INDEX IF NOT EXISTS ix_pick_history_pokemon_cost
+    ON pick_history (pokemon_id, cost, date_time);
+
+CREATE INDEX IF NOT EXISTS ix_pick_history_drafted_by_id
+    ON pick_history (drafted_by_id);
+
+-- ---------- backfill v2 ----------
+INSERT OR IGNORE INTO pick_history
+    (era, source_id, draft_key, date_time, patch, draft_order, pokemon, drafted_by,
+     cost, cost_note, pokemon_id, drafted_by_id)
+SELECT 'v2', p.id, e.external_draft_id, substr(e.date_time, 1, 19), e.patch, p.draft_order,
+       p.pokemon, p.drafted_by, p.cost, NULL, p.pokemon_id, p.drafted_by_id
+FROM draft_pokemon_v2 p
+JOIN draft_event_v2 e
+    ON p.draft_id = e.id
+WHERE p.pokemon IS NOT NULL
+ORDER BY p.id;
+
+ANALYZE pick_history;
@@ -0,0 +1,60 @@
+-- Each v2 pick with the buyer's running budget: money_before is what the
+-- player had left just before the pick, spent_share the share of their
+-- budget already spent (NULL for a zero budget).
+--
+-- The bot's starting_money is only the budget when remaining_money is
+-- non-negative. remaining_money is always starting_money minus the picks'
+-- costs, and a negative value means the export put the money left at the
+-- end of the draft in starting_money; the budget is then that plus the
+-- player's spend. Picks whose buyer has no draft_players_v2 row are left
+-- out.
+--
+-- budgets.refresh_pick_budget() fills the rows of newly ingested drafts;
+-- this backfill applies the same rule in SQL.
+
+CREATE TABLE IF NOT EXISTS pick_budget (
+    pick_id INTEGER PRIMARY KEY REFERENCES draft_pokemon_v2(id),
+    draft_id INTEGER NOT NULL REFERENCES draft_event_v2(id),
+    player_id INTEGER NOT NULL REFERENCES player(id),
+    draft_order INTEGER,
+    budget INTEGER NOT NULL,
+    money_before INTEGER NOT NULL,
+    spent_share REAL
+);
+
+CREATE INDEX IF NOT EXISTS ix_pick_budget_draft_id
+    ON pick_budget (draft_id);
+
+-- ---------- backfill ----------
+INSERT INTO pick_budget (pick_id, draft_id, player_id, draft_order, budget, money_before, spent_share)
+WITH picks AS (
+    SELECT p.id, p.draft_id, p.drafted_by_id AS player_id, p.draft_order,
+           SUM(COALESCE(p.cost, 0)) OVER (
+               PARTITION BY p.draft_id, p.drafted_by_id
+               ORDER BY p.draft_order, p.id
+               ROWS UNBOUNDED PRECEDING
+           ) - COALESCE(p.cost, 0) AS spent_before,
+           SUM(COALESCE(p.cost, 0)) OVER (PARTITION BY p.draft_id, p.drafted_by_id) AS spent_total
+    FROM draft_pokemon_v2 p
+    WHERE p.drafted_by_id IS NOT NULL
+),
+players AS (
+    -- First row per player and draft
+    SELECT draft_id, player_id, starting_money, remaining_money, MIN(id)
+    FROM draft_players_v2
+    WHERE player_id IS NOT NULL AND starting_money IS NOT NULL
+    GROUP BY draft_id, player_id
+),
+budgets AS (
+    SELECT c.id, c.draft_id, c.player_id, c.draft_order, c.spent_before,
+           CASE WHEN COALESCE(pl.remaining_money, 0) >= 0 THEN pl.starting_money
+                ELSE pl.starting_money + c.spent_total
+           END AS budget
+    FROM picks c
+    JOIN players pl
+        ON pl.draft_id = c.draft_id AND pl.player_id = c.player_id
+)
+SELECT id, draft_id, player_id, draft_order, budget, budget - spent_before,
+       CASE WHEN budget > 0 THEN CAST(spent_before AS REAL) / budget END
+FROM budgets
+ORDER BY id;
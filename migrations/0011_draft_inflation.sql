@@ -0,0 +1,114 @@
+-- Per-draft price normalization, so costs from drafts with different
+-- player counts and starting_money can be compared.
+--
+-- money_in_play is the sum of the players' budgets (pick_budget's rule;
+-- players who bought nothing count their starting_money), picks_sold the
+-- picks with a price and mean_price their average. inflation is the money
+-- per pick sold relative to a standard draft: 20,000 per player over 8
+-- picks, 2,500 per pick (budgets.REFERENCE_MONEY_PER_PICK). It is NULL for
+-- drafts without player money, whose picks keep their raw cost.
+--
+-- draft_pokemon_v2.normalized_cost is cost / inflation in whole coins, and
+-- the aggregate tables carry its totals next to the raw ones, so the price
+-- views read inflation-adjusted prices from the same rows. Both are kept
+-- up to date at ingest by budgets.refresh_draft_inflation(); this backfill
+-- applies the same rule in SQL.
+
+CREATE TABLE IF NOT EXISTS draft_inflation (
+    draft_id INTEGER PRIMARY KEY REFERENCES draft_event_v2(id),
+    players INTEGER NOT NULL,
+    money_in_play INTEGER NOT NULL,
+    picks_sold INTEGER NOT NULL,
+    total_spent INTEGER NOT NULL,
+    mean_price REAL,
+    inflation REAL
+);
+
+ALTER TABLE draft_pokemon_v2 ADD COLUMN normalized_cost INTEGER;
+
+ALTER TABLE agg_pokemon ADD COLUMN total_normalized_cost INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE agg_pokemon ADD COLUMN min_normalized_cost INTEGER;
+ALTER TABLE agg_pokemon ADD COLUMN max_normalized_cost INTEGER;
+
+ALTER TABLE agg_pokemon_patch ADD COLUMN total_normalized_cost INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE agg_pokemon_patch ADD COLUMN min_normalized_cost INTEGER;
+ALTER TABLE agg_pokemon_patch ADD COLUMN max_normalized_cost INTEGER;
+
+ALTER TABLE agg_pokemon_player ADD COLUMN total_normalized_cost INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE agg_pokemon_player ADD COLUMN min_normalized_cost INTEGER;
+ALTER TABLE agg_pokemon_player ADD COLUMN max_normalized_cost INTEGER;
+
+-- ---------- backfill ----------
+INSERT INTO draft_inflation
+    (draft_id, players, money_in_play, picks_sold, total_spent, mean_price, inflation)
+WITH players AS (
+    -- First row per player and draft
+    SELECT draft_id, player_id, starting_money, MIN(id)
+    FROM draft_players_v2
+    WHERE player_id IS NOT NULL AND starting_money IS NOT NULL
+    GROUP BY draft_id, player_id
+),
+money AS (
+    SELECT pl.draft_id, COUNT(*) AS players,
+           SUM(COALESCE(b.budget, pl.starting_money)) AS money_in_play
+    FROM players pl
+    LEFT JOIN (SELECT DISTINCT draft_id, player_id, budget FROM pick_budget) b
+        ON b.draft_id = pl.draft_id AND b.player_id = pl.player_id
+    GROUP BY pl.draft_id
+),
+sold AS (
+    SELECT draft_id, COUNT(cost) AS picks_sold, SUM(cost) AS total_spent, AVG(cost) AS mean_price
+    FROM draft_pokemon_v2
+    GROUP BY draft_id
+)
+SELECT s.draft_id, COALESCE(m.players, 0), COALESCE(m.money_in_play, 0),
+       s.picks_sold, COALESCE(s.total_spent, 0), s.mean_price,
+       CASE WHEN m.money_in_play > 0 AND s.picks_sold > 0
+            THEN CAST(m.money_in_play AS REAL) / s.picks_sold / 2500
+       END
+FROM sold s
+LEFT JOIN money m
+    ON m.draft_id = s.draft_id;
+
+UPDATE draft_pokemon_v2
+SET normalized_cost = CAST(ROUND(cost / COALESCE(i.inflation, 1.0)) AS INTEGER)
+FROM draft_inflation i
+WHERE i.draft_id = draft_pokemon_v2.draft_id;
+
+UPDATE agg_pokemon
+SET total_normalized_cost = n.total, min_normalized_cost = n.low, max_normalized_cost = n.high
+FROM (
+    SELECT p.pokemon_id, SUM(p.normalized_cost) AS total,
+           MIN(p.normalized_cost) AS low, MAX(p.normalized_cost) AS high
+    FROM draft_pokemon_v2 p
+    JOIN draft_event_v2 e ON p.draft_id = e.id
+    WHERE p.pokemon_id IS NOT NULL
+    GROUP BY p.pokemon_id
+) n
+WHERE n.pokemon_id = agg_pokemon.pokemon_id;
+
+UPDATE agg_pokemon_patch
+SET total_normalized_cost = n.total, min_normalized_cost = n.low, max_normalized_cost = n.high
+FROM (
+    SELECT e.patch, p.pokemon_id, SUM(p.normalized_cost) AS total,
+           MIN(p.normalized_cost) AS low, MAX(p.normalized_cost) AS high
+    FROM draft_pokemon_v2 p
+    JOIN draft_event_v2 e ON p.draft_id = e.id
+    WHERE e.patch IS NOT NULL AND p.pokemon_id IS NOT NULL
+    GROUP BY e.patch, p.pokemon_id
+) n
+WHERE n.patch = agg_pokemon_patch.patch AND n.pokemon_id = agg_pokemon_patch.pokemon_id;
+
+UPDATE agg_pokemon_player
+SET total_normalized_cost = n.total, min_normalized_cost = n.low, max_normalized_cost = n.high
+FROM (
+    SELECT p.pokemon_id, p.drafted_by_id, SUM(p.normalized_cost) AS total,
+           MIN(p.normalized_cost) AS low, MAX(p.normalized_cost) AS high
+    FROM draft_pokemon_v2 p
+    JOIN draft_event_v2 e ON p.draft_id = e.id
+    WHERE p.pokemon_id IS NOT NULL AND p.drafted_by_id IS NOT NULL
+    GROUP BY p.pokemon_id, p.drafted_by_id
+) n
+WHERE n.pokemon_id = agg_pokemon_player.pokemon_id AND n.drafted_by_id = agg_pokemon_player.player_id;
+
+ANALYZE draft_inflation;
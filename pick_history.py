@@ -0,0 +1,257 @@
+import argparse
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+
+from dimensions import register_names
+
+# ---------------- CONFIG ----------------
+# Source rows per INSERT ... SELECT (and per batch of new names) when an era
+# is loaded from scratch
+BATCH_ROWS = 50_000
+# ----------------------------------------
+
+
+# --------------------
+# Eras
+# --------------------
+@dataclass(frozen=True)
+class Era:
+    # Source table; databases that never loaded it skip the era
+    source_table: str
+    # Source row id column: the watermark for appends and the unit of batching
+    key: str
+    # SELECT ... FROM source_table s WHERE ...: every pick_history column
+    # except era, and except the dimension ids when `register` is set
+    select: str
+    # Filled by insert_excel.py, which replaces the whole table: reloaded
+    # instead of extended past the watermark
+    replaced: bool = False
+    # Names come from the source text and may be new to the dimensions
+    # (False when the source already has the dimension ids)
+    register: bool = True
+    # `select` has a {cost} placeholder for the cost and cost_note columns,
+    # which depend on how the source table was written (see _cost_columns)
+    workbook_cost: bool = False
+
+
+# A number, optionally followed by a remark in brackets: "2400 (Halved)"
+_NUMBER = re.compile(r"^\s*(\d[\d,]*)(?:\.0+)?\s*(?:\(.*\))?\s*$")
+
+
+def to_integer(value) -> int | None:
+    """
+    The integer in a cost cell: 1400, 5100.0, "1400" and "2400 (Halved)"
+    give a number; "2-for-1", "Free" and blanks give None.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else round(value)
+    match = _NUMBER.match(str(value))
+    return int(match.group(1).replace(",", "")) if match else None
+
+
+def cost_label(value) -> str | None:
+    """The text of a cost cell that isn't a number ("2-for-1", "Free"), else None."""
+    if value is None or to_integer(value) is not None:
+        return None
+    return str(value).strip()
+
+
+def _workbook_era(table: str) -> Era:
+    return Era(
+        table,
+        "rowid",
+        f"""
+        SELECT s.rowid AS source_id, substr(s.date, 1, 19) AS draft_key,
+               substr(s.date, 1, 19) AS date_time, NULL AS patch, NULL AS draft_order,
+               s.pokemon, s.drafted_by, {{cost}}
+        FROM "{table}" s
+        WHERE s.pokemon IS NOT NULL AND TRIM(s.pokemon) <> ''
+        """,
+        replaced=True,
+        workbook_cost=True,
+    )
+
+
+# Oldest first
+ERAS = {
+    "pre_website_2for1s": _workbook_era("pre_website_w_2for1s"),
+    "pre_website_2for1_only": _workbook_era("pre_website_2for1_only!"),
+    "pre_website_post_2for1": _workbook_era("pre_website_post_2for1_hell"),
+    # Rows without a cost are notes the website wrote into the export
+    "website": Era(
+        "all_draft_csv_with_website",
+        "rowid",
+        """
+        SELECT s.rowid AS source_id, substr(s.date, 1, 19) AS draft_key,
+               substr(s.date, 1, 19) AS date_time, NULL AS patch, NULL AS draft_order,
+               s.pokemon, s.drafted_by, s.cost, NULL AS cost_note
+        FROM all_draft_csv_with_website s
+        WHERE s.pokemon IS NOT NULL AND s.cost IS NOT NULL
+        """,
+    ),
+    "v1": Era(
+        "draft_pokemon",
+        "id",
+        """
+        SELECT s.id AS source_id, CAST(e.id AS TEXT) AS draft_key,
+               substr(e.date_time, 1, 19) AS date_time, NULL AS patch, NULL AS draft_order,
+               s.pokemon, s.drafted_by, s.cost, NULL AS cost_note
+        FROM draft_pokemon s
+        JOIN draft_event e ON s.draft_id = e.id
+        WHERE s.pokemon IS NOT NULL
+        """,
+    ),
+    "v2": Era(
+        "draft_pokemon_v2",
+        "id",
+        """
+        SELECT s.id AS source_id, e.external_draft_id AS draft_key,
+               substr(e.date_time, 1, 19) AS date_time, e.patch, s.draft_order,
+               s.pokemon, s.drafted_by, s.cost, NULL AS cost_note, s.pokemon_id, s.drafted_by_id
+        FROM draft_pokemon_v2 s
+        JOIN draft_event_v2 e ON s.draft_id = e.id
+        WHERE s.pokemon IS NOT NULL
+        """,
+        register=False,
+    ),
+}
+
+# The spreadsheet eras, reloaded after every insert_excel.py run
+WORKBOOK_ERAS = [name for name, era in ERAS.items() if era.replaced]
+
+PICK_COLUMNS = ("era, source_id, draft_key, date_time, patch, draft_order, pokemon, drafted_by, "
+                "cost, cost_note, pokemon_id, drafted_by_id")
+
+
+def _exists(conn: sqlite3.Connection, table: str) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def _cost_columns(conn: sqlite3.Connection, table: str) -> str:
+    """
+    insert_excel.py writes cost as INTEGER with the labels in cost_note.
+    Tables loaded before it did that hold the sheet's cost as TEXT/FLOAT,
+    labels included, and are split the same way here.
+    """
+    columns = {row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')}
+    if "cost_note" in columns:
+        return "s.cost, s.cost_note"
+    return "pick_cost(s.cost) AS cost, pick_cost_label(s.cost) AS cost_note"
+
+
+def _era_select(conn: sqlite3.Connection, era: Era) -> str:
+    if era.workbook_cost:
+        return era.select.format(cost=_cost_columns(conn, era.source_table))
+    return era.select
+
+
+def _insert_sql(conn: sqlite3.Connection, name: str) -> str:
+    era = ERAS[name]
+    select = _era_select(conn, era)
+    if era.register:
+        # Dimension ids looked up from the names, as in ingest.insert_drafts
+        select = f"""
+            SELECT ?, src.*,
+                   (SELECT pokemon_id FROM pokemon_alias WHERE alias_key = LOWER(TRIM(src.pokemon))),
+                   (SELECT player_id FROM player_alias WHERE alias_key = LOWER(TRIM(src.drafted_by)))
+            FROM ({select} AND s.{era.key} > ? AND s.{era.key} <= ?) src
+        """
+    else:
+        select = f"SELECT ?, src.* FROM ({select} AND s.{era.key} > ? AND s.{era.key} <= ?) src"
+    return f"INSERT INTO pick_history ({PICK_COLUMNS}) {select}"
+
+
+# --------------------
+# Loading
+# --------------------
+def sync_era(conn: sqlite3.Connection, name: str, batch_rows: int = BATCH_ROWS) -> int:
+    """
+    Brings one era of pick_history up to date with its source table, on the
+    caller's transaction, and returns the number of rows added. Appended
+    eras load only the source rows past the highest source_id already
+    loaded; replaced eras are deleted and loaded again.
+    """
+    era = ERAS[name]
+    if not _exists(conn, era.source_table):
+        return 0
+
+    if era.replaced:
+        conn.execute("DELETE FROM pick_history WHERE era = ?", (name,))
+        after = 0
+    else:
+        after = conn.execute(
+            "SELECT COALESCE(MAX(source_id), 0) FROM pick_history WHERE era = ?", (name,)
+        ).fetchone()[0]
+
+    last = conn.execute(
+        f'SELECT COALESCE(MAX({era.key}), 0) FROM "{era.source_table}"'
+    ).fetchone()[0]
+
+    conn.create_function("pick_cost", 1, to_integer, deterministic=True)
+    conn.create_function("pick_cost_label", 1, cost_label, deterministic=True)
+    insert = _insert_sql(conn, name)
+    added = 0
+    for low in range(after, last, batch_rows):
+        high = low + batch_rows
+        if era.register:
+            names = conn.execute(
+                f"SELECT DISTINCT src.pokemon, src.drafted_by "
+                f"FROM ({_era_select(conn, era)} AND s.{era.key} > ? AND s.{era.key} <= ?) src",
+                (low, high)
+            ).fetchall()
+            register_names(conn, "pokemon", [row[0] for row in names])
+            register_names(conn, "player", [row[1] for row in names])
+        added += conn.execute(insert, (name, low, high)).rowcount
+    return added
+
+
+def sync_pick_history(conn: sqlite3.Connection, eras=None) -> dict:
+    """
+    Syncs `eras` (every era if None) on the caller's transaction and returns
+    era -> rows added.
+    """
+    return {name: sync_era(conn, name) for name in (eras or ERAS)}
+
+
+def rebuild_pick_history(conn: sqlite3.Connection, batch_rows: int = BATCH_ROWS) -> dict:
+    """
+    Empties pick_history and loads every era again, `batch_rows` source
+    rows per statement, on the caller's transaction. Use after editing or
+    deleting picks in a source table.
+    """
+    conn.execute("DELETE FROM pick_history")
+    return {name: sync_era(conn, name, batch_rows) for name in ERAS}
+
+
+if __name__ == "__main__":
+    from ingest import DB_PATH, bulk_load_pragmas, connect
+
+    parser = argparse.ArgumentParser(description="Maintain the all-eras pick_history table.")
+    parser.add_argument("--rebuild", action="store_true", help="Reload every era from scratch")
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS)
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    conn = connect(args.db)
+    try:
+        with bulk_load_pragmas(conn):
+            with conn:
+                if args.rebuild:
+                    added = rebuild_pick_history(conn, args.batch_rows)
+                else:
+                    added = {name: sync_era(conn, name, args.batch_rows) for name in ERAS}
+    finally:
+        conn.close()
+
+    for name, rows in added.items():
+        print(f"{name}: {rows} picks")
+    print(f"pick_history {'rebuilt' if args.rebuild else 'synced'} in {time.perf_counter() - started:.2f}s")
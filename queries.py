@@ -0,0 +1,580 @@
+# --------------------
+# Named dashboard queries
+# --------------------
+# Every SQL statement the dashboard runs lives here under a stable name, so the
+# migration plan report (migrate.py --report) and other tooling can run the
+# exact same statements the UI does.
+
+TOTAL_PLAYERS = """
+SELECT COUNT(DISTINCT player_id) AS total_players
+FROM draft_players_v2
+"""
+
+TOTAL_POKEMON_DRAFTED = """
+SELECT COUNT(*) AS total_drafted
+FROM draft_pokemon_v2
+"""
+
+DRAFTS_PER_DAY = """
+SELECT date(date_time) AS draft_date, COUNT(*) AS drafts_count
+FROM draft_event_v2
+GROUP BY draft_date
+ORDER BY draft_date
+"""
+
+MOST_DRAFTS_IN_A_DAY = """
+SELECT pl.name AS player_name, d.draft_date, d.drafts_count
+FROM (
+    SELECT dp.player_id, date(de.date_time) AS draft_date, COUNT(*) AS drafts_count
+    FROM draft_players_v2 dp
+    JOIN draft_event_v2 de
+        ON dp.draft_id = de.id
+    GROUP BY dp.player_id, draft_date
+    ORDER BY drafts_count DESC
+    LIMIT 1
+) d
+JOIN player pl
+    ON pl.id = d.player_id
+"""
+
+PLAYER_DRAFT_DATES = """
+SELECT pl.name AS player_name, d.draft_date
+FROM (
+    SELECT DISTINCT dp.player_id, date(de.date_time) AS draft_date
+    FROM draft_players_v2 dp
+    JOIN draft_event_v2 de
+        ON dp.draft_id = de.id
+) d
+JOIN player pl
+    ON pl.id = d.player_id
+ORDER BY pl.name, d.draft_date
+"""
+
+# --------------------
+# All-time picks (every era, from pick_history)
+# --------------------
+PICKS_BY_ERA = """
+SELECT era,
+       COUNT(DISTINCT draft_key) AS drafts,
+       COUNT(*) AS picks,
+       COUNT(DISTINCT drafted_by_id) AS players,
+       ROUND(AVG(cost)) AS avg_cost,
+       MIN(date_time) AS first_pick,
+       MAX(date_time) AS last_pick
+FROM pick_history
+GROUP BY era
+ORDER BY first_pick
+"""
+
+ALL_TIME_POKEMON = """
+SELECT pk.name AS pokemon,
+       h.times_drafted,
+       h.avg_cost,
+       h.first_drafted,
+       h.last_drafted
+FROM (
+    SELECT pokemon_id,
+           COUNT(*) AS times_drafted,
+           ROUND(AVG(cost)) AS avg_cost,
+           MIN(date_time) AS first_drafted,
+           MAX(date_time) AS last_drafted
+    FROM pick_history
+    WHERE pokemon_id IS NOT NULL
+    GROUP BY pokemon_id
+) h
+JOIN pokemon pk
+    ON pk.id = h.pokemon_id
+ORDER BY h.times_drafted DESC, pk.name
+"""
+
+PATCHES = """
+SELECT DISTINCT patch
+FROM draft_event_v2
+ORDER BY patch
+"""
+
+# --------------------
+# Average cost per Pokémon (optionally for one patch)
+# --------------------
+# The dashboard reads the materialized aggregates (see aggregates.py); the
+# *_FROM_PICKS versions aggregate draft_pokemon_v2 directly and are kept for
+# parity checks and benchmarks. The *_normalized_cost columns are the same
+# prices adjusted for each draft's inflation (see budgets.py), so the
+# dashboard switches between raw and adjusted prices without a new query.
+AVG_COST_BY_POKEMON = """
+SELECT pk.name AS pokemon,
+       ROUND(CAST(a.total_cost AS DOUBLE) / a.times_drafted, 2) AS avg_cost,
+       ROUND(CAST(a.total_normalized_cost AS DOUBLE) / a.times_drafted, 2) AS avg_normalized_cost,
+       a.times_drafted
+FROM agg_pokemon a
+JOIN pokemon pk ON pk.id = a.pokemon_id
+"""
+
+AVG_COST_BY_POKEMON_FOR_PATCH = """
+SELECT pk.name AS pokemon,
+       ROUND(CAST(a.total_cost AS DOUBLE) / a.times_drafted, 2) AS avg_cost,
+       ROUND(CAST(a.total_normalized_cost AS DOUBLE) / a.times_drafted, 2) AS avg_normalized_cost,
+       a.times_drafted
+FROM agg_pokemon_patch a
+JOIN pokemon pk ON pk.id = a.pokemon_id
+WHERE a.patch = ?
+"""
+
+AVG_COST_BY_POKEMON_FROM_PICKS = """
+SELECT pk.name AS pokemon, s.avg_cost, s.avg_normalized_cost, s.times_drafted
+FROM (
+    SELECT dp.pokemon_id,
+           ROUND(AVG(dp.cost), 2) AS avg_cost,
+           ROUND(AVG(dp.normalized_cost), 2) AS avg_normalized_cost,
+           COUNT(*) AS times_drafted
+    FROM draft_pokemon_v2 dp
+    JOIN draft_event_v2 de ON dp.draft_id = de.id
+    GROUP BY dp.pokemon_id
+) s
+JOIN pokemon pk ON pk.id = s.pokemon_id
+"""
+
+AVG_COST_BY_POKEMON_FOR_PATCH_FROM_PICKS = """
+SELECT pk.name AS pokemon, s.avg_cost, s.avg_normalized_cost, s.times_drafted
+FROM (
+    SELECT dp.pokemon_id,
+           ROUND(AVG(dp.cost), 2) AS avg_cost,
+           ROUND(AVG(dp.normalized_cost), 2) AS avg_normalized_cost,
+           COUNT(*) AS times_drafted
+    FROM draft_pokemon_v2 dp
+    JOIN draft_event_v2 de ON dp.draft_id = de.id
+    WHERE de.patch = ?
+    GROUP BY dp.pokemon_id
+) s
+JOIN pokemon pk ON pk.id = s.pokemon_id
+"""
+
+# --------------------
+# Pokémon price summary (optionally for one patch)
+# --------------------
+POKEMON_PRICE_SUMMARY = """
+SELECT
+    pk.name AS pokemon,
+    a.min_cost AS lowest_cost,
+    a.max_cost AS highest_cost,
+    a.max_cost - a.min_cost AS price_variance,
+    a.times_drafted,
+    ROUND(CAST(a.total_cost AS DOUBLE) / a.times_drafted, 2) AS avg_cost,
+    a.min_normalized_cost AS lowest_normalized_cost,
+    a.max_normalized_cost AS highest_normalized_cost,
+    a.max_normalized_cost - a.min_normalized_cost AS normalized_price_variance,
+    ROUND(CAST(a.total_normalized_cost AS DOUBLE) / a.times_drafted, 2) AS avg_normalized_cost
+FROM agg_pokemon a
+JOIN pokemon pk ON pk.id = a.pokemon_id
+ORDER BY avg_cost DESC
+"""
+
+POKEMON_PRICE_SUMMARY_FOR_PATCH = """
+SELECT
+    pk.name AS pokemon,
+    a.min_cost AS lowest_cost,
+    a.max_cost AS highest_cost,
+    a.max_cost - a.min_cost AS price_variance,
+    a.times_drafted,
+    ROUND(CAST(a.total_cost AS DOUBLE) / a.times_drafted, 2) AS avg_cost,
+    a.min_normalized_cost AS lowest_normalized_cost,
+    a.max_normalized_cost AS highest_normalized_cost,
+    a.max_normalized_cost - a.min_normalized_cost AS normalized_price_variance,
+    ROUND(CAST(a.total_normalized_cost AS DOUBLE) / a.times_drafted, 2) AS avg_normalized_cost
+FROM agg_pokemon_patch a
+JOIN pokemon pk ON pk.id = a.pokemon_id
+WHERE a.patch = ?
+ORDER BY avg_cost DESC
+"""
+
+POKEMON_PRICE_SUMMARY_FROM_PICKS = """
+SELECT
+    pk.name AS pokemon,
+    s.lowest_cost,
+    s.highest_cost,
+    s.highest_cost - s.lowest_cost AS price_variance,
+    s.times_drafted,
+    s.avg_cost,
+    s.lowest_normalized_cost,
+    s.highest_normalized_cost,
+    s.highest_normalized_cost - s.lowest_normalized_cost AS normalized_price_variance,
+    s.avg_normalized_cost
+FROM (
+    SELECT
+        p.pokemon_id,
+        MIN(p.cost) AS lowest_cost,
+        MAX(p.cost) AS highest_cost,
+        COUNT(*) AS times_drafted,
+        ROUND(AVG(p.cost), 2) AS avg_cost,
+        MIN(p.normalized_cost) AS lowest_normalized_cost,
+        MAX(p.normalized_cost) AS highest_normalized_cost,
+        ROUND(AVG(p.normalized_cost), 2) AS avg_normalized_cost
+    FROM draft_pokemon_v2 p
+    JOIN draft_event_v2 e ON p.draft_id = e.id
+    GROUP BY p.pokemon_id
+) s
+JOIN pokemon pk ON pk.id = s.pokemon_id
+ORDER BY s.avg_cost DESC
+"""
+
+POKEMON_PRICE_SUMMARY_FOR_PATCH_FROM_PICKS = """
+SELECT
+    pk.name AS pokemon,
+    s.lowest_cost,
+    s.highest_cost,
+    s.highest_cost - s.lowest_cost AS price_variance,
+    s.times_drafted,
+    s.avg_cost,
+    s.lowest_normalized_cost,
+    s.highest_normalized_cost,
+    s.highest_normalized_cost - s.lowest_normalized_cost AS normalized_price_variance,
+    s.avg_normalized_cost
+FROM (
+    SELECT
+        p.pokemon_id,
+        MIN(p.cost) AS lowest_cost,
+        MAX(p.cost) AS highest_cost,
+        COUNT(*) AS times_drafted,
+        ROUND(AVG(p.cost), 2) AS avg_cost,
+        MIN(p.normalized_cost) AS lowest_normalized_cost,
+        MAX(p.normalized_cost) AS highest_normalized_cost,
+        ROUND(AVG(p.normalized_cost), 2) AS avg_normalized_cost
+    FROM draft_pokemon_v2 p
+    JOIN draft_event_v2 e ON p.draft_id = e.id
+    WHERE e.patch = ?
+    GROUP BY p.pokemon_id
+) s
+JOIN pokemon pk ON pk.id = s.pokemon_id
+ORDER BY s.avg_cost DESC
+"""
+
+# --------------------
+# Patch comparison (patch_pokemon_stats, see aggregates.py)
+# --------------------
+# Patches in the order they were played, rather than sorted as text
+PATCHES_BY_DATE = """
+SELECT patch, MIN(date_time) AS first_draft
+FROM draft_event_v2
+WHERE patch IS NOT NULL
+GROUP BY patch
+ORDER BY first_draft
+"""
+
+PATCH_POKEMON_STATS = """
+SELECT
+    pk.name AS pokemon,
+    s.times_drafted,
+    s.pick_rate,
+    s.avg_cost,
+    s.median_cost,
+    s.p90_cost,
+    s.avg_draft_order
+FROM patch_pokemon_stats s
+JOIN pokemon pk ON pk.id = s.pokemon_id
+WHERE s.patch = ?
+ORDER BY s.avg_cost DESC
+"""
+
+# Pokémon drafted in both patches: base patch (first param) vs compared
+# patch (second param), with compared - base deltas
+PATCH_COMPARISON = """
+SELECT
+    pk.name AS pokemon,
+    b.times_drafted AS base_times_drafted,
+    c.times_drafted,
+    b.avg_cost AS base_avg_cost,
+    c.avg_cost,
+    c.avg_cost - b.avg_cost AS avg_cost_delta,
+    b.median_cost AS base_median_cost,
+    c.median_cost,
+    c.median_cost - b.median_cost AS median_cost_delta,
+    b.p90_cost AS base_p90_cost,
+    c.p90_cost,
+    c.p90_cost - b.p90_cost AS p90_cost_delta,
+    b.pick_rate AS base_pick_rate,
+    c.pick_rate,
+    c.pick_rate - b.pick_rate AS pick_rate_delta,
+    b.avg_draft_order AS base_avg_draft_order,
+    c.avg_draft_order,
+    c.avg_draft_order - b.avg_draft_order AS avg_draft_order_delta
+FROM patch_pokemon_stats b
+JOIN patch_pokemon_stats c ON c.pokemon_id = b.pokemon_id
+JOIN pokemon pk ON pk.id = b.pokemon_id
+WHERE b.patch = ? AND c.patch = ?
+"""
+
+# --------------------
+# Draft pick order
+# --------------------
+DRAFT_IDS = """
+SELECT DISTINCT draft_id
+FROM draft_pokemon_v2
+ORDER BY draft_id
+"""
+
+DRAFT_PICKS = """
+SELECT p.draft_id,
+       p.draft_order,
+       COALESCE(pk.name, p.pokemon) AS pokemon,
+       COALESCE(pl.name, p.drafted_by) AS drafted_by,
+       p.cost
+FROM draft_pokemon_v2 p
+LEFT JOIN pokemon pk ON pk.id = p.pokemon_id
+LEFT JOIN player pl ON pl.id = p.drafted_by_id
+WHERE p.draft_id = ?
+ORDER BY p.draft_order
+"""
+
+# Top 3 most expensive picks (ties included) of the most recent drafts.
+# Same ranking as vw_top3_pokemon_per_draft, but the drafts are chosen
+# before the window runs; SQLite doesn't push the filter into the view.
+TOP3_PICKS_RECENT_DRAFTS = """
+SELECT t.draft_id,
+       e.external_draft_id,
+       t.cost_rank,
+       COALESCE(pk.name, t.pokemon) AS pokemon,
+       COALESCE(pl.name, t.drafted_by) AS drafted_by,
+       t.cost,
+       t.draft_order
+FROM (
+    SELECT p.*,
+           RANK() OVER (PARTITION BY p.draft_id ORDER BY p.cost DESC) AS cost_rank
+    FROM draft_pokemon_v2 p
+    WHERE p.draft_id IN (
+        SELECT id
+        FROM draft_event_v2
+        ORDER BY date_time DESC, id DESC
+        LIMIT ?
+    )
+) t
+JOIN draft_event_v2 e ON e.id = t.draft_id
+LEFT JOIN pokemon pk ON pk.id = t.pokemon_id
+LEFT JOIN player pl ON pl.id = t.drafted_by_id
+WHERE t.cost_rank <= 3
+ORDER BY e.date_time, t.draft_id, t.cost_rank
+"""
+
+# --------------------
+# Player signature Pokémon
+# --------------------
+# signatures.py joins these in pandas into the player x Pokémon matrix
+# behind both signature sections.
+SIGNATURE_DRAFT_PLAYERS = """
+SELECT draft_id, player_id
+FROM draft_players_v2
+WHERE player_id IS NOT NULL
+"""
+
+SIGNATURE_DRAFT_PICKS = """
+SELECT draft_id, pokemon_id, drafted_by_id AS buyer_id
+FROM draft_pokemon_v2
+WHERE pokemon_id IS NOT NULL
+"""
+
+PLAYER_NAMES = """
+SELECT id AS player_id, name
+FROM player
+"""
+
+POKEMON_NAMES = """
+SELECT id AS pokemon_id, name
+FROM pokemon
+"""
+
+# --------------------
+# Player draft value vs global average
+# --------------------
+PLAYER_VS_GLOBAL = """
+WITH eligible_players AS (
+    SELECT player_id
+    FROM agg_pokemon_player
+    WHERE times_drafted >= 2
+    GROUP BY player_id
+    HAVING COUNT(*) >= 3
+)
+SELECT
+    pk.name AS pokemon,
+    pl.name AS drafted_by,
+    CAST(p.total_cost AS DOUBLE) / p.times_drafted AS player_avg_cost,
+    CAST(g.total_cost AS DOUBLE) / g.times_drafted AS global_avg_cost,
+    p.times_drafted,
+    CAST(p.total_cost AS DOUBLE) / p.times_drafted
+        - CAST(g.total_cost AS DOUBLE) / g.times_drafted AS delta
+FROM agg_pokemon_player p
+JOIN agg_pokemon g
+    ON p.pokemon_id = g.pokemon_id
+JOIN eligible_players e
+    ON p.player_id = e.player_id
+JOIN pokemon pk
+    ON pk.id = p.pokemon_id
+JOIN player pl
+    ON pl.id = p.player_id
+WHERE p.times_drafted >= 2
+"""
+
+PLAYER_VS_GLOBAL_FROM_PICKS = """
+WITH global_avg AS (
+    SELECT
+        pokemon_id,
+        AVG(cost) AS global_avg_cost
+    FROM draft_pokemon_v2
+    GROUP BY pokemon_id
+),
+player_stats AS (
+    SELECT
+        pokemon_id,
+        drafted_by_id AS player_id,
+        AVG(cost) AS player_avg_cost,
+        COUNT(*) AS times_drafted
+    FROM draft_pokemon_v2
+    GROUP BY pokemon_id, drafted_by_id
+),
+eligible_players AS (
+    SELECT player_id
+    FROM player_stats
+    WHERE times_drafted >= 2
+    GROUP BY player_id
+    HAVING COUNT(*) >= 3
+)
+SELECT
+    pk.name AS pokemon,
+    pl.name AS drafted_by,
+    p.player_avg_cost,
+    g.global_avg_cost,
+    p.times_drafted,
+    (p.player_avg_cost - g.global_avg_cost) AS delta
+FROM player_stats p
+JOIN global_avg g
+    ON p.pokemon_id = g.pokemon_id
+JOIN eligible_players e
+    ON p.player_id = e.player_id
+JOIN pokemon pk
+    ON pk.id = p.pokemon_id
+JOIN player pl
+    ON pl.id = p.player_id
+WHERE p.times_drafted >= 2
+"""
+
+# --------------------
+# Overpaying when rich vs broke (see budgets.py)
+# --------------------
+# Picks in five bands of how much of the buyer's budget was already spent,
+# with the average price paid relative to the Pokémon's global average.
+BUDGET_PREMIUM = """
+SELECT MIN(CAST(b.spent_share * 5 AS INTEGER), 4) AS budget_band,
+       COUNT(*) AS picks,
+       AVG(b.money_before) AS avg_money_before,
+       AVG(p.cost / (CAST(g.total_cost AS DOUBLE) / g.times_drafted)) - 1 AS avg_premium
+FROM pick_budget b
+JOIN draft_pokemon_v2 p
+    ON p.id = b.pick_id
+JOIN agg_pokemon g
+    ON g.pokemon_id = p.pokemon_id
+WHERE b.spent_share IS NOT NULL AND p.cost IS NOT NULL AND g.total_cost > 0
+GROUP BY budget_band
+ORDER BY budget_band
+"""
+
+BUDGET_PREMIUM_FOR_PLAYER = """
+SELECT MIN(CAST(b.spent_share * 5 AS INTEGER), 4) AS budget_band,
+       COUNT(*) AS picks,
+       AVG(b.money_before) AS avg_money_before,
+       AVG(p.cost / (CAST(g.total_cost AS DOUBLE) / g.times_drafted)) - 1 AS avg_premium
+FROM pick_budget b
+JOIN draft_pokemon_v2 p
+    ON p.id = b.pick_id
+JOIN agg_pokemon g
+    ON g.pokemon_id = p.pokemon_id
+JOIN player pl
+    ON pl.id = b.player_id
+WHERE pl.name = ? AND b.spent_share IS NOT NULL AND p.cost IS NOT NULL AND g.total_cost > 0
+GROUP BY budget_band
+ORDER BY budget_band
+"""
+
+# --------------------
+# Appendix pages
+# --------------------
+# table_browser builds these per sort/filter; two representative keyset
+# pages are kept here so migrate.py --report covers their plans.
+APPENDIX_PICKS_PAGE_BY_ID = """
+SELECT * FROM draft_pokemon_v2
+WHERE id > ?
+ORDER BY id ASC
+LIMIT ?
+"""
+
+APPENDIX_PICKS_PAGE_BY_DRAFT = """
+SELECT * FROM draft_pokemon_v2
+WHERE (draft_id > ? OR (draft_id = ? AND id > ?))
+ORDER BY draft_id ASC, id ASC
+LIMIT ?
+"""
+
+# --------------------
+# Ingest
+# --------------------
+DRAFT_EXISTS = """
+SELECT 1
+FROM draft_event_v2
+WHERE external_draft_id = ?
+LIMIT 1
+"""
+
+# --------------------
+# Registry
+# --------------------
+# name -> (sql, sample params). Sample params are only used by tooling that
+# needs to run a parameterised query without the UI (query plan reports).
+NAMED_QUERIES = {
+    "total_players": (TOTAL_PLAYERS, ()),
+    "total_pokemon_drafted": (TOTAL_POKEMON_DRAFTED, ()),
+    "drafts_per_day": (DRAFTS_PER_DAY, ()),
+    "most_drafts_in_a_day": (MOST_DRAFTS_IN_A_DAY, ()),
+    "player_draft_dates": (PLAYER_DRAFT_DATES, ()),
+    "picks_by_era": (PICKS_BY_ERA, ()),
+    "all_time_pokemon": (ALL_TIME_POKEMON, ()),
+    "patches": (PATCHES, ()),
+    "avg_cost_by_pokemon": (AVG_COST_BY_POKEMON, ()),
+    "avg_cost_by_pokemon_for_patch": (AVG_COST_BY_POKEMON_FOR_PATCH, ("v7.3",)),
+    "avg_cost_by_pokemon_from_picks": (AVG_COST_BY_POKEMON_FROM_PICKS, ()),
+    "avg_cost_by_pokemon_for_patch_from_picks": (AVG_COST_BY_POKEMON_FOR_PATCH_FROM_PICKS, ("v7.3",)),
+    "price_summary": (POKEMON_PRICE_SUMMARY, ()),
+    "price_summary_for_patch": (POKEMON_PRICE_SUMMARY_FOR_PATCH, ("v7.3",)),
+    "price_summary_from_picks": (POKEMON_PRICE_SUMMARY_FROM_PICKS, ()),
+    "price_summary_for_patch_from_picks": (POKEMON_PRICE_SUMMARY_FOR_PATCH_FROM_PICKS, ("v7.3",)),
+    "patches_by_date": (PATCHES_BY_DATE, ()),
+    "patch_pokemon_stats": (PATCH_POKEMON_STATS, ("v7.3",)),
+    "patch_comparison": (PATCH_COMPARISON, ("v7.3", "v7.4")),
+    "draft_ids": (DRAFT_IDS, ()),
+    "draft_picks": (DRAFT_PICKS, (1,)),
+    "top3_picks_recent_drafts": (TOP3_PICKS_RECENT_DRAFTS, (10,)),
+    "signature_draft_players": (SIGNATURE_DRAFT_PLAYERS, ()),
+    "signature_draft_picks": (SIGNATURE_DRAFT_PICKS, ()),
+    "player_names": (PLAYER_NAMES, ()),
+    "pokemon_names": (POKEMON_NAMES, ()),
+    "player_vs_global": (PLAYER_VS_GLOBAL, ()),
+    "player_vs_global_from_picks": (PLAYER_VS_GLOBAL_FROM_PICKS, ()),
+    "budget_premium": (BUDGET_PREMIUM, ()),
+    "budget_premium_for_player": (BUDGET_PREMIUM_FOR_PLAYER, ("Blake",)),
+    "appendix_picks_page_by_id": (APPENDIX_PICKS_PAGE_BY_ID, (100, 51)),
+    "appendix_picks_page_by_draft": (APPENDIX_PICKS_PAGE_BY_DRAFT, (10, 10, 900, 51)),
+    "draft_exists": (DRAFT_EXISTS, ("680927995531",)),
+}
+
+# Pure aggregations over the pick table. backends.py can run these on DuckDB
+# (attached to the SQLite file, or over the Parquet snapshot), so they stick
+# to SQL both engines read the same way: CAST(... AS DOUBLE) rather than REAL
+# (a 4-byte float in DuckDB) and every selected column grouped or aggregated.
+ANALYTIC_QUERIES = (
+    "avg_cost_by_pokemon",
+    "avg_cost_by_pokemon_for_patch",
+    "avg_cost_by_pokemon_from_picks",
+    "avg_cost_by_pokemon_for_patch_from_picks",
+    "price_summary",
+    "price_summary_for_patch",
+    "price_summary_from_picks",
+    "price_summary_for_patch_from_picks",
+    "player_vs_global",
+    "player_vs_global_from_picks",
+)
@@ -0,0 +1,160 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+import queries
+from data_access import DB_PATH, db_token, read_query
+from snapshot import load_snapshot, snapshot_current
+
+# ---------------- CONFIG ----------------
+# Defaults for the dashboard sliders
+MIN_TIMES_AVAILABLE = 3
+SIGNATURE_RATE = 0.6
+SUPER_SIGNATURE_RATE = 0.8
+MIN_PLAYER_DRAFTS = 3
+MIN_TIMES_DRAFTED = 2
+# ----------------------------------------
+
+MATRIX_COLUMNS = ["drafted_by", "pokemon", "times_available", "times_drafted",
+                  "percent_drafted", "player_drafts"]
+
+
+# --------------------
+# Player x Pokémon matrix
+# --------------------
+def build_signature_matrix(draft_players: pd.DataFrame, draft_picks: pd.DataFrame,
+                           player_names: pd.DataFrame, pokemon_names: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per (player, Pokémon) the player has ever seen in a draft:
+    - times_available: drafts the player was in where the Pokémon was sold
+    - times_drafted: of those, drafts where the player bought it
+    - player_drafts: drafts the player was in overall
+
+    Works on the integer dimension ids (SIGNATURE_DRAFT_PLAYERS /
+    SIGNATURE_DRAFT_PICKS) and attaches display names at the end.
+    """
+    players = draft_players.drop_duplicates(["draft_id", "player_id"])
+    seen = players.merge(draft_picks, on="draft_id")
+    seen["drafted"] = seen["player_id"] == seen["buyer_id"]
+
+    # A Pokémon can be sold twice in one draft; it's still one draft seen
+    per_draft = (
+        seen.groupby(["player_id", "pokemon_id", "draft_id"], sort=False)["drafted"]
+        .max()
+        .reset_index()
+    )
+
+    matrix = (
+        per_draft.groupby(["player_id", "pokemon_id"])
+        .agg(times_available=("draft_id", "size"), times_drafted=("drafted", "sum"))
+        .reset_index()
+    )
+    matrix["times_drafted"] = matrix["times_drafted"].astype(np.int64)
+    matrix["percent_drafted"] = matrix["times_drafted"] / matrix["times_available"]
+    matrix["player_drafts"] = matrix["player_id"].map(
+        players.groupby("player_id")["draft_id"].nunique()
+    )
+    matrix["drafted_by"] = matrix["player_id"].map(player_names.set_index("player_id")["name"])
+    matrix["pokemon"] = matrix["pokemon_id"].map(pokemon_names.set_index("pokemon_id")["name"])
+    return matrix[MATRIX_COLUMNS]
+
+
+def _snapshot_inputs(db_path: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    SIGNATURE_DRAFT_PLAYERS / SIGNATURE_DRAFT_PICKS read from the Parquet
+    snapshot (only the id columns are decoded) instead of SQLite.
+    """
+    draft_players = load_snapshot("players", ["draft_id", "player_id"], db_path=db_path)
+    draft_players = draft_players.dropna().astype(np.int64)
+
+    draft_picks = load_snapshot("picks", ["draft_id", "pokemon_id", "drafted_by_id"], db_path=db_path)
+    draft_picks = draft_picks.dropna(subset=["pokemon_id"]).rename(columns={"drafted_by_id": "buyer_id"})
+    draft_picks["buyer_id"] = draft_picks["buyer_id"].astype("float64")
+    return draft_players, draft_picks.astype({"draft_id": np.int64, "pokemon_id": np.int64})
+
+
+_matrix_lock = threading.Lock()
+_matrix_cache = {}
+
+
+def signature_matrix(db_path: str = DB_PATH) -> pd.DataFrame:
+    """
+    The player x Pokémon matrix for the current database, built once per
+    database state and shared by every session. Callers get a copy.
+    """
+    token = db_token(db_path)
+    with _matrix_lock:
+        cached = _matrix_cache.get(db_path)
+        if cached and cached[0] == token:
+            return cached[1].copy()
+
+    if snapshot_current(db_path):
+        draft_players, draft_picks = _snapshot_inputs(db_path)
+    else:
+        draft_players = read_query(queries.SIGNATURE_DRAFT_PLAYERS, db_path=db_path)
+        draft_picks = read_query(queries.SIGNATURE_DRAFT_PICKS, db_path=db_path)
+
+    matrix = build_signature_matrix(
+        draft_players,
+        draft_picks,
+        read_query(queries.PLAYER_NAMES, db_path=db_path),
+        read_query(queries.POKEMON_NAMES, db_path=db_path),
+    )
+
+    with _matrix_lock:
+        _matrix_cache[db_path] = (token, matrix)
+    return matrix.copy()
+
+
+def clear_cache():
+    with _matrix_lock:
+        _matrix_cache.clear()
+
+
+# --------------------
+# Views over the matrix
+# --------------------
+def signature_picks(matrix: pd.DataFrame, min_available: int = MIN_TIMES_AVAILABLE,
+                    min_rate: float = SIGNATURE_RATE) -> pd.DataFrame:
+    """
+    Pokémon each player takes in at least `min_rate` of the drafts where
+    it was available (and it was available at least `min_available` times).
+    """
+    picks = matrix[
+        (matrix["times_available"] >= min_available)
+        & (matrix["percent_drafted"] >= min_rate)
+    ]
+    return (
+        picks.sort_values(["drafted_by", "percent_drafted"], ascending=[True, False], kind="stable")
+        [["drafted_by", "pokemon", "times_drafted", "times_available", "percent_drafted"]]
+        .reset_index(drop=True)
+    )
+
+
+def signature_owners(matrix: pd.DataFrame, min_player_drafts: int = MIN_PLAYER_DRAFTS,
+                     min_available: int = MIN_TIMES_AVAILABLE,
+                     min_drafted: int = MIN_TIMES_DRAFTED) -> pd.DataFrame:
+    """
+    For each Pokémon, the player most likely to draft it. Players are
+    ranked by rating = draft rate * log10(times drafted + 1), which favours
+    players who both pick it often when available and have picked it a lot.
+    """
+    rates = matrix[
+        (matrix["player_drafts"] >= min_player_drafts)
+        & (matrix["times_available"] >= min_available)
+        & (matrix["times_drafted"] >= min_drafted)
+    ].copy()
+    rates["rating"] = rates["percent_drafted"] * np.log10(rates["times_drafted"] + 1)
+
+    owners = (
+        rates.sort_values(["pokemon", "rating", "drafted_by"], ascending=[True, False, True], kind="stable")
+        .drop_duplicates("pokemon")
+        .rename(columns={"drafted_by": "most_likely_player"})
+    )
+    return (
+        owners.sort_values(["rating", "pokemon"], ascending=[False, True], kind="stable")
+        [["pokemon", "most_likely_player", "times_drafted", "times_available",
+          "percent_drafted", "rating"]]
+        .reset_index(drop=True)
+    )
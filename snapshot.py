@@ -0,0 +1,337 @@
+import argparse
+import json
+import os
+import sqlite3
+import time
+import uuid
+from urllib.parse import quote
+
+import pandas as pd
+
+from data_access import DB_PATH, read_query
+
+# ---------------- CONFIG ----------------
+# Snapshots live next to the database: <db folder>/snapshots/<db name>/
+SNAPSHOT_ROOT = "snapshots"
+# Rows read from SQLite per round trip while exporting
+EXPORT_CHUNK_ROWS = 50_000
+# A patch folder is compacted into one file once it has more files than this
+MAX_FILES_PER_PATCH = 16
+STATE_FILE = "_state.json"
+STATE_VERSION = 2
+# ----------------------------------------
+
+# Dataset -> rows of drafts with draft_event_v2.id > ?, joined with the draft's
+# patch and date (the drafts dataset is draft_event_v2 itself). Only ids are exported (not names) so a rename doesn't make
+# the snapshot stale; join PLAYER_NAMES / POKEMON_NAMES for display.
+DATASETS = {
+    "drafts": """
+        SELECT e.id AS draft_id, e.external_draft_id, e.patch, e.date_time,
+               e.total_pokemon_sold
+        FROM draft_event_v2 e
+        WHERE e.id > ?
+        ORDER BY e.id
+    """,
+    "picks": """
+        SELECT p.id, p.draft_id, e.patch, e.date_time, p.draft_order,
+               p.pokemon_id, p.drafted_by_id, p.cost, p.normalized_cost
+        FROM draft_pokemon_v2 p
+        JOIN draft_event_v2 e ON e.id = p.draft_id
+        WHERE p.draft_id > ?
+        ORDER BY p.draft_id, p.id
+    """,
+    "players": """
+        SELECT dp.id, dp.draft_id, e.patch, e.date_time, dp.player_id,
+               dp.starting_money, dp.remaining_money
+        FROM draft_players_v2 dp
+        JOIN draft_event_v2 e ON e.id = dp.draft_id
+        WHERE dp.draft_id > ?
+        ORDER BY dp.draft_id, dp.id
+    """,
+}
+
+# Everything else is an integer column (or date_time)
+TEXT_COLUMNS = ("patch", "external_draft_id")
+
+# Cheap checksum of every exported row up to the last exported draft. If it no
+# longer matches, rows were changed in place (e.g. `dimensions.py alias` merged
+# two Pokémon) and the snapshot is rebuilt instead of appended to.
+FINGERPRINT = """
+SELECT
+    (SELECT COUNT(*) FROM draft_event_v2 WHERE id <= ?),
+    (SELECT COUNT(*) || ':' || TOTAL(pokemon_id) || ':' || TOTAL(drafted_by_id) || ':' || TOTAL(cost)
+            || ':' || TOTAL(normalized_cost)
+     FROM draft_pokemon_v2 WHERE draft_id <= ?),
+    (SELECT COUNT(*) || ':' || TOTAL(player_id) FROM draft_players_v2 WHERE draft_id <= ?)
+"""
+
+# What the dashboard compares against the state file to decide whether the
+# snapshot covers the current database. New dimension rows only arrive with
+# new drafts, so a changed player/Pokémon count at the same last draft means
+# a merge re-pointed exported rows.
+COVERAGE = """
+SELECT
+    (SELECT COALESCE(MAX(id), 0) FROM draft_event_v2) AS last_draft_id,
+    (SELECT COUNT(*) FROM draft_pokemon_v2) AS picks,
+    (SELECT COUNT(*) FROM draft_players_v2) AS players,
+    (SELECT COUNT(*) FROM player) AS player_names,
+    (SELECT COUNT(*) FROM pokemon) AS pokemon_names
+"""
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def snapshot_dir(db_path: str = DB_PATH) -> str:
+    folder, name = os.path.split(os.path.abspath(db_path))
+    return os.path.join(folder, SNAPSHOT_ROOT, os.path.splitext(name)[0])
+
+
+# ---------- STATE ----------
+def read_state(directory: str) -> dict | None:
+    try:
+        with open(os.path.join(directory, STATE_FILE), encoding="utf-8") as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return None
+    return state if state.get("version") == STATE_VERSION else None
+
+
+def _write_state(directory: str, state: dict):
+    """
+    Replaces the state file atomically. Readers only ever open the files the
+    state lists, so swapping it is what publishes new or compacted files.
+    """
+    path = os.path.join(directory, STATE_FILE)
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=1)
+    os.replace(tmp, path)
+
+
+def _fingerprint(conn: sqlite3.Connection, last_draft_id: int) -> list:
+    return list(conn.execute(FINGERPRINT, (last_draft_id,) * 3).fetchone())
+
+
+# ---------- WRITING ----------
+def _partition(patch) -> str:
+    return "patch=" + ("__null__" if patch is None else quote(str(patch), safe=""))
+
+
+def _arrow_table(df: pd.DataFrame):
+    import pyarrow as pa
+
+    df = df.copy()
+    df["date_time"] = pd.to_datetime(df["date_time"], format="ISO8601")
+    for column in df.columns:
+        if column not in TEXT_COLUMNS and column != "date_time":
+            df[column] = df[column].astype("Int64")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # Fixed types, so a chunk where a text column is all NULL still matches
+    for column in TEXT_COLUMNS:
+        if column in table.column_names:
+            values = table[column].cast(pa.string())
+            if column == "patch":
+                values = values.dictionary_encode()
+            table = table.set_column(table.schema.get_field_index(column), column, values)
+    return table
+
+
+def _write_part(directory: str, dataset: str, patch, df: pd.DataFrame) -> dict:
+    import pyarrow.parquet as pq
+
+    rel_dir = os.path.join(dataset, _partition(patch))
+    os.makedirs(os.path.join(directory, rel_dir), exist_ok=True)
+
+    first, last = int(df["draft_id"].min()), int(df["draft_id"].max())
+    rel_path = os.path.join(rel_dir, f"part-{first}-{last}-{uuid.uuid4().hex[:8]}.parquet")
+    pq.write_table(_arrow_table(df), os.path.join(directory, rel_path))
+    return {"patch": patch, "path": rel_path, "rows": len(df)}
+
+
+def _export(conn: sqlite3.Connection, directory: str, dataset: str, after_draft_id: int) -> list[dict]:
+    """
+    Writes every row of `dataset` for drafts after `after_draft_id`, one file
+    per patch per chunk. Returns the new file entries.
+    """
+    parts = []
+    for chunk in pd.read_sql_query(DATASETS[dataset], conn, params=(after_draft_id,),
+                                   chunksize=EXPORT_CHUNK_ROWS):
+        for patch, rows in chunk.groupby("patch", dropna=False, sort=False):
+            parts.append(_write_part(directory, dataset, None if pd.isna(patch) else patch, rows))
+    return parts
+
+
+def _compact(directory: str, dataset: str, parts: list[dict]) -> tuple[list[dict], list[str]]:
+    """
+    Merges the files of any patch that has more than MAX_FILES_PER_PATCH into
+    one. Returns the new file list and the paths that were replaced.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    by_patch = {}
+    for part in parts:
+        by_patch.setdefault(part["patch"], []).append(part)
+
+    kept, replaced = [], []
+    for patch, files in by_patch.items():
+        if len(files) <= MAX_FILES_PER_PATCH:
+            kept += files
+            continue
+
+        table = pa.concat_tables(
+            pq.read_table(os.path.join(directory, f["path"]), memory_map=True) for f in files
+        ).combine_chunks()
+        kept.append(_write_part(directory, dataset, patch, table.to_pandas()))
+        replaced += [f["path"] for f in files]
+
+    return kept, replaced
+
+
+def _remove(directory: str, paths: list[str]):
+    for path in paths:
+        try:
+            os.remove(os.path.join(directory, path))
+        except FileNotFoundError:
+            pass
+
+
+def _unlisted(directory: str, state: dict) -> list[str]:
+    """
+    Parquet files under `directory` the state doesn't list: the previous
+    export after a rebuild, or leftovers of an interrupted refresh.
+    """
+    listed = {f["path"] for parts in state["datasets"].values() for f in parts}
+    stray = []
+    for root, _, files in os.walk(directory):
+        for file in files:
+            path = os.path.relpath(os.path.join(root, file), directory)
+            if file.endswith(".parquet") and path not in listed:
+                stray.append(path)
+    return stray
+
+
+def refresh_snapshot(db_path: str = DB_PATH, rebuild: bool = False) -> dict:
+    """
+    Brings the Parquet snapshot of `db_path` up to date. Drafts added since
+    the last refresh are appended as new files in their patch folder; if
+    already-exported rows changed (or `rebuild` is set) everything is
+    exported again. Returns a summary dict.
+    """
+    started = time.perf_counter()
+    directory = snapshot_dir(db_path)
+    os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        # One read transaction, so the rows and the fingerprint agree
+        conn.execute("BEGIN")
+        schema = conn.execute("PRAGMA user_version").fetchone()[0]
+        last_draft_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM draft_event_v2").fetchone()[0]
+
+        state = None if rebuild else read_state(directory)
+        if state and (state["schema"] != schema
+                      or _fingerprint(conn, state["last_draft_id"]) != state["fingerprint"]):
+            state = None
+
+        full = state is None
+        if full:
+            state = {"version": STATE_VERSION, "schema": schema, "last_draft_id": 0,
+                     "datasets": {name: [] for name in DATASETS}}
+
+        if not full and state["last_draft_id"] == last_draft_id:
+            return {"mode": "current", "drafts": 0, "seconds": time.perf_counter() - started}
+
+        after = state["last_draft_id"]
+
+        datasets, replaced = {}, []
+        for name in DATASETS:
+            parts = [] if full else list(state["datasets"][name])
+            parts += _export(conn, directory, name, after)
+            datasets[name], compacted = _compact(directory, name, parts)
+            replaced += compacted
+
+        new_drafts = conn.execute("SELECT COUNT(*) FROM draft_event_v2 WHERE id > ?", (after,)).fetchone()[0]
+        coverage = pd.read_sql_query(COVERAGE, conn).iloc[0]
+        state.update({
+            "schema": schema,
+            "last_draft_id": last_draft_id,
+            "fingerprint": _fingerprint(conn, last_draft_id),
+            "coverage": {column: int(value) for column, value in coverage.items()},
+            "datasets": datasets,
+            "rows": {name: sum(f["rows"] for f in parts) for name, parts in datasets.items()},
+        })
+    finally:
+        conn.close()
+
+    _write_state(directory, state)
+    _remove(directory, _unlisted(directory, state) if full else replaced)
+
+    return {"mode": "rebuild" if full else "append", "drafts": new_drafts,
+            "seconds": time.perf_counter() - started}
+
+
+# ---------- READING ----------
+def snapshot_current(db_path: str = DB_PATH) -> bool:
+    """
+    True if the snapshot holds exactly the drafts currently in `db_path`.
+    """
+    state = read_state(snapshot_dir(db_path))
+    if state is None or not parquet_available():
+        return False
+
+    coverage = read_query(COVERAGE, db_path=db_path).iloc[0]
+    return {column: int(value) for column, value in coverage.items()} == state["coverage"]
+
+
+def load_snapshot(dataset: str, columns: list[str] | None = None, patches=None,
+                  db_path: str = DB_PATH) -> pd.DataFrame:
+    """
+    Reads `dataset` ("drafts", "picks" or "players") from the snapshot as a DataFrame.
+    Files are memory-mapped, only `columns` are decoded, and with `patches`
+    only those patch folders are opened.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    directory = snapshot_dir(db_path)
+    for attempt in range(2):
+        state = read_state(directory)
+        if state is None:
+            raise FileNotFoundError(f"No snapshot for {db_path}; run `python snapshot.py`")
+
+        parts = state["datasets"][dataset]
+        if patches is not None:
+            wanted = set(patches)
+            parts = [f for f in parts if f["patch"] in wanted]
+
+        try:
+            tables = [pq.read_table(os.path.join(directory, f["path"]), columns=columns, memory_map=True)
+                      for f in parts]
+            break
+        except FileNotFoundError:
+            # A refresh compacted files between reading the state and opening them
+            if attempt:
+                raise
+
+    if not tables:
+        return pd.DataFrame(columns=columns or [])
+    return pa.concat_tables(tables).to_pandas()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the Parquet snapshot of the draft tables.")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    parser.add_argument("--rebuild", action="store_true", help="Export everything again")
+    args = parser.parse_args()
+
+    result = refresh_snapshot(args.db, args.rebuild)
+    print(f"Snapshot {result['mode']}: {result['drafts']} drafts in {result['seconds']:.2f}s "
+          f"-> {snapshot_dir(args.db)}")
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+# --------------------
+# Daily draft streaks (vectorized)
+# --------------------
+STREAK_COLUMNS = ["player_name", "longest_streak", "best_start", "best_end", "current_streak"]
+
+
+def draft_streaks(draft_dates: pd.DataFrame, as_of=None) -> pd.DataFrame:
+    """
+    Consecutive-day draft streaks for every player in one pass over
+    (player_name, draft_date) rows, e.g. queries.PLAYER_DRAFT_DATES.
+
+    Rows are sorted by player and day, then split into runs wherever the
+    player changes or the gap to the previous day isn't exactly one day
+    (diff + cumsum run-length encoding). Per player this returns the longest
+    run with its first/last day (earliest run wins ties) and the current
+    streak: the length of the latest run if it reaches `as_of` or the day
+    before, else 0. `as_of` defaults to the newest date in the input.
+    """
+    if draft_dates.empty:
+        return pd.DataFrame(columns=STREAK_COLUMNS)
+
+    codes, names = pd.factorize(draft_dates["player_name"], sort=True)
+    days = pd.to_datetime(draft_dates["draft_date"]).to_numpy("datetime64[D]").astype(np.int64)
+
+    order = np.lexsort((days, codes))
+    codes, days = codes[order], days[order]
+
+    # Drop repeated (player, day) rows so they neither extend nor break a run
+    keep = np.ones(len(days), dtype=bool)
+    keep[1:] = (codes[1:] != codes[:-1]) | (days[1:] != days[:-1])
+    codes, days = codes[keep], days[keep]
+
+    # ---- run-length encode consecutive days ----
+    new_player = np.ones(len(days), dtype=bool)
+    new_player[1:] = codes[1:] != codes[:-1]
+    breaks = new_player.copy()
+    breaks[1:] |= np.diff(days) != 1
+
+    run_starts = np.flatnonzero(breaks)
+    run_ends = np.append(run_starts[1:], len(days)) - 1
+    run_lengths = run_ends - run_starts + 1
+    run_players = codes[run_starts]
+
+    # ---- longest run per player (stable sort keeps the earliest on ties) ----
+    by_length = np.lexsort((-run_lengths, run_players))
+    first_of_player = np.ones(len(by_length), dtype=bool)
+    first_of_player[1:] = run_players[by_length][1:] != run_players[by_length][:-1]
+    best = by_length[first_of_player]
+
+    # ---- latest run per player ----
+    player_first_run = np.flatnonzero(new_player[run_starts])
+    latest = np.append(player_first_run[1:], len(run_starts)) - 1
+
+    if as_of is None:
+        as_of_day = days.max()
+    else:
+        as_of_day = np.datetime64(pd.Timestamp(as_of).date(), "D").astype(np.int64)
+    active = days[run_ends[latest]] >= as_of_day - 1
+
+    streaks = pd.DataFrame({
+        "player_name": names[run_players[best]],
+        "longest_streak": run_lengths[best],
+        "best_start": days[run_starts[best]].astype("datetime64[D]"),
+        "best_end": days[run_ends[best]].astype("datetime64[D]"),
+        "current_streak": np.where(active, run_lengths[latest], 0),
+    })
+    streaks["best_start"] = streaks["best_start"].dt.date
+    streaks["best_end"] = streaks["best_end"].dt.date
+
+    return streaks.sort_values(
+        ["longest_streak", "player_name"], ascending=[False, True], kind="stable"
+    ).reset_index(drop=True)
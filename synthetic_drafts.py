@@ -0,0 +1,294 @@
+import argparse
+import csv
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from ingest import (
+    REFRESH_SNAPSHOT,
+    IngestStats,
+    ParsedDraft,
+    bulk_load_pragmas,
+    bump_change_counter,
+    connect,
+    insert_group3_batch,
+)
+from snapshot import parquet_available, refresh_snapshot
+
+# ---------------- CONFIG ----------------
+SEED = 7
+DRAFTS = 1_000
+START = "2026-02-01"
+DRAFTS_PER_DAY = 6.0
+PLAYERS = 500
+POKEMON = 250
+# A new patch every PATCH_DAYS days; each one nudges every price a little
+PATCH_DAYS = 7
+PATCH_DRIFT = 0.08
+
+BUDGET = 20_000
+PRICE_STEP = 100
+PICKS_PER_PLAYER = 8
+# Players per draft in the real data (size -> drafts)
+PLAYERS_PER_DRAFT = {4: 2, 5: 7, 6: 9, 7: 12, 8: 12, 9: 10, 10: 11, 11: 3, 12: 4, 13: 1, 14: 1}
+# Share of players who had their whole budget left when the draft started
+FULL_START_SHARE = 0.55
+# Spread of prices around each Pokémon's base price (lognormal sigma)
+PRICE_NOISE = 0.22
+# Late picks go cheaper: the last pick costs this much less than the first
+LATE_DISCOUNT = 0.15
+# Each player has a few favourite Pokémon they buy whenever they can
+FAVORITES_PER_PLAYER = 3
+FAVORITE_RATE = 0.6
+
+# Drafts per write transaction with --db
+BATCH_DRAFTS = 500
+# ----------------------------------------
+
+
+# --------------------
+# The simulated league
+# --------------------
+@dataclass
+class League:
+    players: np.ndarray           # player names
+    activity: np.ndarray          # chance a given player joins a draft (sums to 1)
+    favorites: list               # player index -> Pokémon indexes
+    pokemon: np.ndarray           # Pokémon names
+    popularity: np.ndarray        # chance a Pokémon is up for sale (sums to 1)
+    base_price: np.ndarray
+
+
+def build_league(rng: np.random.Generator, players: int = PLAYERS, pokemon: int = POKEMON,
+                 pokemon_names: list[str] | None = None) -> League:
+    """
+    Players with heavy-tailed activity (a few regulars, many one-off
+    players) and Pokémon with lognormal base prices around the real
+    average (~2,400).
+    """
+    ranks = np.arange(1, players + 1)
+    activity = 1.0 / ranks ** 0.8
+    activity = rng.permutation(activity / activity.sum())
+
+    names = list(pokemon_names or [])[:pokemon]
+    names += [f"Synthmon {i:04d}" for i in range(len(names) + 1, pokemon + 1)]
+
+    popularity = rng.lognormal(0.0, 0.5, pokemon)
+    base_price = rng.lognormal(np.log(2300), 0.3, pokemon)
+
+    return League(
+        players=np.array([f"trainer_{i:05d}" for i in range(1, players + 1)]),
+        activity=activity,
+        favorites=[rng.choice(pokemon, FAVORITES_PER_PLAYER, replace=False) for _ in range(players)],
+        pokemon=np.array(names),
+        popularity=popularity / popularity.sum(),
+        base_price=base_price,
+    )
+
+
+def patch_name(index: int) -> str:
+    return f"v{8 + index // 10}.{index % 10}"
+
+
+def external_id(seed: int, n: int) -> str:
+    # 7919 is coprime with 10**12, so ids never repeat within a seed
+    return f"{(n * 7919 + seed * 104729) % 10**12:012d}"
+
+
+# --------------------
+# One draft
+# --------------------
+def _spend(rng: np.random.Generator, prices: np.ndarray) -> np.ndarray:
+    """
+    Scales one player's raw prices so they spend (almost) exactly their
+    budget, in PRICE_STEP increments with every pick at least one step.
+    """
+    target = BUDGET - (0 if rng.random() < 0.8 else int(rng.integers(1, 30)) * PRICE_STEP)
+    steps = np.maximum(1, np.round(prices * target / prices.sum() / PRICE_STEP)).astype(np.int64)
+    # Put the rounding error on the dearest pick
+    top = int(np.argmax(steps))
+    steps[top] = max(1, steps[top] + target // PRICE_STEP - steps.sum())
+    return steps * PRICE_STEP
+
+
+def simulate_draft(rng: np.random.Generator, league: League, prices: np.ndarray,
+                   external_draft_id: str, patch: str, date_time: datetime) -> ParsedDraft:
+    sizes = np.array(list(PLAYERS_PER_DRAFT))
+    weights = np.array(list(PLAYERS_PER_DRAFT.values()), dtype=float)
+    size = min(int(rng.choice(sizes, p=weights / weights.sum())), len(league.players))
+    seats = rng.choice(len(league.players), size, replace=False, p=league.activity)
+
+    slots = np.clip(np.round(rng.normal(PICKS_PER_PLAYER, 1.0, size)), 5, 12).astype(np.int64)
+    total = int(slots.sum())
+    sold = rng.choice(len(league.pokemon), total, replace=total > len(league.pokemon),
+                      p=league.popularity)
+
+    # Who buys each pick: shuffled seats, then favourites are swapped to their fans
+    buyer = rng.permutation(np.repeat(np.arange(size), slots))
+    for seat, player in enumerate(seats):
+        for pick in np.flatnonzero(np.isin(sold, league.favorites[player])):
+            if buyer[pick] != seat and rng.random() < FAVORITE_RATE:
+                mine = np.flatnonzero(buyer == seat)
+                swap = mine[rng.integers(len(mine))]
+                buyer[pick], buyer[swap] = seat, buyer[pick]
+
+    order_factor = 1.0 - LATE_DISCOUNT * np.arange(total) / max(total - 1, 1)
+    raw = prices[sold] * order_factor * rng.lognormal(0.0, PRICE_NOISE, total)
+
+    cost = np.empty(total, dtype=np.int64)
+    draft = ParsedDraft(
+        source_path=f"draft_{external_draft_id}.csv",
+        external_draft_id=external_draft_id,
+        patch=patch,
+        date_time=date_time,
+        total_pokemon_sold=total,
+    )
+
+    for seat, player in enumerate(seats):
+        mine = buyer == seat
+        cost[mine] = _spend(rng, raw[mine])
+        starting = BUDGET if rng.random() < FULL_START_SHARE else int(rng.integers(0, 71)) * PRICE_STEP
+        draft.players.append((str(league.players[player]), starting, starting - int(cost[mine].sum())))
+
+    draft.players.sort(key=lambda p: p[0].casefold())
+    draft.picks = [
+        (order, str(league.pokemon[p]), str(league.players[seats[b]]), int(c))
+        for order, (p, b, c) in enumerate(zip(sold, buyer, cost), start=1)
+    ]
+    return draft
+
+
+# --------------------
+# Draft history
+# --------------------
+def generate_drafts(drafts: int = DRAFTS, seed: int = SEED, start: str = START,
+                    drafts_per_day: float = DRAFTS_PER_DAY, players: int = PLAYERS,
+                    pokemon: int = POKEMON, pokemon_names: list[str] | None = None):
+    """
+    Yields `drafts` ParsedDrafts in date order. The same arguments always
+    produce the same drafts, and only one draft is in memory at a time, so
+    this scales to millions of picks.
+    """
+    rng = np.random.default_rng(seed)
+    league = build_league(rng, players, pokemon, pokemon_names)
+    started = datetime.fromisoformat(start)
+
+    patch_index = 0
+    prices = league.base_price.copy()
+    elapsed_days = 0.0
+
+    for n in range(drafts):
+        elapsed_days += rng.exponential(1.0 / drafts_per_day)
+        while elapsed_days >= (patch_index + 1) * PATCH_DAYS:
+            patch_index += 1
+            prices = prices * rng.lognormal(0.0, PATCH_DRIFT, len(prices))
+
+        date_time = started + timedelta(seconds=round(elapsed_days * 86400))
+        yield simulate_draft(rng, league, prices, external_id(seed, n), patch_name(patch_index), date_time)
+
+
+# --------------------
+# Writers
+# --------------------
+def write_csv(draft: ParsedDraft, folder: str) -> str:
+    """
+    Writes `draft` in the bot's CSV layout (what parse_group3_csv reads).
+    """
+    path = os.path.join(folder, f"draft_{draft.external_draft_id}.csv")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([f"Draft ID: {draft.external_draft_id}"])
+        writer.writerow([f"Patch: {draft.patch}"])
+        writer.writerow([f"Date: {draft.date_time:%m/%d/%Y}", f"{draft.date_time:%I:%M:%S %p}"])
+        writer.writerow([f"Total Pokemon Sold: {draft.total_pokemon_sold}"])
+        writer.writerow([])
+        writer.writerow(["Player", "Starting Money", "Remaining Money"])
+        writer.writerows(draft.players)
+        writer.writerow([])
+        writer.writerow(["Order", "Pokemon", "Drafted By", "Cost"])
+        writer.writerows(draft.picks)
+    return path
+
+
+def write_db(drafts, db_path: str, batch_drafts: int = BATCH_DRAFTS) -> IngestStats:
+    """
+    Inserts drafts straight into the v2 tables of `db_path` (connect()
+    migrates it first, so a new file works), through the same insert path
+    as ingest.
+    Drafts whose external id is already stored are skipped.
+    """
+    stats = IngestStats()
+    started = time.perf_counter()
+
+    conn = connect(db_path)
+    try:
+        with bulk_load_pragmas(conn):
+            batch = []
+            for draft in drafts:
+                stats.files += 1
+                batch.append(draft)
+                if len(batch) >= batch_drafts:
+                    with conn:
+                        insert_group3_batch(conn, batch, stats, verbose=False)
+                        bump_change_counter(conn)
+                    batch.clear()
+            if batch:
+                with conn:
+                    insert_group3_batch(conn, batch, stats, verbose=False)
+                    bump_change_counter(conn)
+    finally:
+        conn.close()
+
+    if REFRESH_SNAPSHOT and stats.drafts and parquet_available():
+        refresh_snapshot(db_path)
+
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a reproducible synthetic draft history.")
+    parser.add_argument("--drafts", type=int, default=DRAFTS, help="Drafts to generate (~65 picks each)")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--start", default=START, help="Date of the first draft (YYYY-MM-DD)")
+    parser.add_argument("--drafts-per-day", type=float, default=DRAFTS_PER_DAY)
+    parser.add_argument("--players", type=int, default=PLAYERS, help="Size of the player pool")
+    parser.add_argument("--pokemon", type=int, default=POKEMON, help="Size of the Pokémon pool")
+    parser.add_argument("--real-names", metavar="DB", default=None,
+                        help="Take Pokémon names from this database's pokemon table "
+                             "(so the dashboard shows sprites); the rest are 'Synthmon NNNN'")
+    parser.add_argument("--db", default=None, help="Insert the drafts into this SQLite database")
+    parser.add_argument("--csv", default=None, help="Write one bot-format CSV per draft to this folder")
+    args = parser.parse_args()
+
+    if not args.db and not args.csv:
+        parser.error("nothing to do (pass --db and/or --csv)")
+
+    names = None
+    if args.real_names:
+        conn = connect(args.real_names)
+        names = [row[0] for row in conn.execute("SELECT name FROM pokemon ORDER BY id")]
+        conn.close()
+
+    drafts = generate_drafts(args.drafts, args.seed, args.start, args.drafts_per_day,
+                             args.players, args.pokemon, names)
+
+    if args.csv:
+        os.makedirs(args.csv, exist_ok=True)
+
+        def written(drafts):
+            for draft in drafts:
+                write_csv(draft, args.csv)
+                yield draft
+
+        drafts = written(drafts)
+
+    if args.db:
+        stats = write_db(drafts, args.db)
+        print(stats.summary())
+    else:
+        count = sum(1 for _ in drafts)
+        print(f"Wrote {count} drafts to {args.csv}")
@@ -0,0 +1,242 @@
+import argparse
+import csv
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from data_access import DB_PATH, get_connection, read_query, read_scalar
+
+# ---------------- CONFIG ----------------
+PAGE_SIZE = 50
+# Rows fetched per round trip when exporting a whole table
+EXPORT_CHUNK_ROWS = 5000
+# Tables the Appendix exposes; each has an INTEGER PRIMARY KEY `id`
+BROWSABLE_TABLES = ("draft_event_v2", "draft_players_v2", "draft_pokemon_v2")
+KEY_COLUMN = "id"
+# ----------------------------------------
+
+
+@dataclass
+class PageRequest:
+    """
+    Which rows of `table` to show: sort order plus simple filters
+    (column -> value; text columns match as "contains", numbers exactly).
+    """
+    table: str
+    sort_column: str = KEY_COLUMN
+    descending: bool = False
+    filters: dict = field(default_factory=dict)
+    page_size: int = PAGE_SIZE
+
+
+def table_columns(table: str, db_path: str = DB_PATH) -> dict:
+    """
+    Column name -> declared SQLite type, for a table in BROWSABLE_TABLES.
+    """
+    if table not in BROWSABLE_TABLES:
+        raise ValueError(f"Unknown table: {table}")
+    info = read_query(f"PRAGMA table_info({table})", db_path=db_path)
+    return dict(zip(info["name"], info["type"].str.upper()))
+
+
+def _is_numeric(declared_type: str) -> bool:
+    return any(word in declared_type for word in ("INT", "REAL", "FLOA", "DOUB", "NUM"))
+
+
+# ---------- SQL BUILDING ----------
+def _where(columns: dict, filters: dict) -> tuple[list, list]:
+    clauses, params = [], []
+
+    for column, value in filters.items():
+        if column not in columns:
+            raise ValueError(f"Unknown column: {column}")
+        if value is None or str(value).strip() == "":
+            continue
+
+        value = str(value).strip()
+        if _is_numeric(columns[column]):
+            try:
+                number = float(value)
+            except ValueError:
+                raise ValueError(f"{column} filter must be a number") from None
+            clauses.append(f"{column} = ?")
+            params.append(int(number) if number.is_integer() else number)
+        else:
+            escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+
+    return clauses, params
+
+
+def _after(sort_column: str, descending: bool, cursor: tuple) -> tuple[str, list]:
+    """
+    Keyset condition for rows after `cursor` = (sort value, id) in
+    ORDER BY sort_column, id. SQLite sorts NULLs first ascending and last
+    descending, so NULL sort values need their own branches.
+    """
+    value, key = cursor
+    column = sort_column
+
+    if sort_column == KEY_COLUMN:
+        return (f"{KEY_COLUMN} < ?" if descending else f"{KEY_COLUMN} > ?"), [key]
+
+    if descending:
+        if value is None:
+            return f"({column} IS NULL AND {KEY_COLUMN} < ?)", [key]
+        return (f"({column} < ? OR ({column} = ? AND {KEY_COLUMN} < ?) OR {column} IS NULL)",
+                [value, value, key])
+
+    if value is None:
+        return f"(({column} IS NULL AND {KEY_COLUMN} > ?) OR {column} IS NOT NULL)", [key]
+    return f"({column} > ? OR ({column} = ? AND {KEY_COLUMN} > ?))", [value, value, key]
+
+
+def build_select(request: PageRequest, cursor: tuple | None = None,
+                 db_path: str = DB_PATH) -> tuple[str, list]:
+    """
+    SELECT for `request` starting after `cursor`, without a LIMIT.
+    Table and column names are checked against the schema before they
+    are interpolated; values are always bound.
+    """
+    columns = table_columns(request.table, db_path)
+    if request.sort_column not in columns:
+        raise ValueError(f"Unknown column: {request.sort_column}")
+
+    clauses, params = _where(columns, request.filters)
+    if cursor is not None:
+        clause, cursor_params = _after(request.sort_column, request.descending, cursor)
+        clauses.append(clause)
+        params += cursor_params
+
+    direction = "DESC" if request.descending else "ASC"
+    order = f"{KEY_COLUMN} {direction}"
+    if request.sort_column != KEY_COLUMN:
+        order = f"{request.sort_column} {direction}, {order}"
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return f"SELECT * FROM {request.table} {where} ORDER BY {order}", params
+
+
+# ---------- PAGES ----------
+def _sql_value(value):
+    if value is None or pd.isna(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+def fetch_page(request: PageRequest, cursor: tuple | None = None,
+               db_path: str = DB_PATH) -> tuple[pd.DataFrame, tuple | None]:
+    """
+    One page of rows after `cursor` (None = first page). Returns the page and
+    the cursor for the next one, or None when this is the last page.
+    """
+    sql, params = build_select(request, cursor, db_path)
+    df = read_query(f"{sql} LIMIT ?", params + [request.page_size + 1], db_path)
+
+    if len(df) <= request.page_size:
+        return df, None
+
+    df = df.head(request.page_size)
+    last = df.iloc[-1]
+    return df, (_sql_value(last[request.sort_column]), _sql_value(last[KEY_COLUMN]))
+
+
+def count_rows(request: PageRequest, db_path: str = DB_PATH) -> int:
+    columns = table_columns(request.table, db_path)
+    clauses, params = _where(columns, request.filters)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return int(read_scalar(f"SELECT COUNT(*) FROM {request.table} {where}", params, db_path))
+
+
+# ---------- STREAMING EXPORT ----------
+def iter_rows(request: PageRequest, chunk_rows: int = EXPORT_CHUNK_ROWS,
+              db_path: str = DB_PATH):
+    """
+    Yields (column names, list of row tuples) chunks of every row matching
+    `request`, straight off the cursor, so only one chunk is in memory.
+    """
+    sql, params = build_select(request, db_path=db_path)
+    cursor = get_connection(db_path).execute(sql, params)
+    names = [d[0] for d in cursor.description]
+
+    while rows := cursor.fetchmany(chunk_rows):
+        yield names, rows
+
+
+def write_csv(request: PageRequest, out, chunk_rows: int = EXPORT_CHUNK_ROWS,
+              db_path: str = DB_PATH) -> int:
+    """
+    Streams the rows matching `request` to the text file `out` as CSV.
+    Returns the number of rows written.
+    """
+    writer = csv.writer(out)
+    writer.writerow(list(table_columns(request.table, db_path)))
+
+    written = 0
+    for _, rows in iter_rows(request, chunk_rows, db_path):
+        writer.writerows(rows)
+        written += len(rows)
+    return written
+
+
+def _arrow_schema(columns: dict):
+    import pyarrow as pa
+
+    def arrow_type(declared_type: str):
+        if "INT" in declared_type:
+            return pa.int64()
+        if _is_numeric(declared_type):
+            return pa.float64()
+        return pa.string()
+
+    return pa.schema([(name, arrow_type(declared)) for name, declared in columns.items()])
+
+
+def write_parquet(request: PageRequest, out, chunk_rows: int = EXPORT_CHUNK_ROWS,
+                  db_path: str = DB_PATH) -> int:
+    """
+    Streams the rows matching `request` to `out` (path or binary file) as
+    Parquet, one row group per chunk. Needs pyarrow.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(table_columns(request.table, db_path))
+    written = 0
+
+    with pq.ParquetWriter(out, schema) as writer:
+        for _, rows in iter_rows(request, chunk_rows, db_path):
+            arrays = [pa.array(values, type=f.type) for values, f in zip(zip(*rows), schema)]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            written += len(rows)
+
+    return written
+
+
+EXPORTERS = {
+    "csv": write_csv,
+    "parquet": write_parquet,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a raw draft table in chunks.")
+    parser.add_argument("table", choices=BROWSABLE_TABLES)
+    parser.add_argument("output", help="Output file (.csv or .parquet)")
+    parser.add_argument("--format", choices=sorted(EXPORTERS), default=None,
+                        help="Output format (default: from the file extension)")
+    parser.add_argument("--chunk-rows", type=int, default=EXPORT_CHUNK_ROWS)
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database file")
+    args = parser.parse_args()
+
+    fmt = args.format or ("parquet" if args.output.lower().endswith(".parquet") else "csv")
+    request = PageRequest(args.table)
+
+    if fmt == "csv":
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            count = write_csv(request, f, args.chunk_rows, args.db)
+    else:
+        count = write_parquet(request, args.output, args.chunk_rows, args.db)
+
+    print(f"Wrote {count} rows to {args.output}")
@@ -0,0 +1,140 @@
+import io
+
+import streamlit as st
+
+from instrumentation import section, sent
+from snapshot import parquet_available
+from table_browser import (
+    PAGE_SIZE,
+    PageRequest,
+    count_rows,
+    fetch_page,
+    table_columns,
+    write_csv,
+    write_parquet,
+)
+
+
+def _export(request: PageRequest, fmt: str):
+    """
+    Download callback: writes the table in chunks into an in-memory buffer,
+    so no DataFrame of the whole table is built. The finished file is still
+    held in memory, since st.download_button only serves bytes; the
+    memory-bounded export is `python table_browser.py <table> <file>`.
+    """
+    def build() -> bytes:
+        with io.BytesIO() as out:
+            if fmt == "csv":
+                text = io.TextIOWrapper(out, encoding="utf-8", newline="")
+                write_csv(request, text)
+                text.detach()
+            else:
+                write_parquet(request, out)
+            return out.getvalue()
+
+    return build
+
+
+@st.fragment
+def table_browser(table: str):
+    """
+    Sortable, filterable view of one raw table. Only the visible page is
+    queried; paging reruns just this fragment.
+    """
+    columns = list(table_columns(table))
+
+    col_sort, col_order, col_filter, col_value = st.columns([2, 1, 2, 3])
+    sort_column = col_sort.selectbox("Sort by", columns, key=f"{table}_sort")
+    descending = col_order.toggle("Descending", key=f"{table}_desc")
+    filter_column = col_filter.selectbox("Filter column", columns, key=f"{table}_filter_col")
+    filter_value = col_value.text_input("Filter value (text contains / number equals)",
+                                        key=f"{table}_filter_value")
+
+    request = PageRequest(table, sort_column, descending, {filter_column: filter_value})
+
+    # Stack of cursors for the pages before the current one; any change to
+    # sort or filter starts again from page 1.
+    state = st.session_state.setdefault(f"{table}_pages", {"request": None, "cursors": [None]})
+    if state["request"] != request:
+        state["request"] = request
+        state["cursors"] = [None]
+
+    try:
+        total = count_rows(request)
+        df_page, next_cursor = fetch_page(request, state["cursors"][-1])
+    except ValueError as e:
+        st.warning(str(e))
+        return
+
+    st.dataframe(sent(df_page, f"{table} page"), use_container_width=True, hide_index=True)
+
+    page = len(state["cursors"])
+    first_row = (page - 1) * PAGE_SIZE + 1 if total else 0
+    last_row = (page - 1) * PAGE_SIZE + len(df_page)
+
+    col_prev, col_info, col_next = st.columns([1, 4, 1])
+    col_prev.button("Previous", key=f"{table}_prev", disabled=page == 1,
+                    on_click=state["cursors"].pop)
+    col_info.caption(f"Rows {first_row:,}–{last_row:,} of {total:,}")
+    col_next.button("Next", key=f"{table}_next", disabled=next_cursor is None,
+                    on_click=state["cursors"].append, args=(next_cursor,))
+
+    col_csv, col_parquet = st.columns(2)
+    col_csv.download_button(
+        "Download CSV", _export(request, "csv"), file_name=f"{table}.csv",
+        mime="text/csv", key=f"{table}_csv"
+    )
+    if parquet_available():
+        col_parquet.download_button(
+            "Download Parquet", _export(request, "parquet"), file_name=f"{table}.parquet",
+            mime="application/vnd.apache.parquet", key=f"{table}_parquet"
+        )
+    st.caption("Downloads are built in memory on the server. For very large exports, run "
+               f"`python table_browser.py {table} {table}.csv` against a local copy of the database.")
+
+
+def render():
+    """Appendix tab: the raw v2 tables."""
+    st.header("Appendix: Raw Database Tables")
+
+    st.markdown("""
+    This appendix contains **all raw tables used in this dashboard**.
+
+    These tables are **free to use** for your own analysis, visualizations, or external tools.
+    You can:
+    - Sort and filter columns
+    - Copy rows
+    - Export data for your own projects (CSV or Parquet, with the current filter applied)
+
+    If you build something cool, feel free to share it with the community!
+    """)
+
+    st.divider()
+
+    # --------------------
+    # draft_event_v2
+    # --------------------
+    section("draft_event_v2")
+    st.subheader("draft_event_v2")
+    st.caption("One row per draft event (draft metadata such as date, patch, totals).")
+    table_browser("draft_event_v2")
+
+    st.divider()
+
+    # --------------------
+    # draft_players_v2
+    # --------------------
+    section("draft_players_v2")
+    st.subheader("draft_players_v2")
+    st.caption("One row per player per draft.")
+    table_browser("draft_players_v2")
+
+    st.divider()
+
+    # --------------------
+    # draft_pokemon_v2
+    # --------------------
+    section("draft_pokemon_v2")
+    st.subheader("draft_pokemon_v2")
+    st.caption("One row per Pokémon pick (includes cost, draft order, and player).")
+    table_browser("draft_pokemon_v2")
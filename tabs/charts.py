@@ -0,0 +1,33 @@
+import altair as alt
+import pandas as pd
+
+from images import THUMBNAIL_SIZE
+
+
+def add_pokemon_images(
+    base_chart: alt.Chart,
+    df: pd.DataFrame,
+    *,
+    image_size: int = THUMBNAIL_SIZE,
+    y_offset: float = 0,
+):
+    """
+    Adds Pokémon images aligned to the x-axis categories of a bar chart.
+    """
+
+    image_chart = alt.Chart(df).mark_image(
+        width=image_size,
+        height=image_size
+    ).encode(
+        x=alt.X(
+            'pokemon:N',
+            sort=df['pokemon'].tolist()
+        ),
+        y=alt.value(y_offset),
+        url='image:N',
+        tooltip=[
+            alt.Tooltip('pokemon:N', title='Pokémon')
+        ]
+    )
+
+    return base_chart + image_chart
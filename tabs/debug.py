@@ -0,0 +1,47 @@
+import pandas as pd
+import streamlit as st
+
+import data_access
+import images
+from instrumentation import SLOW_QUERY_MS, TRACE_LOG, Trace
+
+
+def render(trace: Trace):
+    """Debug panel (?debug=1): where the last rerun of this page spent its time."""
+    summary = trace.summary()
+
+    with st.expander(f"Debug: {trace.page} rendered in {summary['total_ms']:,.0f} ms", expanded=True):
+        col_total, col_queries, col_cache, col_sent = st.columns(4)
+        col_total.metric("Rerun", f"{summary['total_ms']:,.0f} ms")
+        col_queries.metric("Queries", summary["queries"], f"{summary['query_ms']:,.0f} ms", delta_color="off")
+        col_cache.metric("Cache hits / misses", f"{summary['cache_hits']} / {summary['cache_misses']}")
+        col_sent.metric("Sent to browser", f"{summary['bytes_sent'] / 1024:,.0f} KB")
+
+        st.caption(
+            f"Sprites: {summary['images_hits']} cached, {summary['images_misses']} encoded "
+            f"({summary['images_encode_ms']:,.0f} ms). "
+            f"Query cache: {data_access.cache_stats()}. Image cache: {images.cache_stats()['entries']} entries."
+        )
+
+        events = pd.DataFrame([
+            {
+                "kind": e.kind,
+                "name": e.name,
+                "section": e.section,
+                "ms": round(e.ms, 2),
+                "rows": e.rows,
+                "cache": e.cache,
+                "backend": e.backend,
+                "KB": round(e.bytes / 1024, 1) if e.bytes is not None else None,
+            }
+            for e in trace.events
+        ])
+        if events.empty:
+            st.write("Nothing recorded.")
+        else:
+            st.dataframe(events.sort_values("ms", ascending=False), use_container_width=True, hide_index=True)
+
+        if trace.log:
+            st.caption(f"Trace appended to {TRACE_LOG} (query plans for misses ≥ {SLOW_QUERY_MS:.0f} ms).")
+        else:
+            st.caption("Use ?debug=trace to also log every rerun with query plans for slow statements.")
@@ -0,0 +1,326 @@
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+import queries
+from backends import read_query
+from instrumentation import section, sent
+
+
+# Cube metric -> (label, axis format)
+PATCH_METRICS = {
+    "avg_cost": ("Average cost", ",.0f"),
+    "median_cost": ("Median cost", ",.0f"),
+    "p90_cost": ("90th percentile cost", ",.0f"),
+    "pick_rate": ("Pick rate", ".0%"),
+    "avg_draft_order": ("Average draft position", ",.1f"),
+}
+
+# Price column -> its inflation-adjusted twin in the same query result
+NORMALIZED_COLUMNS = {
+    "avg_cost": "avg_normalized_cost",
+    "lowest_cost": "lowest_normalized_cost",
+    "highest_cost": "highest_normalized_cost",
+    "price_variance": "normalized_price_variance",
+}
+PRICE_MODES = ("Raw", "Inflation-adjusted")
+PRICE_MODE_HELP = ("Inflation-adjusted prices scale each draft's costs to a standard draft "
+                   "(2,500 coins in play per pick sold), so drafts with more players or more "
+                   "starting money don't look pricier.")
+
+
+def price_columns(df: pd.DataFrame, mode: str) -> pd.DataFrame:
+    """
+    `df` with its raw price columns, or (for "Inflation-adjusted") the
+    normalized ones under the raw names. Either way it's the same query
+    result, so switching costs no query.
+    """
+    present = {raw: adjusted for raw, adjusted in NORMALIZED_COLUMNS.items() if adjusted in df}
+    columns = [c for c in df.columns if c not in present.values()]
+    if mode == "Inflation-adjusted":
+        df = df.assign(**{raw: df[adjusted] for raw, adjusted in present.items()})
+    return df[columns]
+
+
+def render_patch_comparison():
+    """Patch-over-patch deltas from the precomputed patch_pokemon_stats cube."""
+    st.header("Patch vs Patch")
+    st.write(
+        "Compares every Pokémon drafted in both patches: who got more (or less) expensive, "
+        "more (or less) popular, or went earlier (or later) in the draft."
+    )
+
+    patches = read_query(queries.PATCHES_BY_DATE)["patch"].tolist()
+    if len(patches) < 2:
+        st.info("Needs drafts from at least two patches.")
+        return
+
+    col_base, col_compare, col_metric = st.columns(3)
+    base_patch = col_base.selectbox("Base patch", patches, index=len(patches) - 2, key="compare_base_patch")
+    compare_patch = col_compare.selectbox("Compared patch", patches, index=len(patches) - 1,
+                                          key="compare_patch")
+    metric = col_metric.selectbox("Metric", list(PATCH_METRICS), format_func=lambda m: PATCH_METRICS[m][0],
+                                  key="compare_metric")
+
+    col_min, col_top = st.columns(2)
+    min_drafted = col_min.number_input("Min times drafted in each patch", 1, 50, 3, key="compare_min_drafted")
+    top_n = col_top.number_input("Biggest risers / fallers to show", 1, 50, 10, key="compare_top_n")
+
+    df_compare = read_query(queries.PATCH_COMPARISON, params=(base_patch, compare_patch))
+    df_compare = df_compare[
+        (df_compare["base_times_drafted"] >= min_drafted) & (df_compare["times_drafted"] >= min_drafted)
+    ]
+    if df_compare.empty:
+        st.info("No Pokémon were drafted often enough in both patches.")
+        return
+
+    label, axis_format = PATCH_METRICS[metric]
+    delta = f"{metric}_delta"
+    df_sorted = df_compare.sort_values(delta, kind="stable")
+    df_moves = pd.concat([df_sorted.head(top_n), df_sorted.tail(top_n)]).drop_duplicates("pokemon")
+    df_moves = df_moves[df_moves[delta] != 0]
+
+    delta_chart = alt.Chart(df_moves).mark_bar().encode(
+        x=alt.X("pokemon:N", sort=df_moves["pokemon"].tolist(), title="Pokémon"),
+        y=alt.Y(f"{delta}:Q", title=f"{label} change", axis=alt.Axis(format=axis_format)),
+        color=alt.condition(alt.datum[delta] > 0, alt.value("#E45756"), alt.value("#4C78A8")),
+        tooltip=[
+            "pokemon",
+            alt.Tooltip(f"base_{metric}:Q", title=f"{label} ({base_patch})", format=axis_format),
+            alt.Tooltip(f"{metric}:Q", title=f"{label} ({compare_patch})", format=axis_format),
+            alt.Tooltip(f"{delta}:Q", title="Change", format="+" + axis_format),
+            alt.Tooltip("times_drafted:Q", title=f"Times drafted ({compare_patch})"),
+        ]
+    ).properties(
+        width=1000,
+        height=400,
+        title=f"{label}: {compare_patch} vs {base_patch}"
+    )
+    st.altair_chart(sent(delta_chart, "patch comparison chart"), use_container_width=True)
+
+    st.dataframe(
+        sent(df_sorted[["pokemon", "base_times_drafted", "times_drafted", f"base_{metric}", metric, delta]]
+             .sort_values(delta, ascending=False, kind="stable"), "patch comparison"),
+        use_container_width=True,
+        hide_index=True
+    )
+
+
+def render():
+    """All Draft Data tab: patch-based cost trends and per-draft cost curves."""
+    st.header("Patch-Based Draft Trends")
+    st.markdown("Analyze how draft behavior changes between patches.")
+
+    # --------------------
+    # Get patches once
+    # --------------------
+    patches = read_query(queries.PATCHES)["patch"].tolist()
+    patch_options = ["All Patches"] + patches
+
+    # --------------------
+    # Average Cost per Pokémon by Patch
+    # --------------------
+    section("Average cost by patch")
+    st.header("Average Cost per Pokémon by Patch")
+    st.write("Shows the average draft price of each Pokémon and how often it was drafted, filtered by patch.")
+
+    selected_patch_cost_chart = st.selectbox("Select Patch for Average Cost Chart", patch_options, key="avg_cost_patch")
+
+    # Query Pokémon cost data
+    if selected_patch_cost_chart == "All Patches":
+        df_avg_pokemon_patch = read_query(queries.AVG_COST_BY_POKEMON)
+    else:
+        df_avg_pokemon_patch = read_query(
+            queries.AVG_COST_BY_POKEMON_FOR_PATCH,
+            params=(selected_patch_cost_chart,)
+        )
+
+    price_mode_patch = st.radio("Prices", PRICE_MODES, horizontal=True, key="avg_cost_price_mode",
+                                help=PRICE_MODE_HELP)
+    df_avg_pokemon_patch = price_columns(df_avg_pokemon_patch, price_mode_patch)
+
+    # Top/Bottom selector
+    filter_type_patch = st.radio(
+        f"Show Top or Bottom Pokémon by Average Cost ({selected_patch_cost_chart})",
+        ("Top", "Bottom"),
+        key="top_bottom_patch"
+    )
+
+    x_patch = st.number_input(
+        f"How many Pokémon to show for {selected_patch_cost_chart}?",
+        min_value=1,
+        max_value=len(df_avg_pokemon_patch),
+        value=10,
+        key="num_patch_pokemon"
+    )
+
+    # Sort data based on Top/Bottom selection
+    df_avg_pokemon_patch_sorted = df_avg_pokemon_patch.sort_values(
+        by="avg_cost",
+        ascending=(filter_type_patch == "Bottom")
+    )
+    df_avg_pokemon_patch_filtered = df_avg_pokemon_patch_sorted.head(x_patch)
+
+    # Altair color scale
+    color_scale_patch = alt.Scale(
+        domain=[
+            df_avg_pokemon_patch_filtered["times_drafted"].min(),
+            df_avg_pokemon_patch_filtered["times_drafted"].max()
+        ],
+        range=["#9999FF", "#000099"]
+    )
+
+    # Create bar chart
+    avg_pokemon_patch_chart = alt.Chart(df_avg_pokemon_patch_filtered).mark_bar().encode(
+        x=alt.X("pokemon:N", sort=df_avg_pokemon_patch_filtered["pokemon"].tolist()),
+        y="avg_cost:Q",
+        color=alt.Color(
+            "times_drafted:Q",
+            scale=color_scale_patch,
+            legend=alt.Legend(title="Times Drafted")
+        ),
+        tooltip=["pokemon", "avg_cost", "times_drafted"]
+    ).properties(width=1000)
+
+    st.altair_chart(sent(avg_pokemon_patch_chart, "average cost chart"), use_container_width=True)
+
+    # --------------------
+    # Pokémon Price Summary Across Drafts
+    # --------------------
+    section("Price summary")
+    st.subheader("Pokémon Price Summary Across Drafts")
+
+    selected_patch_summary = st.selectbox("Select Patch for Price Summary", patch_options, key="price_summary_patch")
+
+    if selected_patch_summary == "All Patches":
+        df_pokemon_price_summary = read_query(queries.POKEMON_PRICE_SUMMARY)
+    else:
+        df_pokemon_price_summary = read_query(
+            queries.POKEMON_PRICE_SUMMARY_FOR_PATCH,
+            params=(selected_patch_summary,)
+        )
+
+    price_mode_summary = st.radio("Prices", PRICE_MODES, horizontal=True, key="price_summary_price_mode",
+                                  help=PRICE_MODE_HELP)
+    df_pokemon_price_summary = price_columns(df_pokemon_price_summary, price_mode_summary)
+    if price_mode_summary != PRICE_MODES[0]:
+        # The query orders by the raw average
+        df_pokemon_price_summary = df_pokemon_price_summary.sort_values("avg_cost", ascending=False,
+                                                                        ignore_index=True)
+
+    st.dataframe(sent(df_pokemon_price_summary, "price summary"), use_container_width=True)
+
+    # --------------------
+    # Patch vs Patch
+    # --------------------
+    section("Patch comparison")
+    render_patch_comparison()
+
+
+    #--------------------
+    #Draft Pick Order Visualization
+    #--------------------
+
+    section("Costs by draft order")
+    st.header("Pokémon Costs by Draft (Draft Order)")
+
+    # -----------------------------
+    # Load all draft IDs
+    # -----------------------------
+    draft_ids_df = read_query(queries.DRAFT_IDS)
+
+    draft_ids = draft_ids_df["draft_id"].tolist()
+
+    # Draft selector
+    selected_draft = st.selectbox(
+        "Select Draft",
+        draft_ids
+    )
+
+    # -----------------------------
+    # Load data for selected draft
+    # -----------------------------
+    df = read_query(queries.DRAFT_PICKS, params=(selected_draft,))
+
+    # Safety check
+    if df.empty:
+        st.warning("No data found for this draft.")
+        st.stop()
+
+    # -----------------------------
+    # Average cost
+    # -----------------------------
+    avg_cost = df["cost"].mean()
+
+    # -----------------------------
+    # Bar chart (colored by drafter)
+    # -----------------------------
+    bars = alt.Chart(df).mark_bar().encode(
+        x=alt.X(
+            "draft_order:O",
+            title="Draft Order"
+        ),
+        y=alt.Y(
+            "cost:Q",
+            title="Cost"
+        ),
+        color=alt.Color(
+            "drafted_by:N",
+            title="Drafted By",
+            legend=alt.Legend(orient="right")
+        ),
+        tooltip=[
+            alt.Tooltip("draft_order:Q", title="Pick"),
+            alt.Tooltip("pokemon:N", title="Pokémon"),
+            alt.Tooltip("drafted_by:N", title="Drafted By"),
+            alt.Tooltip("cost:Q", title="Cost")
+        ]
+    )
+
+    # -----------------------------
+    # Average cost line
+    # -----------------------------
+    avg_line = alt.Chart(
+        pd.DataFrame({"avg_cost": [avg_cost]})
+    ).mark_rule(
+        color="red",
+        strokeDash=[6, 4],
+        size=2
+    ).encode(
+        y="avg_cost:Q"
+    )
+
+    # -----------------------------
+    # Combine & render
+    # -----------------------------
+    chart = (bars + avg_line).properties(
+        width=1000,
+        height=450,
+        title=f"Draft {selected_draft} – Pokémon Cost by Draft Order (Avg: {round(avg_cost, 1)})"
+    )
+
+    st.altair_chart(sent(chart, "draft order chart"), use_container_width=True)
+
+
+    # --------------------
+    # Top 3 Most Expensive Pokémon per Draft
+    # --------------------
+    section("Top 3 per draft")
+    st.header("Top 3 Most Expensive Pokémon per Draft")
+    st.write("This chart shows the top 3 most expensive Pokémon for each of the most recent drafts.")
+
+    recent_drafts = st.number_input("How many recent drafts?", min_value=1, max_value=50, value=10,
+                                    key="top3_recent_drafts")
+    df_top3 = read_query(queries.TOP3_PICKS_RECENT_DRAFTS, params=(recent_drafts,))
+    # Tied picks share a rank; give each bar of a draft its own slot
+    df_top3["slot"] = df_top3.groupby("draft_id").cumcount()
+
+    top3_chart = alt.Chart(df_top3).mark_bar().encode(
+        x=alt.X("draft_id:O", sort=df_top3["draft_id"].unique().tolist(), title="Draft"),
+        xOffset="slot:O",
+        y=alt.Y("cost:Q", title="Cost"),
+        color=alt.Color("cost_rank:O", title="Rank in draft"),
+        tooltip=["draft_id", "pokemon", "drafted_by", "cost", "draft_order"]
+    ).properties(width=1000)
+
+    st.altair_chart(sent(top3_chart, "top 3 chart"), use_container_width=True)
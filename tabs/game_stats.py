@@ -0,0 +1,100 @@
+import streamlit as st
+
+import queries
+from data_access import read_query, read_scalar
+from instrumentation import section, sent
+from streaks import draft_streaks
+
+
+def render():
+    """Overall Game Stats tab: totals, drafts per day and draft streaks."""
+    # --------------------
+    # Overall Game Stats Tab
+    # --------------------
+    st.header("Overall Game Stats")
+    st.markdown(
+        """
+        High-level overview of the Pokémon Emerald Blitz game.
+        \n(Work in Progress)
+        """
+    )
+
+    # --------------------
+    # Total unique players
+    # --------------------
+    section("Totals")
+    total_players = read_scalar(queries.TOTAL_PLAYERS)
+
+    # --------------------
+    # Total Pokémon drafted
+    # --------------------
+    total_pokemon_drafted = read_scalar(queries.TOTAL_POKEMON_DRAFTED)
+
+    # --------------------
+    # Drafts per day
+    # --------------------
+    drafts_per_day = read_query(queries.DRAFTS_PER_DAY)
+
+    avg_drafts_per_day = drafts_per_day["drafts_count"].mean()
+
+    # --------------------
+    # Player with most drafts in a single day
+    # --------------------
+    most_drafts_day = read_query(queries.MOST_DRAFTS_IN_A_DAY)
+
+    # --------------------
+    # Display metrics
+    # --------------------
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total Unique Players", total_players)
+    col2.metric("Total Pokémon Drafted", total_pokemon_drafted)
+    col3.metric("Average Drafts Per Day", f"{avg_drafts_per_day:.2f}")
+
+    st.markdown("---")
+
+    st.subheader("Record Drafts in a Single Day")
+    st.write(
+        f"{most_drafts_day.iloc[0]['player_name']} drafted "
+        f"{most_drafts_day.iloc[0]['drafts_count']} times on {most_drafts_day.iloc[0]['draft_date']}"
+    )
+
+    # --------------------
+    # Longest Streak of Drafts (at least 1 draft/day)
+    # --------------------
+    section("Streaks")
+    # Query all draft dates per player
+    draft_dates = read_query(queries.PLAYER_DRAFT_DATES)
+
+    # Longest and current streak per player, with the dates of the best run
+    streaks = draft_streaks(draft_dates)
+
+    st.subheader("Longest Draft Streaks (1 draft/day)")
+    st.dataframe(
+        sent(streaks[["player_name", "longest_streak", "best_start", "best_end"]].head(10), "longest streaks"),
+        use_container_width=True
+    )
+
+    st.subheader("Current Draft Streaks")
+    active_streaks = (
+        streaks[streaks["current_streak"] > 0]
+        .sort_values("current_streak", ascending=False, kind="stable")
+    )
+    st.dataframe(
+        sent(active_streaks[["player_name", "current_streak", "longest_streak"]].head(10), "current streaks"),
+        use_container_width=True
+    )
+
+    # --------------------
+    # All time (every era, pre-website spreadsheets included)
+    # --------------------
+    section("All time")
+    st.markdown("---")
+    st.subheader("Picks by Era")
+    st.dataframe(sent(read_query(queries.PICKS_BY_ERA), "picks by era"), use_container_width=True, hide_index=True)
+
+    st.subheader("Most Drafted Pokémon (All Time)")
+    st.dataframe(
+        sent(read_query(queries.ALL_TIME_POKEMON).head(10), "all-time pokemon"),
+        use_container_width=True,
+        hide_index=True
+    )
@@ -0,0 +1,326 @@
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+import queries
+from backends import read_query
+from images import THUMBNAIL_SIZE, pokemon_image
+from instrumentation import section, sent
+from signatures import (
+    MIN_PLAYER_DRAFTS,
+    MIN_TIMES_AVAILABLE,
+    MIN_TIMES_DRAFTED,
+    SIGNATURE_RATE,
+    SUPER_SIGNATURE_RATE,
+    signature_matrix,
+    signature_owners,
+    signature_picks,
+)
+
+
+# budget_band (from BUDGET_PREMIUM) -> label
+BUDGET_BANDS = {0: "0-20%", 1: "20-40%", 2: "40-60%", 3: "60-80%", 4: "80-100%"}
+
+
+def render_signature_chart(df_signature, super_signature_rate: float):
+    """Player selector plus the signature bar chart with sprites."""
+    players = sorted(df_signature["drafted_by"].unique(), key=str.casefold)
+    if not players:
+        st.info("No signature picks at these thresholds.")
+        return
+
+    # --------------------
+    # Player selector
+    # --------------------
+    selected_player = st.selectbox("Select a Player", players)
+
+    df_player = df_signature[df_signature["drafted_by"] == selected_player].copy()
+
+
+    # Add a category for coloring
+    def pick_type(row):
+        if row["percent_drafted"] >= super_signature_rate:
+            return "Super Signature"
+        else:
+            return "Signature"
+
+    df_player["pick_type"] = df_player.apply(pick_type, axis=1)
+
+    # --------------------
+    # Signature Pokémon Chart with Images
+    # --------------------
+
+    # Define color scale
+    color_scale = alt.Scale(domain=["Signature", "Super Signature"], range=["#9999FF", "#FF3333"])
+
+    # Ensure each Pokémon has a valid image path
+    df_player["image"] = df_player["pokemon"].map(pokemon_image)
+
+
+    # --------------------
+    # Create the Altair bar chart
+    # --------------------
+    bar_chart = alt.Chart(df_player).mark_bar().encode(
+        x=alt.X(
+            'pokemon:N',
+            sort=df_player['pokemon'].tolist(),
+            title="Pokémon",
+            axis=alt.Axis(
+                labelFontWeight="bold",
+                labelFontSize=16,
+                labelAngle=-60,
+                titleFontWeight="bold",
+                titleFontSize=18
+            )
+        ),
+        y=alt.Y(
+            'percent_drafted:Q',
+            title="Draft Rate",
+            axis=alt.Axis(
+                format=".0%",
+                titleFontWeight="bold",
+                titleFontSize=18
+            )
+        ),
+        color=alt.Color(
+            'pick_type:N',
+            scale=alt.Scale(domain=["Signature", "Super Signature"],
+                            range=["#9999FF", "#FF3333"]),
+            legend=alt.Legend(title="Pick Type")
+        ),
+        tooltip=[
+            'pokemon',
+            'times_drafted',
+            'times_available',
+            alt.Tooltip('percent_drafted:Q', format=".2%"),
+            'pick_type'
+        ]
+    )
+
+    image_chart = alt.Chart(df_player).mark_image(
+        width=THUMBNAIL_SIZE,
+        height=THUMBNAIL_SIZE
+    ).encode(
+        x=alt.X('pokemon:N', sort=df_player['pokemon'].tolist()),
+        y=alt.value(0),
+        url='image:N',
+        tooltip=[
+            alt.Tooltip('pokemon:N', title='Pokémon')
+        ]
+    )
+
+    signature_chart = (
+            bar_chart + image_chart
+    ).properties(
+        height=450,
+        title=f"Signature Pokémon for {selected_player}"
+    )
+
+    st.altair_chart(sent(signature_chart, "signature chart"), use_container_width=True)
+
+
+def render():
+    """Player Data tab: signature picks and player-vs-global pricing."""
+    st.header("Player Data by Patch")
+
+    st.markdown("""
+    Explore player behavior and performance across patches.
+    """)
+
+
+
+    st.subheader("Player Draft Trends")
+
+    # --------------------
+    # Streamlit UI
+    # --------------------
+    section("Signature picks")
+    st.header("Player Signature Pokémon (All Patches)")
+    # --------------------
+    # Thresholds (applied to the cached matrix, no re-query)
+    # --------------------
+    col_available, col_rate, col_super = st.columns(3)
+    min_available = col_available.slider(
+        "Min times available", 1, 20, MIN_TIMES_AVAILABLE, key="signature_min_available"
+    )
+    signature_rate = col_rate.slider(
+        "Signature draft rate", 0.0, 1.0, SIGNATURE_RATE, 0.05, format="%.2f", key="signature_rate"
+    )
+    super_signature_rate = col_super.slider(
+        "Super signature draft rate", 0.0, 1.0, SUPER_SIGNATURE_RATE, 0.05, format="%.2f",
+        key="super_signature_rate"
+    )
+
+    st.write(
+        "Shows Pokémon that players consistently pick when available. "
+        f"Only includes Pokémon that were available to the player {min_available}+ times. "
+        "Bars show the percent of drafts in which the player picked the Pokémon. "
+        f"Super signature picks (≥{super_signature_rate:.0%}) are highlighted in red."
+    )
+
+
+    # --------------------
+    # Load data
+    # --------------------
+    df_matrix = signature_matrix()
+    df_signature = signature_picks(df_matrix, min_available, signature_rate)
+
+    render_signature_chart(df_signature, super_signature_rate)
+
+    section("Signature owners")
+    st.header("Signature Pokémon Owners")
+
+    col_drafts, col_drafted = st.columns(2)
+    min_player_drafts = col_drafts.slider(
+        "Min drafts played", 1, 20, MIN_PLAYER_DRAFTS, key="owners_min_player_drafts"
+    )
+    min_drafted = col_drafted.slider(
+        "Min times drafted", 1, 20, MIN_TIMES_DRAFTED, key="owners_min_drafted"
+    )
+
+    df_signature_owners = signature_owners(df_matrix, min_player_drafts, min_available, min_drafted)
+
+    # ---- Formatting for display ----
+    df_signature_owners["percent_drafted"] = (
+            df_signature_owners["percent_drafted"] * 100
+    ).round(2)
+
+    df_signature_owners["rating"] = df_signature_owners["rating"].round(3)
+
+    st.markdown(
+        "This table shows **which player is most likely to draft each Pokémon**, "
+        "based on both how often they pick it *when available* and how many total "
+        "times they’ve drafted it."
+    )
+
+    st.dataframe(
+        sent(df_signature_owners.rename(columns={
+            "pokemon": "Pokémon",
+            "most_likely_player": "Most Likely Player",
+            "times_drafted": "Times Drafted",
+            "times_available": "Times Available",
+            "percent_drafted": "Draft Rate (%)",
+            "rating": "Signature Rating"
+        }), "signature owners"),
+        use_container_width=True
+    )
+
+    section("Player vs global")
+    st.header("Player Draft Value vs Global Average (All Patches)")
+    st.write("This graph shows the top 10 largest differences between what a player pays and what the average"
+             "price of each Pokemon is across all drafts. The player must have drafted the Pokemon at least 2 times.")
+
+    df_player_compare = read_query(queries.PLAYER_VS_GLOBAL)
+
+    players = sorted(df_player_compare["drafted_by"].unique(), key=str.casefold)
+    selected_player = st.selectbox("Select a Player", players)
+
+    df_player = df_player_compare[
+        df_player_compare["drafted_by"] == selected_player
+        ].copy()
+
+    # --- NEW: keep only top 10 most impactful Pokémon ---
+    df_player["abs_delta"] = df_player["delta"].abs()
+
+    df_player = (
+        df_player
+        .sort_values("abs_delta", ascending=False)
+        .head(10)
+    )
+
+    # Re-sort for diverging bar chart display
+    df_player = df_player.sort_values("delta")
+
+    # Ensure each Pokémon has a valid image path
+    df_player["image"] = df_player["pokemon"].map(pokemon_image)
+
+
+
+    bar_chart = alt.Chart(df_player).mark_bar().encode(
+        x=alt.X("pokemon:N", sort=df_player["pokemon"].tolist(),
+                title="Pokémon",
+                axis=alt.Axis(
+                    labelFontWeight="bold",
+                    labelFontSize=16,
+                    labelAngle=-60,
+                    titleFontWeight = "bold",
+                    titleFontSize = 18
+                )
+                ),
+        y=alt.Y("delta:Q", title="Cost vs Global Average",
+                axis=alt.Axis(
+                    titleFontWeight="bold",
+                    titleFontSize=18
+                )),
+        color=alt.condition(
+            alt.datum.delta > 0,
+            alt.value("#E45756"),
+            alt.value("#4C78A8")
+        ),
+        tooltip=[
+            "pokemon",
+            alt.Tooltip("player_avg_cost:Q", title="Player Avg Cost", format=",.0f"),
+            alt.Tooltip("global_avg_cost:Q", title="Global Avg Cost", format=",.0f"),
+            alt.Tooltip("delta:Q", title="Difference", format="+,.0f"),
+            alt.Tooltip("times_drafted:Q", title="Times Drafted")
+        ]
+    ).properties(
+        width=1000,
+        height=400,
+        title=f"{selected_player}: Draft Behavior vs Global Average"
+    )
+
+    image_chart = alt.Chart(df_player).mark_image(
+        width=THUMBNAIL_SIZE,
+        height=THUMBNAIL_SIZE
+    ).encode(
+        x=alt.X('pokemon:N', sort=df_player['pokemon'].tolist()),
+        y=alt.value(0),
+        url='image:N',
+        tooltip=[
+            alt.Tooltip('pokemon:N', title='Pokémon')
+        ]
+    )
+
+    draft_behavior_chart = (
+            bar_chart + image_chart
+    ).properties(
+        height=450,
+        title=f"Signature Pokémon for {selected_player}"
+    )
+
+    zero_line = alt.Chart(
+        pd.DataFrame({"y": [0]})
+    ).mark_rule(color="black").encode(y="y:Q")
+
+    st.altair_chart(sent(draft_behavior_chart + zero_line, "player vs global chart"), use_container_width=True)
+
+    # --------------------
+    # Overpaying when rich vs broke
+    # --------------------
+    section("Budget premium")
+    st.header("Overpaying When Rich vs Broke")
+    st.write("Picks grouped by how much of the buyer's budget was already spent, with the average price paid "
+             "compared to each Pokémon's global average. Bars above zero mean paying over the odds.")
+
+    df_budget = pd.concat([
+        read_query(queries.BUDGET_PREMIUM).assign(who="All players"),
+        read_query(queries.BUDGET_PREMIUM_FOR_PLAYER, params=(selected_player,)).assign(who=selected_player),
+    ], ignore_index=True)
+    df_budget["budget_spent"] = df_budget["budget_band"].map(BUDGET_BANDS)
+
+    budget_chart = alt.Chart(df_budget).mark_bar().encode(
+        x=alt.X("budget_spent:N", sort=list(BUDGET_BANDS.values()), title="Budget already spent"),
+        xOffset=alt.XOffset("who:N", sort=["All players", selected_player]),
+        y=alt.Y("avg_premium:Q", title="Paid vs global average", axis=alt.Axis(format="+%")),
+        color=alt.Color("who:N", sort=["All players", selected_player], title=None),
+        tooltip=[
+            alt.Tooltip("who:N", title="Player"),
+            alt.Tooltip("budget_spent:N", title="Budget spent"),
+            alt.Tooltip("avg_premium:Q", title="Paid vs average", format="+.1%"),
+            alt.Tooltip("avg_money_before:Q", title="Avg money left", format=",.0f"),
+            alt.Tooltip("picks:Q", title="Picks")
+        ]
+    ).properties(width=1000, height=400)
+
+    st.altair_chart(sent(budget_chart + zero_line, "budget premium chart"), use_container_width=True)
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import streamlit as st
+
+from images import file_data_uri
+
+logo_path = Path("assets/blitzlogo.png")
+
+
+def render():
+    """Welcome tab: hero banner and links. Runs no queries."""
+    bg_image = file_data_uri(logo_path)
+
+    st.markdown(
+        f"""
+        <style>
+        .hero {{
+            width: 100%;
+            height: 60vh;
+            background-image: url("{bg_image}");
+            background-size: contain;
+            background-repeat: no-repeat;
+            background-position: center;
+            position: relative;
+            display: flex;
+            align-items: flex-start;
+            justify-content: center;
+            padding-top: 40px;
+        }}
+
+        .hero-text {{
+            font-size: 2.2rem;
+            font-weight: 700;
+            color: white;
+            text-align: center;
+            text-shadow:
+                0 2px 4px rgba(0,0,0,0.8),
+                0 4px 12px rgba(0,0,0,0.6);
+        }}
+        </style>
+
+        <div class="hero">
+            <div class="hero-text">
+                Welcome to the <strong>Pokémon Emerald Blitz Draft Dashboard</strong>!
+            </div>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+
+    # st.title("Pokémon Emerald Blitz Dashboard")
+
+
+    st.markdown("""
+
+    This dashboard provides insights into:
+    - Draft trends across all time
+    - How patches affect the meta
+    - Player behavior and preferences
+    - Full access to the underlying data
+    """)
+
+
+    st.subheader("Links")
+    st.markdown("""
+    - 💬 [Discord](https://discord.com/invite/CsUSZ5UhzW)
+    - Full Draft Website (https://auction.emeraldblitz.workers.dev)
+    - 📊 GitHub Repository (https://github.com/Mfrazz/pokemon-emerald-blitz-dashboard)
+    """)
+
+    st.info("Use the tabs above to explore the data.")
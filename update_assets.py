@@ -2,6 +2,8 @@ import shutil
 import subprocess
 from pathlib import Path
 
+from build_atlas import build_all
+
 # --------------------
 # Config
 # --------------------
@@ -27,5 +29,11 @@ if TARGET_PATH.exists():
 print(f"Copying new assets from {SUBMODULE_PATH} to {TARGET_PATH}")
 shutil.copytree(SUBMODULE_PATH, TARGET_PATH)
 
+# --------------------
+# Step 3: Rebuild sprite atlases
+# --------------------
+print("Building sprite atlases...")
+build_all(TARGET_PATH)
+
 print("Assets updated successfully!")
-print("You can now git add and commit the updated assets folder.")
\ No newline at end of file
+print("You can now git add and commit the updated sprites (assets/atlas is a build output and stays untracked).")
\ No newline at end of file